@@ -4,9 +4,18 @@ from typing import TYPE_CHECKING, Any
 
 from django.conf import settings as django_settings
 from django.contrib import admin
+from django.http import StreamingHttpResponse
+from django.utils import timezone
 from django.utils.html import format_html
 
-from .models import SMSLog, SMSLogStatus, SMSVerificationCode
+from .models import (
+    SMSCampaign,
+    SMSLog,
+    SMSLogStatus,
+    SMSScheduledMessage,
+    SMSScheduledStatus,
+    SMSVerificationCode,
+)
 from .services import SMSService
 from .utils import format_phone, mask_phone
 
@@ -17,7 +26,8 @@ if TYPE_CHECKING:
 
 # Admin 등록 설정 (django-notify 사용 시 admin 비활성화 가능)
 # SOLAPI_ADMIN_ENABLED=False로 설정하면 모든 admin 비활성화
-# 개별 제어: SOLAPI_SMSLOG_ADMIN_ENABLED, SOLAPI_VERIFICATION_ADMIN_ENABLED
+# 개별 제어: SOLAPI_SMSLOG_ADMIN_ENABLED, SOLAPI_VERIFICATION_ADMIN_ENABLED,
+#           SOLAPI_SCHEDULED_ADMIN_ENABLED, SOLAPI_CAMPAIGN_ADMIN_ENABLED
 _ADMIN_ENABLED: bool = getattr(django_settings, "SOLAPI_ADMIN_ENABLED", True)
 _REGISTER_SMSLOG_ADMIN: bool = _ADMIN_ENABLED and getattr(
     django_settings, "SOLAPI_SMSLOG_ADMIN_ENABLED", True
@@ -25,6 +35,12 @@ _REGISTER_SMSLOG_ADMIN: bool = _ADMIN_ENABLED and getattr(
 _REGISTER_VERIFICATION_ADMIN: bool = _ADMIN_ENABLED and getattr(
     django_settings, "SOLAPI_VERIFICATION_ADMIN_ENABLED", True
 )
+_REGISTER_SCHEDULED_ADMIN: bool = _ADMIN_ENABLED and getattr(
+    django_settings, "SOLAPI_SCHEDULED_ADMIN_ENABLED", True
+)
+_REGISTER_CAMPAIGN_ADMIN: bool = _ADMIN_ENABLED and getattr(
+    django_settings, "SOLAPI_CAMPAIGN_ADMIN_ENABLED", True
+)
 
 
 class SMSLogAdminMixin:
@@ -34,11 +50,16 @@ class SMSLogAdminMixin:
     def masked_phone(self, obj: SMSLog) -> str:
         return mask_phone(obj.phone)
 
+    @admin.display(description="메시지 내용")
+    def sms_message_text(self, obj: SMSLog) -> str:
+        return obj.rendered_message
+
     @admin.display(description="상태")
     def sms_status_badge(self, obj: SMSLog) -> SafeString:
         color_map: dict[str, str] = {
             SMSLogStatus.SUCCESS: "#0f766e",
             SMSLogStatus.FAILED: "#b91c1c",
+            SMSLogStatus.TIMEOUT: "#b45309",
             SMSLogStatus.SKIPPED: "#6b7280",
         }
         color = color_map.get(obj.status, "#6b7280")
@@ -64,19 +85,49 @@ class SMSVerificationCodeAdminMixin:
 
 
 class SMSLogAdmin(admin.ModelAdmin):
-    list_display = ["masked_phone", "message_type", "status_badge", "created_at"]
-    list_filter = ["message_type", "status", "created_at"]
-    search_fields = ["phone", "message"]
-    readonly_fields = [
+    list_display = [
+        "masked_phone",
+        "message_type",
+        "status_badge",
+        "delivery_status",
+        "created_at",
+    ]
+    list_filter = ["message_type", "status", "delivery_status", "created_at"]
+    # Rows logged by template reference are found by template and parameters, not text.
+    search_fields = [
         "phone",
         "message",
+        "message_id",
+        "template_key",
+        "template_version",
+        "template_params",
+    ]
+    readonly_fields = [
+        "phone",
+        "message_text",
+        "template_key",
+        "template_version",
+        "template_params",
         "message_type",
         "status",
         "response_data",
         "error_message",
+        "message_id",
+        "delivery_status",
+        "delivery_status_code",
+        "delivered_at",
+        "retry_count",
+        "next_retry_at",
+        "campaign",
         "created_at",
     ]
-    actions = ["resend_selected_sms"]
+    actions = [
+        "resend_selected_sms",
+        "export_selected_csv",
+        "export_selected_csv_gzip",
+        "export_selected_jsonl",
+        "export_selected_jsonl_gzip",
+    ]
     date_hierarchy = "created_at"
 
     @admin.display(description="수신번호")
@@ -88,6 +139,7 @@ class SMSLogAdmin(admin.ModelAdmin):
         color_map: dict[str, str] = {
             SMSLogStatus.SUCCESS: "#0f766e",
             SMSLogStatus.FAILED: "#b91c1c",
+            SMSLogStatus.TIMEOUT: "#b45309",
             SMSLogStatus.SKIPPED: "#6b7280",
         }
         color = color_map.get(obj.status, "#6b7280")
@@ -97,18 +149,62 @@ class SMSLogAdmin(admin.ModelAdmin):
             obj.get_status_display(),
         )
 
+    @admin.display(description="메시지 내용")
+    def message_text(self, obj: SMSLog) -> str:
+        # Rows logged by template reference have no stored text.
+        return obj.rendered_message
+
     @admin.action(description="선택 SMS 재발송")
     def resend_selected_sms(self, request: HttpRequest, queryset: QuerySet[SMSLog]) -> None:
         service = SMSService()
         success = 0
         failed = 0
         for log in queryset:
-            if service.send_sms(log.phone, log.message, log.message_type):
+            if service.send_sms(log.phone, log.rendered_message, log.message_type):
                 success += 1
             else:
                 failed += 1
         self.message_user(request, f"재발송 성공: {success}건, 실패: {failed}건")
 
+    def _export_response(
+        self, queryset: QuerySet[SMSLog], fmt: str, *, compress: bool = False
+    ) -> StreamingHttpResponse:
+        from . import settings
+        from .export import export_logs
+
+        content_type = "application/x-ndjson" if fmt == "jsonl" else "text/csv; charset=utf-8"
+        filename = f"sms_logs_{timezone.localdate():%Y%m%d}.{fmt}{'.gz' if compress else ''}"
+        response = StreamingHttpResponse(
+            export_logs(fmt, queryset, mask=settings.SOLAPI_EXPORT_MASK_PHONE, compress=compress),
+            content_type="application/gzip" if compress else content_type,
+        )
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
+
+    @admin.action(description="선택 SMS 내보내기 (CSV)")
+    def export_selected_csv(
+        self, request: HttpRequest, queryset: QuerySet[SMSLog]
+    ) -> StreamingHttpResponse:
+        return self._export_response(queryset, "csv")
+
+    @admin.action(description="선택 SMS 내보내기 (CSV, gzip)")
+    def export_selected_csv_gzip(
+        self, request: HttpRequest, queryset: QuerySet[SMSLog]
+    ) -> StreamingHttpResponse:
+        return self._export_response(queryset, "csv", compress=True)
+
+    @admin.action(description="선택 SMS 내보내기 (JSONL)")
+    def export_selected_jsonl(
+        self, request: HttpRequest, queryset: QuerySet[SMSLog]
+    ) -> StreamingHttpResponse:
+        return self._export_response(queryset, "jsonl")
+
+    @admin.action(description="선택 SMS 내보내기 (JSONL, gzip)")
+    def export_selected_jsonl_gzip(
+        self, request: HttpRequest, queryset: QuerySet[SMSLog]
+    ) -> StreamingHttpResponse:
+        return self._export_response(queryset, "jsonl", compress=True)
+
 
 if _REGISTER_SMSLOG_ADMIN:
     admin.site.register(SMSLog, SMSLogAdmin)
@@ -121,6 +217,7 @@ class SMSVerificationCodeAdmin(admin.ModelAdmin):
         "created_at",
         "expires_at",
         "verified_at",
+        "superseded_at",
         "attempts",
         "is_expired",
         "is_valid",
@@ -130,9 +227,9 @@ class SMSVerificationCodeAdmin(admin.ModelAdmin):
     def formatted_phone(self, obj: SMSVerificationCode) -> str:
         return format_phone(obj.phone) if obj.phone else "-"
 
-    list_filter = ["verified_at", "created_at"]
+    list_filter = ["verified_at", "superseded_at", "created_at"]
     search_fields = ["phone", "code"]
-    readonly_fields = ["created_at", "verified_at"]
+    readonly_fields = ["created_at", "verified_at", "superseded_at"]
     date_hierarchy = "created_at"
 
     @admin.display(description="만료됨", boolean=True)
@@ -148,3 +245,107 @@ class SMSVerificationCodeAdmin(admin.ModelAdmin):
 
 if _REGISTER_VERIFICATION_ADMIN:
     admin.site.register(SMSVerificationCode, SMSVerificationCodeAdmin)
+
+
+class SMSScheduledMessageAdmin(admin.ModelAdmin):
+    list_display = ["masked_phone", "message_type", "send_at", "status", "processed_at"]
+    list_filter = ["status", "message_type", "send_at"]
+    search_fields = ["phone", "message"]
+    readonly_fields = ["status", "claimed_at", "processed_at", "created_at"]
+    actions = ["cancel_selected"]
+    date_hierarchy = "send_at"
+
+    @admin.display(description="수신번호")
+    def masked_phone(self, obj: SMSScheduledMessage) -> str:
+        return mask_phone(obj.phone)
+
+    @admin.action(description="선택 예약발송 취소")
+    def cancel_selected(
+        self, request: HttpRequest, queryset: QuerySet[SMSScheduledMessage]
+    ) -> None:
+        canceled = queryset.filter(status=SMSScheduledStatus.PENDING).update(
+            status=SMSScheduledStatus.CANCELED, processed_at=timezone.now()
+        )
+        self.message_user(request, f"예약 취소: {canceled}건")
+
+
+if _REGISTER_SCHEDULED_ADMIN:
+    admin.site.register(SMSScheduledMessage, SMSScheduledMessageAdmin)
+
+
+class SMSCampaignAdmin(admin.ModelAdmin):
+    list_display = ["name", "status", "progress_bar", "throughput", "created_at", "finished_at"]
+    list_filter = ["status", "created_at"]
+    search_fields = ["name"]
+    readonly_fields = [
+        "name",
+        "status",
+        "total",
+        "progress_bar",
+        "counts",
+        "throughput",
+        "created_at",
+        "finished_at",
+    ]
+    actions = ["pause_selected", "resume_selected", "cancel_selected"]
+    date_hierarchy = "created_at"
+
+    def get_queryset(self, request: HttpRequest) -> QuerySet[SMSCampaign]:
+        from .campaigns import with_progress
+
+        return with_progress(super().get_queryset(request))
+
+    def has_add_permission(self, request: HttpRequest) -> bool:
+        # Campaigns are created by campaigns.start_campaign().
+        return False
+
+    @admin.display(description="진행률")
+    def progress_bar(self, obj: SMSCampaign) -> SafeString:
+        from .campaigns import progress
+
+        stats = progress(obj)
+        return format_html(
+            '<progress max="100" value="{}"></progress> {} / {} ({}%)',
+            min(int(stats["percent"]), 100),
+            stats["processed"],
+            stats["total"],
+            f"{stats['percent']:.1f}",
+        )
+
+    @admin.display(description="성공 / 실패 / 스킵")
+    def counts(self, obj: SMSCampaign) -> str:
+        from .campaigns import progress
+
+        stats = progress(obj)
+        return f"{stats['sent']} / {stats['failed']} / {stats['skipped']}"
+
+    @admin.display(description="처리량")
+    def throughput(self, obj: SMSCampaign) -> str:
+        from .campaigns import progress
+
+        return f"{progress(obj)['rate']:.1f}건/초"
+
+    @admin.action(description="선택 캠페인 일시정지")
+    def pause_selected(self, request: HttpRequest, queryset: QuerySet[SMSCampaign]) -> None:
+        from .campaigns import pause
+
+        paused = sum(pause(campaign.pk) for campaign in queryset)
+        self.message_user(request, f"일시정지: {paused}건")
+
+    @admin.action(description="선택 캠페인 재개")
+    def resume_selected(self, request: HttpRequest, queryset: QuerySet[SMSCampaign]) -> None:
+        from .campaigns import resume
+
+        resumed = sum(resume(campaign.pk) for campaign in queryset)
+        self.message_user(request, f"재개: {resumed}건")
+
+    @admin.action(description="선택 캠페인 취소")
+    def cancel_selected(self, request: HttpRequest, queryset: QuerySet[SMSCampaign]) -> None:
+        from .campaigns import cancel
+
+        canceled = sum(cancel(campaign.pk) for campaign in queryset)
+        self.message_user(request, f"캠페인 취소: {canceled}건")
+
+
+if _REGISTER_CAMPAIGN_ADMIN:
+    admin.site.register(SMSCampaign, SMSCampaignAdmin)
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Any
+import math
+import time
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any, NamedTuple
 
+from asgiref.sync import sync_to_async
 from django.core.cache import cache as default_cache
+from django.core.cache.backends.redis import RedisCache
 
 from .services import SMSService, get_sms_verification_model
 
@@ -31,12 +36,35 @@ def get_latest_verification(phone: str) -> Model | None:
     """Get the latest unverified verification for a phone number."""
     model = get_sms_verification_model()
     return (  # type: ignore[no-any-return]
-        model.objects.filter(phone=phone, verified_at__isnull=True)  # type: ignore[attr-defined]
+        model.active(phone)  # type: ignore[attr-defined]
         .order_by("-created_at")
         .first()
     )
 
 
+async def aget_latest_verification(phone: str) -> Model | None:
+    """Async variant of ``get_latest_verification``."""
+    model = get_sms_verification_model()
+    return await (  # type: ignore[no-any-return]
+        model.active(phone)  # type: ignore[attr-defined]
+        .order_by("-created_at")
+        .afirst()
+    )
+
+
+def _rate_limit_params(limit: int | None, window_seconds: int | None) -> tuple[int, int]:
+    return (
+        limit if limit is not None else SOLAPI_VERIFICATION_RATE_LIMIT_COUNT,
+        window_seconds
+        if window_seconds is not None
+        else SOLAPI_VERIFICATION_RATE_LIMIT_WINDOW_SECONDS,
+    )
+
+
+def _rate_limit_result(allowed: bool, attempts: int, limit: int, window: int) -> dict[str, Any]:
+    return {"allowed": allowed, "attempts": attempts, "limit": limit, "window_seconds": window}
+
+
 def check_rate_limit(
     phone: str,
     *,
@@ -48,6 +76,10 @@ def check_rate_limit(
     """
     Check rate limit for SMS sending.
 
+    Uses the same per-phone counter as ``send_verification_code`` with
+    ``rate_limit_rules`` (see ``check_rate_limits``): a fixed window aligned
+    to the epoch, so up to twice the limit can pass around a window boundary.
+
     Args:
         phone: Phone number to check
         cache: Cache backend to use (defaults to Django's default cache)
@@ -58,32 +90,268 @@ def check_rate_limit(
     Returns:
         dict with allowed status and attempt info
     """
-    used_cache = cache or default_cache
-    effective_limit = limit if limit is not None else SOLAPI_VERIFICATION_RATE_LIMIT_COUNT
-    effective_window = (
-        window_seconds
-        if window_seconds is not None
-        else SOLAPI_VERIFICATION_RATE_LIMIT_WINDOW_SECONDS
+    effective_limit, effective_window = _rate_limit_params(limit, window_seconds)
+    if not effective_limit or not effective_window:
+        return _rate_limit_result(True, 0, 0, 0)
+    rate = check_rate_limits(
+        [_phone_rule(phone, key_prefix, effective_limit, effective_window)], cache=cache
     )
+    return _rate_limit_result(rate["allowed"], rate["attempts"], effective_limit, effective_window)
+
+
+async def acheck_rate_limit(
+    phone: str,
+    *,
+    cache: BaseCache | None = None,
+    key_prefix: str = "solapi_sms_attempt",
+    limit: int | None = None,
+    window_seconds: int | None = None,
+) -> dict[str, Any]:
+    """Async variant of ``check_rate_limit`` using the async cache API."""
+    effective_limit, effective_window = _rate_limit_params(limit, window_seconds)
     if not effective_limit or not effective_window:
-        return {"allowed": True, "attempts": 0, "limit": 0, "window_seconds": 0}
+        return _rate_limit_result(True, 0, 0, 0)
+    rate = await acheck_rate_limits(
+        [_phone_rule(phone, key_prefix, effective_limit, effective_window)], cache=cache
+    )
+    return _rate_limit_result(rate["allowed"], rate["attempts"], effective_limit, effective_window)
+
+
+class RateLimitRule(NamedTuple):
+    """
+    One throttling dimension for ``check_rate_limits``.
+
+    Example:
+        RateLimitRule(f"otp_ip_{ip}", limit=20, window_seconds=3600, name="ip")
+    """
+
+    key: str
+    limit: int
+    window_seconds: int
+    name: str = ""
+
+
+# Checks every rule, then increments all of them, atomically on the server.
+# KEYS: window keys; ARGV: limit and ttl per key. Returns {tripped index (0 = none), counts...}.
+_RATE_LIMIT_SCRIPT = """
+for i, key in ipairs(KEYS) do
+    local used = tonumber(redis.call('GET', key) or '0')
+    if used >= tonumber(ARGV[2 * i - 1]) then
+        return {i, used}
+    end
+end
+local result = {0}
+for i, key in ipairs(KEYS) do
+    local used = redis.call('INCR', key)
+    if used == 1 then
+        redis.call('EXPIRE', key, ARGV[2 * i])
+    end
+    result[i + 1] = used
+end
+return result
+"""
+
+
+def _redis_rate_limit(
+    cache: RedisCache, keys: list[str], rules: list[RateLimitRule]
+) -> tuple[int, list[int]] | None:
+    """Run the rate limit script on a single-server Redis cache, or return None."""
+    # Private attributes of Django's RedisCache: fall back to the generic path if they change.
+    servers = getattr(cache, "_servers", None)
+    get_client = getattr(getattr(cache, "_cache", None), "get_client", None)
+    if servers is None or get_client is None or len(servers) != 1:
+        # Keys of one script must live on the same server.
+        return None
+    redis_keys = [cache.make_and_validate_key(key) for key in keys]
+    args: list[int] = []
+    for rule in rules:
+        args.extend([rule.limit, rule.window_seconds])
+    result = get_client(redis_keys[0], write=True).eval(
+        _RATE_LIMIT_SCRIPT, len(redis_keys), *redis_keys, *args
+    )
+    tripped = int(result[0])
+    if tripped:
+        counts = [0] * len(rules)
+        counts[tripped - 1] = int(result[1])
+        return tripped, counts
+    return 0, [int(count) for count in result[1:]]
+
+
+def check_rate_limits(
+    rules: Sequence[RateLimitRule | tuple[str, int, int]],
+    *,
+    cache: BaseCache | None = None,
+) -> dict[str, Any]:
+    """
+    Evaluate several rate limit rules together.
+
+    Each rule is a fixed window counter. The request is counted against
+    every rule only when none of them is exhausted. On Django's Redis cache
+    (single server) this is one atomic script call. Other backends read all
+    counters with one ``get_many`` (a refused request stops there), then
+    increment each one (``add`` for a new window, ``incr`` otherwise): one
+    round trip plus one per rule. A concurrent request that pushes a
+    counter past its limit meanwhile takes its increments back, so requests
+    are never undercounted (at worst one is refused near the limit).
+
+    Args:
+        rules: RateLimitRule or (key, limit, window_seconds) tuples;
+            rules with a falsy limit or window are ignored
+        cache: Cache backend to use (defaults to Django's default cache)
+
+    Returns:
+        dict with 'allowed', the tripped 'rule' name (None when allowed),
+        its 'attempts'/'limit'/'window_seconds', 'reset_in' seconds until
+        its window resets, and per-rule details under 'rules'
+    """
+    used_cache = cache or default_cache
+    active, keys, reset_in = _prepare_rules(rules)
+    if not active:
+        return _rate_limits_result(active, [], [], 0)
+
+    outcome = None
+    if isinstance(used_cache, RedisCache):
+        outcome = _redis_rate_limit(used_cache, keys, active)
+    if outcome is None:
+        current = used_cache.get_many(keys)
+        outcome = _exhausted_rule(active, keys, current)
+        if outcome is None:
+            counts = [
+                _increment(used_cache, key, rule.window_seconds, key in current)
+                for rule, key in zip(active, keys, strict=True)
+            ]
+            outcome = _count_rules(active, counts)
+            if outcome[0]:
+                for key in keys:
+                    used_cache.decr(key)
+    return _rate_limits_result(active, outcome[1], reset_in, outcome[0])
+
+
+async def acheck_rate_limits(
+    rules: Sequence[RateLimitRule | tuple[str, int, int]],
+    *,
+    cache: BaseCache | None = None,
+) -> dict[str, Any]:
+    """
+    Async variant of ``check_rate_limits``.
+
+    Uses ``aget_many``/``aadd``/``aincr``; the Redis script runs in a worker thread
+    since the Redis cache has no async client.
+    """
+    used_cache = cache or default_cache
+    active, keys, reset_in = _prepare_rules(rules)
+    if not active:
+        return _rate_limits_result(active, [], [], 0)
+
+    outcome = None
+    if isinstance(used_cache, RedisCache):
+        outcome = await sync_to_async(_redis_rate_limit, thread_sensitive=False)(
+            used_cache, keys, active
+        )
+    if outcome is None:
+        current = await used_cache.aget_many(keys)
+        outcome = _exhausted_rule(active, keys, current)
+        if outcome is None:
+            counts = [
+                await _aincrement(used_cache, key, rule.window_seconds, key in current)
+                for rule, key in zip(active, keys, strict=True)
+            ]
+            outcome = _count_rules(active, counts)
+            if outcome[0]:
+                for key in keys:
+                    await used_cache.adecr(key)
+    return _rate_limits_result(active, outcome[1], reset_in, outcome[0])
+
+
+def _prepare_rules(
+    rules: Sequence[RateLimitRule | tuple[str, int, int]],
+) -> tuple[list[RateLimitRule], list[str], list[int]]:
+    """Return the active rules, their current window keys and seconds until reset."""
+    active = [rule if isinstance(rule, RateLimitRule) else RateLimitRule(*rule) for rule in rules]
+    active = [rule for rule in active if rule.limit and rule.window_seconds]
+    now = time.time()
+    keys = [f"{rule.key}_{int(now // rule.window_seconds)}" for rule in active]
+    reset_in = [
+        math.ceil((now // rule.window_seconds + 1) * rule.window_seconds - now) for rule in active
+    ]
+    return active, keys, reset_in
+
+
+def _exhausted_rule(
+    rules: list[RateLimitRule], keys: list[str], current: dict[str, Any]
+) -> tuple[int, list[int]] | None:
+    """Return the outcome of a request refused on the counters read, or None to count it."""
+    counts = [int(current.get(key, 0)) for key in keys]
+    for index, rule in enumerate(rules):
+        if counts[index] >= rule.limit:
+            return index + 1, counts
+    return None
+
+
+def _increment(cache: BaseCache, key: str, ttl: int, exists: bool) -> int:
+    """Count one request in a window counter, creating it when missing or expired meanwhile."""
+    if not exists and cache.add(key, 1, ttl):
+        return 1
+    try:
+        return cache.incr(key)
+    except ValueError:
+        # The window expired since it was read.
+        if cache.add(key, 1, ttl):
+            return 1
+        return cache.incr(key)
+
+
+async def _aincrement(cache: BaseCache, key: str, ttl: int, exists: bool) -> int:
+    """Async variant of ``_increment``."""
+    if not exists and await cache.aadd(key, 1, ttl):
+        return 1
+    try:
+        return await cache.aincr(key)
+    except ValueError:
+        if await cache.aadd(key, 1, ttl):
+            return 1
+        return await cache.aincr(key)
+
+
+def _count_rules(rules: list[RateLimitRule], counts: list[int]) -> tuple[int, list[int]]:
+    """
+    Judge counters already incremented for this request.
 
-    cache_key = f"{key_prefix}_{phone}"
-    attempts: int = used_cache.get(cache_key, 0)
-    if attempts >= effective_limit:
+    Returns (1-based index of the first exceeded rule or 0, counts to report);
+    a refused request reports the counts before its own increment.
+    """
+    tripped = next((index + 1 for index, rule in enumerate(rules) if counts[index] > rule.limit), 0)
+    if tripped:
+        return tripped, [count - 1 for count in counts]
+    return 0, counts
+
+
+def _rate_limits_result(
+    rules: list[RateLimitRule], counts: list[int], reset_in: list[int], tripped: int
+) -> dict[str, Any]:
+    if not rules:
         return {
-            "allowed": False,
-            "attempts": attempts,
-            "limit": effective_limit,
-            "window_seconds": effective_window,
+            "allowed": True,
+            "rule": None,
+            "attempts": 0,
+            "limit": 0,
+            "window_seconds": 0,
+            "reset_in": 0,
+            "rules": [],
         }
-    used_cache.set(cache_key, attempts + 1, effective_window)
-    return {
-        "allowed": True,
-        "attempts": attempts + 1,
-        "limit": effective_limit,
-        "window_seconds": effective_window,
-    }
+    details = [
+        {
+            "rule": rule.name or rule.key,
+            "attempts": count,
+            "limit": rule.limit,
+            "window_seconds": rule.window_seconds,
+            "reset_in": seconds,
+        }
+        for rule, count, seconds in zip(rules, counts, reset_in, strict=True)
+    ]
+    if tripped:
+        return {"allowed": False, **details[tripped - 1], "rules": details}
+    return {"allowed": True, **details[0], "rule": None, "rules": details}
 
 
 def send_verification_code(
@@ -95,6 +363,8 @@ def send_verification_code(
     rate_limit: bool = True,
     cache: BaseCache | None = None,
     rate_limit_key_prefix: str = "solapi_sms_attempt",
+    rate_limit_rules: Sequence[RateLimitRule | tuple[str, int, int]] | None = None,
+    deadline: float | None = None,
 ) -> dict[str, Any]:
     """
     Send a verification code to a phone number.
@@ -107,42 +377,124 @@ def send_verification_code(
         rate_limit: Whether to apply rate limiting
         cache: Cache backend for rate limiting
         rate_limit_key_prefix: Prefix for rate limit cache key
+        rate_limit_rules: Extra rules (per IP, device, global...) checked
+            together with the per-phone limit in one cache round trip
+        deadline: Seconds the SOLAPI send may take (fail fast in interactive flows)
 
     Returns:
         dict with success status and details
     """
     phone = normalize_phone(phone)
     if validate_phone and not is_valid_phone(phone):
-        return {
-            "success": False,
-            "error": "invalid_phone",
-            "message": "올바른 휴대폰 번호를 입력해주세요.",
-            "phone": phone,
-        }
+        return _invalid_phone_result(phone)
 
-    # Test mode: bypass rate limit for configured test credentials (SMS still sent)
-    is_test_phone = SOLAPI_TEST_CREDENTIALS and phone in SOLAPI_TEST_CREDENTIALS
-    if is_test_phone:
-        logger.info("Test credentials: skipping rate limit for phone: %s", phone)
-
-    if rate_limit and not is_test_phone:
-        rate = check_rate_limit(
-            phone,
-            cache=cache,
-            key_prefix=rate_limit_key_prefix,
-        )
+    if rate_limit and not _is_test_phone(phone):
+        if rate_limit_rules:
+            rate = check_rate_limits(
+                [_phone_rule(phone, rate_limit_key_prefix), *rate_limit_rules], cache=cache
+            )
+        else:
+            rate = check_rate_limit(
+                phone,
+                cache=cache,
+                key_prefix=rate_limit_key_prefix,
+            )
         if not rate["allowed"]:
-            return {
-                "success": False,
-                "error": "rate_limited",
-                "message": "너무 많은 시도입니다. 잠시 후 다시 시도해주세요.",
-                "phone": phone,
-                "rate_limit": rate,
-            }
+            return _rate_limited_result(phone, rate)
 
     service = service or SMSService()
     verification = service.create_verification(phone, code=code)
-    success = service.send_verification_code(phone, verification.code)  # type: ignore[attr-defined]
+    success = service.send_verification_code(
+        phone,
+        verification.code,  # type: ignore[attr-defined]
+        deadline=deadline,
+    )
+    return _send_result(phone, verification, success)
+
+
+async def asend_verification_code(
+    phone: str,
+    *,
+    service: SMSService | None = None,
+    code: str | None = None,
+    validate_phone: bool = True,
+    rate_limit: bool = True,
+    cache: BaseCache | None = None,
+    rate_limit_key_prefix: str = "solapi_sms_attempt",
+    rate_limit_rules: Sequence[RateLimitRule | tuple[str, int, int]] | None = None,
+    deadline: float | None = None,
+) -> dict[str, Any]:
+    """
+    Async variant of ``send_verification_code``.
+
+    Uses the async cache API, async ORM and the async SOLAPI transport, and
+    returns the same result dicts.
+    """
+    phone = normalize_phone(phone)
+    if validate_phone and not is_valid_phone(phone):
+        return _invalid_phone_result(phone)
+
+    if rate_limit and not _is_test_phone(phone):
+        if rate_limit_rules:
+            rate = await acheck_rate_limits(
+                [_phone_rule(phone, rate_limit_key_prefix), *rate_limit_rules], cache=cache
+            )
+        else:
+            rate = await acheck_rate_limit(
+                phone,
+                cache=cache,
+                key_prefix=rate_limit_key_prefix,
+            )
+        if not rate["allowed"]:
+            return _rate_limited_result(phone, rate)
+
+    service = service or SMSService()
+    verification = await service.acreate_verification(phone, code=code)
+    success = await service.asend_verification_code(
+        phone,
+        verification.code,  # type: ignore[attr-defined]
+        deadline=deadline,
+    )
+    return _send_result(phone, verification, success)
+
+
+def _is_test_phone(phone: str) -> bool:
+    # Test mode: bypass rate limit for configured test credentials (SMS still sent)
+    if SOLAPI_TEST_CREDENTIALS and phone in SOLAPI_TEST_CREDENTIALS:
+        logger.info("Test credentials: skipping rate limit for phone: %s", phone)
+        return True
+    return False
+
+
+def _phone_rule(
+    phone: str,
+    key_prefix: str,
+    limit: int = SOLAPI_VERIFICATION_RATE_LIMIT_COUNT,
+    window_seconds: int = SOLAPI_VERIFICATION_RATE_LIMIT_WINDOW_SECONDS,
+) -> RateLimitRule:
+    return RateLimitRule(f"{key_prefix}_{phone}", limit, window_seconds, "phone")
+
+
+def _invalid_phone_result(phone: str) -> dict[str, Any]:
+    return {
+        "success": False,
+        "error": "invalid_phone",
+        "message": "올바른 휴대폰 번호를 입력해주세요.",
+        "phone": phone,
+    }
+
+
+def _rate_limited_result(phone: str, rate: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "success": False,
+        "error": "rate_limited",
+        "message": "너무 많은 시도입니다. 잠시 후 다시 시도해주세요.",
+        "phone": phone,
+        "rate_limit": rate,
+    }
+
+
+def _send_result(phone: str, verification: Model, success: bool) -> dict[str, Any]:
     if not success:
         return {
             "success": False,
@@ -181,13 +533,52 @@ def verify_code(
         dict with success status and details
     """
     phone = normalize_phone(phone)
+    early = _verify_precheck(phone, code, validate_phone)
+    if early is not None:
+        return early
+
+    verification = get_latest_verification(phone)
+    effective_max_attempts = max_attempts or SOLAPI_VERIFICATION_MAX_ATTEMPTS
+    rejected = _verification_rejection(phone, verification, effective_max_attempts)
+    if rejected is not None:
+        return rejected
+
+    service = service or SMSService()
+    verified = service.verify_code(phone, code)
+    verification.refresh_from_db()  # type: ignore[union-attr]
+    return _verify_result(phone, verification, verified, effective_max_attempts)
+
+
+async def averify_code(
+    phone: str,
+    code: str,
+    *,
+    service: SMSService | None = None,
+    validate_phone: bool = True,
+    max_attempts: int | None = None,
+) -> dict[str, Any]:
+    """Async variant of ``verify_code`` using the async ORM; same result dicts."""
+    phone = normalize_phone(phone)
+    early = _verify_precheck(phone, code, validate_phone)
+    if early is not None:
+        return early
+
+    verification = await aget_latest_verification(phone)
+    effective_max_attempts = max_attempts or SOLAPI_VERIFICATION_MAX_ATTEMPTS
+    rejected = _verification_rejection(phone, verification, effective_max_attempts)
+    if rejected is not None:
+        return rejected
+
+    service = service or SMSService()
+    verified = await service.averify_code(phone, code)
+    await verification.arefresh_from_db()  # type: ignore[union-attr]
+    return _verify_result(phone, verification, verified, effective_max_attempts)
+
+
+def _verify_precheck(phone: str, code: str, validate_phone: bool) -> dict[str, Any] | None:
+    """Result for input that never reaches the database, or None to continue."""
     if validate_phone and not is_valid_phone(phone):
-        return {
-            "success": False,
-            "error": "invalid_phone",
-            "message": "올바른 휴대폰 번호를 입력해주세요.",
-            "phone": phone,
-        }
+        return _invalid_phone_result(phone)
     if not code:
         return {
             "success": False,
@@ -209,8 +600,13 @@ def verify_code(
             "verification": None,
             "test_mode": True,
         }
+    return None
 
-    verification = get_latest_verification(phone)
+
+def _verification_rejection(
+    phone: str, verification: Model | None, max_attempts: int
+) -> dict[str, Any] | None:
+    """Result when the latest verification cannot be checked, or None to continue."""
     if not verification:
         return {
             "success": False,
@@ -228,8 +624,7 @@ def verify_code(
             "verification": verification,
         }
 
-    effective_max_attempts = max_attempts or SOLAPI_VERIFICATION_MAX_ATTEMPTS
-    if verification.attempts >= effective_max_attempts:  # type: ignore[attr-defined]
+    if verification.attempts >= max_attempts:  # type: ignore[attr-defined]
         return {
             "success": False,
             "error": "max_attempts",
@@ -237,32 +632,35 @@ def verify_code(
             "phone": phone,
             "verification": verification,
         }
+    return None
 
-    service = service or SMSService()
-    if not service.verify_code(phone, code):
-        verification.refresh_from_db()
-        remaining = max(effective_max_attempts - verification.attempts, 0)  # type: ignore[attr-defined]
-        if _is_expired(verification):
-            error = "expired"
-            message = "인증번호가 만료되었습니다. 다시 요청해주세요."
-        elif verification.attempts >= effective_max_attempts:  # type: ignore[attr-defined]
-            error = "max_attempts"
-            message = "인증 시도 횟수를 초과했습니다. 다시 요청해주세요."
-        else:
-            error = "invalid_code"
-            message = "인증번호가 올바르지 않습니다."
+
+def _verify_result(
+    phone: str, verification: Any, verified: bool, max_attempts: int
+) -> dict[str, Any]:
+    """Result after the code check, from the refreshed verification row."""
+    if verified:
         return {
-            "success": False,
-            "error": error,
-            "message": message,
+            "success": True,
             "phone": phone,
             "verification": verification,
-            "remaining_attempts": remaining,
         }
 
-    verification.refresh_from_db()
+    remaining = max(max_attempts - verification.attempts, 0)
+    if _is_expired(verification):
+        error = "expired"
+        message = "인증번호가 만료되었습니다. 다시 요청해주세요."
+    elif verification.attempts >= max_attempts:
+        error = "max_attempts"
+        message = "인증 시도 횟수를 초과했습니다. 다시 요청해주세요."
+    else:
+        error = "invalid_code"
+        message = "인증번호가 올바르지 않습니다."
     return {
-        "success": True,
+        "success": False,
+        "error": error,
+        "message": message,
         "phone": phone,
         "verification": verification,
+        "remaining_attempts": remaining,
     }
@@ -0,0 +1,356 @@
+"""
+Campaigns: large sends tracked, paused and canceled as one unit.
+
+Usage:
+    from solapi_sms import campaigns
+
+    campaign = campaigns.start_campaign("10월 공지", [{"phone": ..., "message": ...}, ...])
+    campaigns.pause(campaign)
+    campaigns.resume(campaign)
+    campaigns.cancel(campaign)
+    campaigns.progress(campaign)  # {"total": ..., "sent": ..., "rate": ..., ...}
+
+``start_campaign`` tags every message with the campaign id and publishes
+them through ``enqueue_sms_many`` once the caller's transaction commits, so
+workers never get chunks of a campaign row they cannot see yet. Before each chunk the worker checks the
+campaign status, cached for SOLAPI_CAMPAIGN_STATUS_CACHE_SECONDS: chunks of
+a paused campaign are held in ``SMSCampaignChunk`` until ``resume``, chunks
+of a canceled one are logged as SKIPPED (``skipped_reason: "canceled"``).
+
+Outcomes are counted in up to SOLAPI_CAMPAIGN_COUNTER_SHARDS counter rows
+per campaign, each chunk incrementing a random one, so concurrent workers
+never queue up on a single row. ``progress`` sums the shards.
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import time
+from collections import Counter
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Any
+
+from django.core.cache import cache
+from django.db import router, transaction
+from django.db.models import F, Max, OuterRef, QuerySet, Subquery, Sum
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from . import settings
+from .models import (
+    SMSCampaign,
+    SMSCampaignChunk,
+    SMSCampaignCounter,
+    SMSCampaignStatus,
+    SMSLogStatus,
+)
+
+logger = logging.getLogger(__name__)
+
+# Message dict key carrying the campaign id through the task backends.
+CAMPAIGN_KEY = "campaign"
+
+_COUNTER_FIELDS: dict[str, str] = {SMSLogStatus.SUCCESS: "sent", SMSLogStatus.SKIPPED: "skipped"}
+
+
+def _pk(campaign: SMSCampaign | int) -> int:
+    return campaign.pk if isinstance(campaign, SMSCampaign) else campaign
+
+
+def _status_key(campaign_id: int) -> str:
+    return f"solapi_sms:campaign:{campaign_id}:status"
+
+
+def campaign_of(message: Mapping[str, str]) -> int | None:
+    """Campaign id a message was tagged with, if any."""
+    value = message.get(CAMPAIGN_KEY)
+    return int(value) if value else None
+
+
+def campaign_status(campaign_id: int) -> str | None:
+    """Status of a campaign, cached; None when it no longer exists."""
+    key = _status_key(campaign_id)
+    status: str | None = cache.get(key)
+    if status is None:
+        status = SMSCampaign.objects.filter(pk=campaign_id).values_list("status", flat=True).first()
+        if status is not None:
+            cache.set(key, status, settings.SOLAPI_CAMPAIGN_STATUS_CACHE_SECONDS)
+    return status
+
+
+def _transition(
+    campaign: SMSCampaign | int,
+    from_statuses: Sequence[str],
+    to: str,
+    **fields: Any,
+) -> bool:
+    campaign_id = _pk(campaign)
+    updated = SMSCampaign.objects.filter(pk=campaign_id, status__in=from_statuses).update(
+        status=to, **fields
+    )
+    if not updated:
+        return False
+    cache.set(_status_key(campaign_id), to, settings.SOLAPI_CAMPAIGN_STATUS_CACHE_SECONDS)
+    if isinstance(campaign, SMSCampaign):
+        campaign.status = to
+        for name, value in fields.items():
+            setattr(campaign, name, value)
+    return True
+
+
+def start_campaign(
+    name: str,
+    messages: Sequence[Mapping[str, str]],
+    *,
+    chunk_size: int | None = None,
+) -> SMSCampaign:
+    """
+    Create a campaign for ``messages`` and publish them with ``enqueue_sms_many``.
+
+    Args:
+        name: Campaign name shown in the admin
+        messages: Mappings with 'phone', 'message' and optional 'message_type'
+        chunk_size: Messages per task (default SOLAPI_ENQUEUE_CHUNK_SIZE)
+
+    Returns:
+        The campaign (already COMPLETED with the sync backend outside a
+        transaction, or when ``messages`` is empty)
+    """
+    from .tasks import enqueue_sms_many
+
+    if not messages:
+        return SMSCampaign.objects.create(
+            name=name, total=0, status=SMSCampaignStatus.COMPLETED, finished_at=timezone.now()
+        )
+    campaign = SMSCampaign.objects.create(name=name, total=len(messages))
+    tagged = [{**item, CAMPAIGN_KEY: str(campaign.pk)} for item in messages]
+    # Runs immediately outside a transaction.
+    transaction.on_commit(
+        lambda: enqueue_sms_many(tagged, chunk_size=chunk_size),
+        using=router.db_for_write(SMSCampaign),
+    )
+    campaign.refresh_from_db()
+    return campaign
+
+
+def pause(campaign: SMSCampaign | int) -> bool:
+    """Hold the campaign's remaining chunks. Returns False if it was not running."""
+    return _transition(campaign, [SMSCampaignStatus.RUNNING], SMSCampaignStatus.PAUSED)
+
+
+def resume(campaign: SMSCampaign | int) -> bool:
+    """Continue a paused campaign and republish its held chunks. False if it was not paused."""
+    if not _transition(campaign, [SMSCampaignStatus.PAUSED], SMSCampaignStatus.RUNNING):
+        return False
+    _release_held(_pk(campaign))
+    return True
+
+
+def cancel(campaign: SMSCampaign | int) -> bool:
+    """
+    Stop a running or paused campaign.
+
+    Held chunks and chunks picked up afterwards are logged as SKIPPED.
+    Returns False if the campaign had already finished.
+    """
+    if not _transition(
+        campaign,
+        [SMSCampaignStatus.RUNNING, SMSCampaignStatus.PAUSED],
+        SMSCampaignStatus.CANCELED,
+        finished_at=timezone.now(),
+    ):
+        return False
+    _drop_held(_pk(campaign))
+    return True
+
+
+def admit_messages(messages: list[dict[str, str]]) -> list[dict[str, str]]:
+    """
+    Messages of a worker chunk that may be sent now.
+
+    Messages without a campaign pass. Those of a paused campaign are held
+    for ``resume`` and those of a canceled campaign are logged as SKIPPED.
+    """
+    groups: dict[int | None, list[dict[str, str]]] = {}
+    for item in messages:
+        groups.setdefault(campaign_of(item), []).append(item)
+    if list(groups) == [None]:
+        return messages
+
+    admitted: list[dict[str, str]] = []
+    for campaign_id, group in groups.items():
+        status = None if campaign_id is None else _await_status(campaign_id)
+        if status == SMSCampaignStatus.PAUSED:
+            _hold(campaign_id, group)  # type: ignore[arg-type]
+        elif status == SMSCampaignStatus.CANCELED:
+            _skip(group)
+        elif campaign_id is not None and status is None:
+            logger.warning(
+                "SMS campaign %s not found, sending %d messages unlinked", campaign_id, len(group)
+            )
+            admitted.extend(
+                {key: value for key, value in item.items() if key != CAMPAIGN_KEY} for item in group
+            )
+        else:
+            admitted.extend(group)
+    return admitted
+
+
+def _await_status(campaign_id: int) -> str | None:
+    """
+    Status of a campaign, waiting up to SOLAPI_CAMPAIGN_VISIBILITY_WAIT_SECONDS for it to appear.
+
+    Chunks of a campaign created in a transaction that has not committed
+    yet (messages tagged by hand) would otherwise be taken for deleted.
+    """
+    deadline = time.monotonic() + settings.SOLAPI_CAMPAIGN_VISIBILITY_WAIT_SECONDS
+    delay = 0.1
+    while (status := campaign_status(campaign_id)) is None and time.monotonic() < deadline:
+        time.sleep(delay)
+        delay = min(delay * 2, 1.0)
+    return status
+
+
+def _hold(campaign_id: int, messages: list[dict[str, str]]) -> None:
+    SMSCampaignChunk.objects.create(campaign_id=campaign_id, messages=messages)
+    logger.info("SMS campaign %s paused, holding %d messages", campaign_id, len(messages))
+    # The status was read from the cache: resume() or cancel() may already
+    # have processed the held chunks without this one.
+    status = SMSCampaign.objects.filter(pk=campaign_id).values_list("status", flat=True).first()
+    if status == SMSCampaignStatus.RUNNING:
+        _release_held(campaign_id)
+    elif status == SMSCampaignStatus.CANCELED:
+        _drop_held(campaign_id)
+
+
+def _take_held(campaign_id: int) -> list[dict[str, str]]:
+    """Delete and return the held messages of a campaign; chunks locked elsewhere are left."""
+    with transaction.atomic(using=router.db_for_write(SMSCampaignChunk)):
+        chunks = list(
+            SMSCampaignChunk.objects.select_for_update(skip_locked=True)
+            .filter(campaign_id=campaign_id)
+            .order_by("pk")
+        )
+        SMSCampaignChunk.objects.filter(pk__in=[chunk.pk for chunk in chunks]).delete()
+    return [item for chunk in chunks for item in chunk.messages]
+
+
+def _release_held(campaign_id: int) -> int:
+    from .tasks import enqueue_sms_many
+
+    messages = _take_held(campaign_id)
+    if messages:
+        enqueue_sms_many(messages)
+    return len(messages)
+
+
+def _drop_held(campaign_id: int) -> int:
+    messages = _take_held(campaign_id)
+    if messages:
+        _skip(messages)
+    return len(messages)
+
+
+def _skip(messages: list[dict[str, str]]) -> None:
+    from .services import SMSService
+
+    SMSService()._log_skipped_bulk(messages, {"skipped_reason": "canceled"})
+
+
+def record(campaign_id: int, *, sent: int = 0, failed: int = 0, skipped: int = 0) -> None:
+    """Add outcomes to a random counter shard and complete the campaign when all are counted."""
+    shard = random.randrange(max(settings.SOLAPI_CAMPAIGN_COUNTER_SHARDS, 1))  # noqa: S311
+    changes: dict[str, Any] = {
+        name: F(name) + count
+        for name, count in (("sent", sent), ("failed", failed), ("skipped", skipped))
+        if count
+    }
+    counters = SMSCampaignCounter.objects.filter(campaign_id=campaign_id, shard=shard)
+    if not counters.update(updated_at=timezone.now(), **changes):
+        SMSCampaignCounter.objects.get_or_create(campaign_id=campaign_id, shard=shard)
+        counters.update(updated_at=timezone.now(), **changes)
+
+    processed = (
+        SMSCampaignCounter.objects.filter(campaign_id=OuterRef("pk"))
+        .values("campaign_id")
+        .annotate(processed=Sum(F("sent") + F("failed") + F("skipped")))
+        .values("processed")
+    )
+    completed = SMSCampaign.objects.filter(
+        pk=campaign_id,
+        status__in=[SMSCampaignStatus.RUNNING, SMSCampaignStatus.PAUSED],
+        total__lte=Subquery(processed),
+    ).update(status=SMSCampaignStatus.COMPLETED, finished_at=timezone.now())
+    if completed:
+        cache.set(
+            _status_key(campaign_id),
+            SMSCampaignStatus.COMPLETED,
+            settings.SOLAPI_CAMPAIGN_STATUS_CACHE_SECONDS,
+        )
+
+
+def record_recovered(campaign_id: int, count: int) -> None:
+    """Move ``count`` messages from ``failed`` to ``sent`` after their retry succeeded."""
+    shards = SMSCampaignCounter.objects.filter(campaign_id=campaign_id)
+    remaining = count
+    for pk, failed in shards.filter(failed__gt=0).order_by("-failed").values_list("pk", "failed"):
+        moved = min(remaining, failed)
+        # Counters are unsigned: only take from a shard that still holds them.
+        if shards.filter(pk=pk, failed__gte=moved).update(
+            failed=F("failed") - moved, sent=F("sent") + moved, updated_at=timezone.now()
+        ):
+            remaining -= moved
+        if not remaining:
+            break
+
+
+def record_outcomes(outcomes: Iterable[tuple[int | None, str]]) -> None:
+    """Count (campaign id, SMSLogStatus) pairs, one counter update per campaign."""
+    tallies: dict[int, Counter[str]] = {}
+    for campaign_id, status in outcomes:
+        if campaign_id is not None:
+            tallies.setdefault(campaign_id, Counter())[_COUNTER_FIELDS.get(status, "failed")] += 1
+    for campaign_id, counts in tallies.items():
+        record(campaign_id, **counts)
+
+
+def with_progress(queryset: QuerySet[SMSCampaign]) -> QuerySet[SMSCampaign]:
+    """Annotate campaigns with their summed counters, as used by ``progress``."""
+    return queryset.annotate(
+        sent_count=Coalesce(Sum("counters__sent"), 0),
+        failed_count=Coalesce(Sum("counters__failed"), 0),
+        skipped_count=Coalesce(Sum("counters__skipped"), 0),
+        last_counted_at=Max("counters__updated_at"),
+    )
+
+
+def progress(campaign: SMSCampaign | int) -> dict[str, Any]:
+    """
+    Counters of a campaign.
+
+    Returns:
+        dict with 'status', 'total', 'sent', 'failed', 'skipped', 'processed',
+        'percent' and 'rate' (messages per second since the campaign started)
+    """
+    annotated: Any = campaign
+    if not hasattr(annotated, "sent_count"):
+        annotated = with_progress(SMSCampaign.objects.filter(pk=_pk(campaign))).get()
+    sent, failed, skipped = annotated.sent_count, annotated.failed_count, annotated.skipped_count
+    processed = sent + failed + skipped
+    total = annotated.total
+    elapsed = (
+        (annotated.last_counted_at - annotated.created_at).total_seconds()
+        if annotated.last_counted_at
+        else 0
+    )
+    return {
+        "status": annotated.status,
+        "total": total,
+        "sent": sent,
+        "failed": failed,
+        "skipped": skipped,
+        "processed": processed,
+        "percent": processed * 100 / total if total else 100.0,
+        "rate": processed / elapsed if elapsed > 0 else 0.0,
+    }
@@ -1,31 +1,236 @@
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Any
+import threading
+import weakref
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any
 
-from solapi import SolapiMessageService
+import httpx
+from solapi.error.MessageNotReceiveError import MessageNotReceivedError
+from solapi.lib.authenticator import Authenticator
 from solapi.model import RequestMessage
+from solapi.model.request.send_message_request import SendMessageRequest
+from solapi.model.response.send_message_response import SendMessageResponse
 
-from . import settings
+from . import settings, tracing
+from .exceptions import SolapiSMSAPIError
+
+if TYPE_CHECKING:
+    from httpx._client import UseClientDefault
 
 logger = logging.getLogger(__name__)
 
+SOLAPI_SEND_URL = "https://api.solapi.com/messages/v4/send-many/detail"
+
+# One pooled AsyncClient per event loop: httpx async clients are bound to the
+# loop they were first used on.
+_async_http_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = (
+    weakref.WeakKeyDictionary()
+)
+
+# Shared SolapiClient per (api_key, api_secret), see get_client().
+_clients: dict[tuple[str, str], SolapiClient] = {}
+_clients_lock = threading.Lock()
+
+
+def _default_timeout() -> httpx.Timeout:
+    return httpx.Timeout(
+        settings.SOLAPI_READ_TIMEOUT_SECONDS, connect=settings.SOLAPI_CONNECT_TIMEOUT_SECONDS
+    )
+
+
+def _request_timeout(timeout: float | None) -> httpx.Timeout | UseClientDefault:
+    """
+    Timeout for one request: the client defaults, each capped at ``timeout``.
+
+    httpx applies these per operation (connect, each read), so callers
+    re-derive ``timeout`` from their remaining deadline before every request.
+    """
+    if timeout is None:
+        return httpx.USE_CLIENT_DEFAULT
+    return httpx.Timeout(
+        min(settings.SOLAPI_READ_TIMEOUT_SECONDS, timeout),
+        connect=min(settings.SOLAPI_CONNECT_TIMEOUT_SECONDS, timeout),
+    )
+
+
+def _get_async_http_client() -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    client = _async_http_clients.get(loop)
+    if client is None:
+        client = httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(retries=3), timeout=_default_timeout()
+        )
+        _async_http_clients[loop] = client
+    return client
+
+
+async def aclose_http_client() -> None:
+    """Close the pooled async HTTP client of the running event loop."""
+    client = _async_http_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+def _parse_send_response(response: httpx.Response) -> SendMessageResponse:
+    """Mirror the SDK's error handling for a send-many response."""
+    if 400 <= response.status_code < 500:
+        error_response: dict[str, Any] = response.json()
+        raise SolapiSMSAPIError(
+            error_response.get("errorCode", "UnknownError"),
+            error_response.get("errorMessage", "An Error occurred"),
+            response.status_code,
+        )
+    if response.status_code >= 500:
+        raise SolapiSMSAPIError("UnknownError", response.text, response.status_code)
+
+    parsed = SendMessageResponse.model_validate(response.json())
+    failed_messages = parsed.failed_message_list
+    if (
+        failed_messages
+        and parsed.group_info.count.total == parsed.group_info.count.registered_failed
+    ):
+        raise MessageNotReceivedError(failed_messages)
+    return parsed
+
+
+def get_client(api_key: str | None = None, api_secret: str | None = None) -> SolapiClient:
+    """
+    Return a shared SolapiClient for the given credentials.
+
+    Clients keep a pooled HTTP connection, so reusing them avoids a new
+    TLS handshake per message.
+    """
+    key = (api_key or settings.SOLAPI_API_KEY, api_secret or settings.SOLAPI_API_SECRET)
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = _clients[key] = SolapiClient(*key)
+        return client
+
 
 class SolapiClient:
-    """Thin wrapper around SOLAPI SDK."""
+    """
+    Thin wrapper around SOLAPI SDK.
+
+    Sends go to the send-many endpoint through a pooled ``httpx.Client``
+    (the SDK opens a new connection per call), reusing the SDK's
+    authenticator and request/response models.
+    """
 
     def __init__(self, api_key: str | None = None, api_secret: str | None = None) -> None:
         self.api_key = api_key or settings.SOLAPI_API_KEY
         self.api_secret = api_secret or settings.SOLAPI_API_SECRET
-        self._client = SolapiMessageService(api_key=self.api_key, api_secret=self.api_secret)
+        self._http: httpx.Client | None = None
+        self._http_lock = threading.Lock()
+
+    def _get_http_client(self) -> httpx.Client:
+        with self._http_lock:
+            if self._http is None:
+                self._http = httpx.Client(
+                    transport=httpx.HTTPTransport(retries=3), timeout=_default_timeout()
+                )
+            return self._http
+
+    def close(self) -> None:
+        """Close the pooled HTTP connection."""
+        with self._http_lock:
+            http, self._http = self._http, None
+        if http is not None:
+            http.close()
+
+    def _headers(self) -> dict[str, str]:
+        return {
+            "Authorization": Authenticator(self.api_key, self.api_secret).get_auth_info(),
+            "Content-Type": "application/json",
+        }
+
+    def _post(
+        self, request: SendMessageRequest, timeout: float | None = None
+    ) -> SendMessageResponse:
+        response = self._get_http_client().post(
+            SOLAPI_SEND_URL,
+            headers=self._headers(),
+            json=request.model_dump(exclude_none=True, by_alias=True),
+            timeout=_request_timeout(timeout),
+        )
+        return _parse_send_response(response)
+
+    @tracing.traced("solapi_sms.solapi.send_message")
+    def send_message(
+        self,
+        to: str,
+        text: str,
+        sender: str | None = None,
+        *,
+        timeout: float | None = None,
+    ) -> Any:
+        """
+        Send one message.
 
-    def send_message(self, to: str, text: str, sender: str | None = None) -> Any:
+        ``timeout`` (seconds) caps the connect and read timeouts of this call
+        below SOLAPI_CONNECT_TIMEOUT_SECONDS / SOLAPI_READ_TIMEOUT_SECONDS.
+        Raises ``httpx.TimeoutException`` when exceeded.
+        """
         message = RequestMessage(
             to=to,
             from_=sender or settings.SOLAPI_SENDER_PHONE,
             text=text,
         )
-        return self._client.send(message)
+        # show_message_list returns per-message ids, matched later against delivery reports.
+        return self._post(SendMessageRequest(messages=[message], show_message_list=True), timeout)
+
+    @tracing.traced("solapi_sms.solapi.send_message")
+    async def asend_message(
+        self,
+        to: str,
+        text: str,
+        sender: str | None = None,
+        *,
+        timeout: float | None = None,
+    ) -> Any:
+        """Async variant of ``send_message`` over a pooled ``httpx.AsyncClient``."""
+        message = RequestMessage(
+            to=to,
+            from_=sender or settings.SOLAPI_SENDER_PHONE,
+            text=text,
+        )
+        request = SendMessageRequest(messages=[message], show_message_list=True)
+        response = await _get_async_http_client().post(
+            SOLAPI_SEND_URL,
+            headers=self._headers(),
+            json=request.model_dump(exclude_none=True, by_alias=True),
+            timeout=_request_timeout(timeout),
+        )
+        return _parse_send_response(response)
+
+    @tracing.traced("solapi_sms.solapi.send_messages")
+    def send_messages(
+        self,
+        messages: Sequence[tuple[str, str]],
+        sender: str | None = None,
+        *,
+        timeout: float | None = None,
+    ) -> Any:
+        """
+        Send several (to, text) pairs in one send-many request.
+
+        Each message carries its position in ``custom_fields["index"]`` so
+        per-message results can be mapped back to the input order.
+        """
+        payload = [
+            RequestMessage(
+                to=to,
+                from_=sender or settings.SOLAPI_SENDER_PHONE,
+                text=text,
+                custom_fields={"index": str(index)},
+            )
+            for index, (to, text) in enumerate(messages)
+        ]
+        tracing.set_attributes(messages=len(payload))
+        return self._post(SendMessageRequest(messages=payload, show_message_list=True), timeout)
 
     @staticmethod
     def serialize_response(response: Any) -> dict[str, Any]:
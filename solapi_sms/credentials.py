@@ -0,0 +1,201 @@
+"""
+Sharding sends across several SOLAPI accounts and senders.
+
+Configuration:
+    # settings.py
+    SOLAPI_CREDENTIALS = [
+        ("key-1", "secret-1", "0212345678"),
+        {"api_key": "key-2", "api_secret": "secret-2", "sender": "0298765432",
+         "weight": 2, "quota": 50000},
+    ]
+    SOLAPI_CREDENTIAL_STRATEGY = "round_robin"  # or "hash" (same sender per phone)
+
+Each credential keeps its own pooled client, an in-process health state
+(failures put it in cooldown) and an optional per-window quota counted in
+Django's cache. Sends fail over to the next available credential.
+"""
+
+from __future__ import annotations
+
+import bisect
+import hashlib
+import logging
+import threading
+import time
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Any
+
+from django.core.cache import cache
+
+from . import settings
+from .client import SolapiClient, get_client
+from .exceptions import SolapiSMSConfigError
+
+logger = logging.getLogger(__name__)
+
+# Points per unit of weight on the consistent-hash ring.
+_RING_REPLICAS = 64
+
+
+class Credential:
+    """One SOLAPI account/sender pair with health and quota tracking."""
+
+    def __init__(
+        self,
+        api_key: str,
+        api_secret: str,
+        sender: str,
+        weight: int = 1,
+        quota: int | None = None,
+        name: str | None = None,
+    ) -> None:
+        self.api_key = api_key
+        self.api_secret = api_secret
+        self.sender = sender
+        self.weight = max(1, int(weight))
+        self.quota = quota
+        self.name = name or f"{api_key[:8]}:{sender}"
+        self.consecutive_failures = 0
+        self.unhealthy_until = 0.0
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"<Credential {self.name}>"
+
+    @property
+    def client(self) -> SolapiClient:
+        return get_client(self.api_key, self.api_secret)
+
+    def _quota_key(self) -> str:
+        window = int(time.time()) // settings.SOLAPI_CREDENTIAL_QUOTA_WINDOW_SECONDS
+        return f"solapi_sms_quota_{self.name}_{window}"
+
+    def is_healthy(self) -> bool:
+        return time.monotonic() >= self.unhealthy_until
+
+    def has_quota(self, count: int = 1) -> bool:
+        if not self.quota:
+            return True
+        used: int = cache.get(self._quota_key(), 0)
+        return used + count <= self.quota
+
+    def record_success(self, count: int = 1) -> None:
+        with self._lock:
+            self.consecutive_failures = 0
+            self.unhealthy_until = 0.0
+        if self.quota:
+            key = self._quota_key()
+            if not cache.add(key, count, settings.SOLAPI_CREDENTIAL_QUOTA_WINDOW_SECONDS):
+                try:
+                    cache.incr(key, count)
+                except ValueError:
+                    cache.set(key, count, settings.SOLAPI_CREDENTIAL_QUOTA_WINDOW_SECONDS)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.consecutive_failures += 1
+            if self.consecutive_failures >= settings.SOLAPI_CREDENTIAL_FAILURE_THRESHOLD:
+                self.unhealthy_until = (
+                    time.monotonic() + settings.SOLAPI_CREDENTIAL_COOLDOWN_SECONDS
+                )
+                logger.warning(
+                    "SOLAPI credential %s marked unhealthy for %ss",
+                    self.name,
+                    settings.SOLAPI_CREDENTIAL_COOLDOWN_SECONDS,
+                )
+
+
+class CredentialPool:
+    """Select credentials by smooth weighted round-robin or consistent hash on phone."""
+
+    def __init__(self, credentials: Sequence[Credential], strategy: str = "round_robin") -> None:
+        if not credentials:
+            raise SolapiSMSConfigError("SOLAPI_CREDENTIALS가 비어있습니다.")
+        if strategy not in ("round_robin", "hash"):
+            raise SolapiSMSConfigError(f"알 수 없는 SOLAPI_CREDENTIAL_STRATEGY: {strategy}")
+        self.credentials = list(credentials)
+        self.strategy = strategy
+        self._lock = threading.Lock()
+        self._current_weights = [0] * len(self.credentials)
+        ring = sorted(
+            (_hash(f"{credential.name}#{replica}"), index)
+            for index, credential in enumerate(self.credentials)
+            for replica in range(credential.weight * _RING_REPLICAS)
+        )
+        self._ring_hashes = [point for point, _ in ring]
+        self._ring_indexes = [index for _, index in ring]
+
+    def _next_round_robin(self) -> int:
+        # nginx-style smooth weighted round-robin
+        with self._lock:
+            total = 0
+            best = 0
+            for index, credential in enumerate(self.credentials):
+                self._current_weights[index] += credential.weight
+                total += credential.weight
+                if self._current_weights[index] > self._current_weights[best]:
+                    best = index
+            self._current_weights[best] -= total
+            return best
+
+    def _hash_order(self, phone: str) -> list[int]:
+        start = bisect.bisect(self._ring_hashes, _hash(phone)) % len(self._ring_hashes)
+        order: list[int] = []
+        for offset in range(len(self._ring_indexes)):
+            index = self._ring_indexes[(start + offset) % len(self._ring_indexes)]
+            if index not in order:
+                order.append(index)
+                if len(order) == len(self.credentials):
+                    break
+        return order
+
+    def candidates(self, phone: str = "", count: int = 1) -> list[Credential]:
+        """
+        Credentials to try, in order, for a send of ``count`` messages.
+
+        The first entry is the strategy's choice; the rest are failover
+        targets. Unhealthy or quota-exhausted credentials are moved to the
+        end rather than dropped, so a send is still attempted when all are.
+        """
+        if self.strategy == "hash":
+            order = self._hash_order(phone)
+        else:
+            first = self._next_round_robin()
+            order = [first] + [i for i in range(len(self.credentials)) if i != first]
+        ordered = [self.credentials[index] for index in order]
+        available = [c for c in ordered if c.is_healthy() and c.has_quota(count)]
+        return available + [c for c in ordered if c not in available]
+
+
+def _hash(value: str) -> int:
+    return int.from_bytes(hashlib.sha1(value.encode(), usedforsecurity=False).digest()[:8], "big")
+
+
+def _build_credential(entry: Mapping[str, Any] | Sequence[Any]) -> Credential:
+    if isinstance(entry, Mapping):
+        return Credential(**entry)
+    return Credential(*entry)
+
+
+def build_credential_pool(
+    entries: Iterable[Mapping[str, Any] | Sequence[Any]], strategy: str = "round_robin"
+) -> CredentialPool:
+    """Build a pool from ``SOLAPI_CREDENTIALS``-style entries."""
+    return CredentialPool([_build_credential(entry) for entry in entries], strategy)
+
+
+_pool: CredentialPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_credential_pool() -> CredentialPool | None:
+    """Return the pool configured by SOLAPI_CREDENTIALS, or None when unset."""
+    global _pool
+    if not settings.SOLAPI_CREDENTIALS:
+        return None
+    with _pool_lock:
+        if _pool is None:
+            _pool = build_credential_pool(
+                settings.SOLAPI_CREDENTIALS, settings.SOLAPI_CREDENTIAL_STRATEGY
+            )
+        return _pool
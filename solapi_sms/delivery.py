@@ -0,0 +1,153 @@
+"""
+SOLAPI delivery report ingestion.
+
+The webhook view only parses the payload and hands it to the configured task
+backend via ``enqueue_delivery_reports``; ``apply_delivery_reports`` then
+updates ``SMSLog`` rows by ``message_id`` with one bulk UPDATE per
+(status, batch) instead of one query per report. With
+SOLAPI_DELIVERY_REPORT_MAX_AGE_DAYS set, the UPDATE is limited to rows of
+the last that many days, so a partitioned log table only scans its recent
+partitions; reports that match no row are counted in a warning.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Any
+
+from django.db.models import Case, DateTimeField, Value, When
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from . import settings
+from .models import SMSDeliveryStatus
+from .services import get_sms_log_model
+
+logger = logging.getLogger(__name__)
+
+
+def parse_delivery_reports(payload: Any) -> list[dict[str, str]]:
+    """
+    Extract the fields we store from a SOLAPI webhook payload.
+
+    Accepts a list of single reports (or one report object) in SOLAPI's
+    camelCase format. Reports without a message id are dropped.
+
+    Returns:
+        list of dicts with 'message_id', 'status_code', 'status_message'
+        and 'date_received' keys
+    """
+    items = payload if isinstance(payload, list) else [payload]
+    reports: list[dict[str, str]] = []
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        message_id = item.get("messageId") or item.get("message_id")
+        if not message_id:
+            continue
+        reports.append(
+            {
+                "message_id": str(message_id),
+                "status_code": str(item.get("statusCode") or item.get("status_code") or ""),
+                "status_message": str(
+                    item.get("statusMessage") or item.get("status_message") or ""
+                ),
+                "date_received": str(item.get("dateReceived") or item.get("date_received") or ""),
+            }
+        )
+    return reports
+
+
+def _delivery_status(status_code: str) -> str | None:
+    if status_code in settings.SOLAPI_DELIVERED_STATUS_CODES:
+        return SMSDeliveryStatus.DELIVERED
+    if status_code in settings.SOLAPI_DELIVERY_PENDING_STATUS_CODES:
+        return None
+    return SMSDeliveryStatus.UNDELIVERED
+
+
+def _received_at(value: str, default: datetime) -> datetime:
+    try:
+        parsed = parse_datetime(value) if value else None
+    except ValueError:
+        parsed = None
+    if parsed is None:
+        return default
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
+
+def apply_delivery_reports(
+    reports: list[dict[str, str]],
+    *,
+    batch_size: int | None = None,
+) -> int:
+    """
+    Apply parsed delivery reports to the log table.
+
+    Reports are grouped by status code so each batch costs one UPDATE per
+    distinct code, with per-row receipt times set through a CASE expression.
+    Non-final codes are skipped. Fires ``sms_delivery_reported`` once per
+    call with the reports that were applied.
+
+    Returns:
+        Number of log rows updated
+    """
+    from .signals import sms_delivery_reported
+
+    size = batch_size or settings.SOLAPI_DELIVERY_BATCH_SIZE
+    model = get_sms_log_model()
+    now = timezone.now()
+
+    # Keep only the last report per message id.
+    latest = {report["message_id"]: report for report in reports}
+    groups: dict[str, list[str]] = defaultdict(list)
+    applied: list[dict[str, str]] = []
+    for message_id, report in latest.items():
+        if _delivery_status(report["status_code"]) is None:
+            continue
+        groups[report["status_code"]].append(message_id)
+        applied.append(report)
+
+    rows = model.objects.all()  # type: ignore[attr-defined]
+    if settings.SOLAPI_DELIVERY_REPORT_MAX_AGE_DAYS is not None:
+        rows = rows.filter(
+            created_at__gte=now - timedelta(days=settings.SOLAPI_DELIVERY_REPORT_MAX_AGE_DAYS)
+        )
+    updated = 0
+    for status_code, message_ids in groups.items():
+        delivery_status = _delivery_status(status_code)
+        for start in range(0, len(message_ids), size):
+            chunk = message_ids[start : start + size]
+            delivered_at = Case(
+                *(
+                    When(
+                        message_id=message_id,
+                        then=Value(_received_at(latest[message_id]["date_received"], now)),
+                    )
+                    for message_id in chunk
+                ),
+                default=Value(now),
+                output_field=DateTimeField(),
+            )
+            updated += rows.filter(message_id__in=chunk).update(
+                delivery_status=delivery_status,
+                delivery_status_code=status_code,
+                delivered_at=delivered_at,
+            )
+
+    if applied:
+        sms_delivery_reported.send(sender=model, reports=applied)
+    unmatched = len(applied) - updated
+    if unmatched > 0:
+        logger.warning(
+            "%d of %d delivery reports matched no log row (unknown message id or older than "
+            "SOLAPI_DELIVERY_REPORT_MAX_AGE_DAYS)",
+            unmatched,
+            len(applied),
+        )
+    logger.debug("Applied %d delivery reports to %d log rows", len(applied), updated)
+    return updated
@@ -1,6 +1,46 @@
+from __future__ import annotations
+
+from typing import Any
+
+
 class SolapiSMSConfigError(RuntimeError):
     """Raised when SOLAPI configuration is missing."""
 
 
 class SolapiSMSSendError(RuntimeError):
     """Raised when SOLAPI send fails."""
+
+
+class SolapiSMSTimeoutError(SolapiSMSSendError):
+    """Raised when a SOLAPI send times out or runs past its deadline."""
+
+
+class SolapiSMSAPIError(Exception):
+    """
+    Raised for an HTTP error response from SOLAPI.
+
+    ``args`` are ``(error code, error message)`` as the SDK raises them;
+    ``status_code`` is the HTTP status.
+    """
+
+    def __init__(self, code: str, message: str, status_code: int):
+        super().__init__(code, message)
+        self.status_code = status_code
+
+
+class SolapiSMSQueueFullError(RuntimeError):
+    """Raised when a task backend cannot accept more work."""
+
+
+class SolapiSMSPublishError(RuntimeError):
+    """
+    Raised when publishing chunks of messages failed part-way.
+
+    ``handles`` are the results of the chunks already published,
+    ``unpublished`` the messages of the chunks that were not.
+    """
+
+    def __init__(self, message: str, handles: list[Any], unpublished: list[dict[str, str]]):
+        super().__init__(message)
+        self.handles = handles
+        self.unpublished = unpublished
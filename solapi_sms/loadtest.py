@@ -0,0 +1,390 @@
+"""
+Load generation against a fake SOLAPI transport.
+
+``run_loadtest`` (``manage.py solapi_loadtest``) drives the real
+``enqueue_sms``, ``auth.send_verification_code`` and ``auth.verify_code``
+paths at a target rate. Only the HTTP call is replaced: ``fake_solapi``
+answers send-many requests in process with a configurable latency and
+error rate, so log inserts, verification codes, cache, signals and
+response parsing all run as in production and nothing reaches SOLAPI.
+
+Operations are started open-loop at ``rate`` per second and latency is
+measured from each operation's scheduled start, so a saturated setup shows
+up as growing latency rather than a silently lower rate.
+
+Load test recipients are ``010-0000-xxxx`` numbers (never assigned); their
+log and verification rows are deleted afterwards unless ``keep_rows``.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import math
+import random
+import threading
+import time
+import uuid
+from collections.abc import Callable, Iterator, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+import httpx
+from django.db import connections
+
+from .client import SolapiClient
+from .models import SMSMessageType
+
+OTP = "otp"
+
+# Recipients are PHONE_PREFIX + 4 digits.
+PHONE_PREFIX = "0100000"
+
+_IN_PROCESS_BACKENDS = ("sync", "thread")
+
+
+def parse_mix(value: str) -> dict[str, float]:
+    """
+    Parse "otp:0.7,generic:0.3" into normalized weights.
+
+    Scenarios: "otp" (send a verification code, then verify it) or a
+    message type in lower case ("generic", "login_notification", ...)
+    sent through ``enqueue_sms``.
+    """
+    message_types = {choice.lower() for choice in SMSMessageType.values}
+    weights: dict[str, float] = {}
+    for item in value.split(","):
+        name, _, weight = item.strip().partition(":")
+        name = name.strip().lower()
+        if name != OTP and name not in message_types:
+            raise ValueError(f"Unknown scenario: {name}")
+        weights[name] = float(weight or 1)
+    total = sum(weights.values())
+    if total <= 0:
+        raise ValueError("Scenario weights must add up to more than 0")
+    return {name: weight / total for name, weight in weights.items()}
+
+
+def _fake_send_response(messages: list[dict[str, Any]]) -> dict[str, Any]:
+    """A send-many "detail" response accepting every message."""
+    total = len(messages)
+    cash = {"requested": 0, "replacement": 0, "refund": 0, "sum": 0}
+    return {
+        "groupInfo": {
+            "count": {
+                "total": total,
+                "sentTotal": 0,
+                "sentSuccess": 0,
+                "sentPending": 0,
+                "sentReplacement": 0,
+                "refund": 0,
+                "registeredFailed": 0,
+                "registeredSuccess": total,
+            },
+            "countForCharge": {},
+            "balance": cash,
+            "point": cash,
+            "app": {},
+            "log": [],
+            "status": "SENDING",
+            "allowDuplicates": False,
+            "isRefunded": False,
+            "accountId": "loadtest",
+            "masterAccountId": None,
+            "apiVersion": "4",
+            "groupId": f"G4LOADTEST{uuid.uuid4().hex[:14].upper()}",
+            "price": {},
+            "dateCreated": None,
+            "dateUpdated": None,
+        },
+        "messageList": [
+            {
+                "messageId": f"M4LOADTEST{uuid.uuid4().hex[:14].upper()}",
+                "statusCode": "2000",
+                "statusMessage": "정상 접수(이통사로 접수 예정)",
+                "customFields": message.get("customFields"),
+            }
+            for message in messages
+        ],
+    }
+
+
+@contextlib.contextmanager
+def fake_solapi(
+    latency_ms: float = 50, error_rate: float = 0.0, seed: int | None = None
+) -> Iterator[None]:
+    """
+    Answer SOLAPI sends in process for the duration of the block.
+
+    Each request waits ``latency_ms``; a share ``error_rate`` of them gets
+    a 503, which the send path records as FAILED.
+    """
+    rng = random.Random(seed)  # noqa: S311
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        time.sleep(latency_ms / 1000)
+        if error_rate and rng.random() < error_rate:
+            return httpx.Response(503, text="loadtest: injected failure")
+        messages = json.loads(request.content).get("messages", [])
+        return httpx.Response(200, json=_fake_send_response(messages))
+
+    http = httpx.Client(transport=httpx.MockTransport(handler))
+    original = SolapiClient._get_http_client
+    setattr(SolapiClient, "_get_http_client", lambda self: http)  # noqa: B010
+    try:
+        yield
+    finally:
+        setattr(SolapiClient, "_get_http_client", original)  # noqa: B010
+        http.close()
+
+
+@contextlib.contextmanager
+def _count_queries() -> Iterator[list[int]]:
+    """Count queries this thread runs on any database inside the block."""
+    counter = [0]
+
+    def wrapper(
+        execute: Callable[..., Any], sql: str, params: Any, many: bool, context: Any
+    ) -> Any:
+        counter[0] += 1
+        return execute(sql, params, many, context)
+
+    with contextlib.ExitStack() as stack:
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(wrapper))
+        yield counter
+
+
+class _Stats:
+    """Outcomes of one operation kind."""
+
+    def __init__(self) -> None:
+        self.latencies: list[float] = []
+        self.failed = 0
+        self.errors = 0
+        self.queries = 0
+
+    def add(self, latency: float, ok: bool, error: bool, queries: int) -> None:
+        self.latencies.append(latency)
+        self.failed += not ok and not error
+        self.errors += error
+        self.queries += queries
+
+    def report(self, elapsed: float) -> dict[str, Any]:
+        count = len(self.latencies)
+        ordered = sorted(self.latencies)
+        return {
+            "count": count,
+            "throughput": round(count / elapsed, 2) if elapsed else 0.0,
+            "p50_ms": _percentile(ordered, 50),
+            "p95_ms": _percentile(ordered, 95),
+            "p99_ms": _percentile(ordered, 99),
+            "max_ms": round(ordered[-1] * 1000, 2) if ordered else 0.0,
+            "queries_per_op": round(self.queries / count, 2) if count else 0.0,
+            "failure_rate": round(self.failed / count, 4) if count else 0.0,
+            "error_rate": round(self.errors / count, 4) if count else 0.0,
+        }
+
+
+def _percentile(ordered: list[float], percent: float) -> float:
+    """Nearest-rank percentile of sorted seconds, in milliseconds."""
+    if not ordered:
+        return 0.0
+    rank = max(math.ceil(percent / 100 * len(ordered)), 1)
+    return round(ordered[rank - 1] * 1000, 2)
+
+
+def _succeeded(result: Any) -> bool:
+    return isinstance(result, Mapping) and bool(result.get("success", True))
+
+
+def _timed(
+    stats: dict[str, _Stats],
+    lock: threading.Lock,
+    name: str,
+    started: float,
+    operation: Callable[[], Any],
+) -> Any:
+    result: Any = None
+    error = False
+    with _count_queries() as queries:
+        try:
+            result = operation()
+            if isinstance(result, Future):
+                # Thread backend: the operation ends when the send does.
+                result = result.result()
+        except Exception:
+            error = True
+    latency = time.perf_counter() - started
+    with lock:
+        stats.setdefault(name, _Stats()).add(latency, _succeeded(result), error, queries[0])
+    return result
+
+
+def _run_scenario(
+    scenario: str,
+    index: int,
+    scheduled: float,
+    stats: dict[str, _Stats],
+    lock: threading.Lock,
+) -> None:
+    from . import auth
+    from .tasks import enqueue_sms
+
+    phone = f"{PHONE_PREFIX}{index % 10000:04d}"
+    if scenario != OTP:
+        _timed(
+            stats,
+            lock,
+            scenario,
+            scheduled,
+            lambda: enqueue_sms(phone, f"[loadtest] {index}", scenario.upper()),
+        )
+        return
+    sent = _timed(
+        stats,
+        lock,
+        "otp.send",
+        scheduled,
+        lambda: auth.send_verification_code(phone, rate_limit=False),
+    )
+    if sent and sent.get("success"):
+        code = sent["verification"].code
+        _timed(
+            stats, lock, "otp.verify", time.perf_counter(), lambda: auth.verify_code(phone, code)
+        )
+
+
+def _check_setup() -> None:
+    from .exceptions import SolapiSMSConfigError
+    from .services import SMSService
+    from .tasks import _get_backend_module
+
+    backend = _get_backend_module().__name__.rsplit(".", 1)[-1]
+    if backend not in _IN_PROCESS_BACKENDS:
+        # Worker processes would not see the fake transport and would call SOLAPI.
+        raise SolapiSMSConfigError(
+            f"부하 테스트는 sync/thread 백엔드에서만 실행할 수 있습니다 (현재: {backend})."
+        )
+    if not SMSService()._is_configured():
+        raise SolapiSMSConfigError(
+            "부하 테스트에는 SOLAPI 설정이 필요합니다 (실제 호출은 하지 않으므로 임의 값 가능)."
+        )
+
+
+def _delete_rows() -> None:
+    from .services import get_sms_log_model, get_sms_verification_model
+
+    for model in (get_sms_log_model(), get_sms_verification_model()):
+        model.objects.filter(phone__startswith=PHONE_PREFIX).delete()  # type: ignore[attr-defined]
+
+
+def run_loadtest(
+    *,
+    rate: float,
+    duration: float,
+    mix: Mapping[str, float],
+    concurrency: int = 32,
+    latency_ms: float = 50,
+    error_rate: float = 0.0,
+    seed: int | None = None,
+    keep_rows: bool = False,
+) -> dict[str, Any]:
+    """
+    Run scenarios from ``mix`` at ``rate`` per second for ``duration`` seconds.
+
+    Args:
+        rate: Scenarios started per second
+        duration: Seconds to generate load for
+        mix: Scenario weights, see ``parse_mix``
+        concurrency: Worker threads (1 runs everything in this thread)
+        latency_ms: Fake SOLAPI response time
+        error_rate: Share of fake SOLAPI requests answered with a 503
+        seed: Seed for the scenario choice and injected errors
+        keep_rows: Keep the log and verification rows written by the run
+
+    Returns:
+        dict with the target rate, elapsed time and, per operation
+        ("otp.send", "otp.verify", message types), throughput, latency
+        percentiles, queries per operation and failure/error rates.
+        Queries are counted in the thread running the operation, so sends
+        finished by thread backend workers are not included.
+
+    Raises:
+        SolapiSMSConfigError: Broker-backed task backend or SOLAPI not configured
+    """
+    _check_setup()
+    rng = random.Random(seed)  # noqa: S311
+    scenarios, weights = list(mix), list(mix.values())
+    stats: dict[str, _Stats] = {}
+    lock = threading.Lock()
+    total = int(rate * duration)
+
+    with fake_solapi(latency_ms, error_rate, seed), contextlib.ExitStack() as stack:
+        executor = (
+            stack.enter_context(ThreadPoolExecutor(concurrency, thread_name_prefix="solapi_load"))
+            if concurrency > 1
+            else None
+        )
+        start = time.perf_counter()
+        for index in range(total):
+            scheduled = start + index / rate
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            scenario = rng.choices(scenarios, weights)[0]
+            if executor is None:
+                _run_scenario(scenario, index, scheduled, stats, lock)
+            else:
+                executor.submit(_run_scenario, scenario, index, scheduled, stats, lock)
+        # Leaving the ExitStack waits for submitted scenarios.
+    elapsed = time.perf_counter() - start
+
+    if not keep_rows:
+        _delete_rows()
+    operations = {name: stats[name].report(elapsed) for name in sorted(stats)}
+    overall = _Stats()
+    for item in stats.values():
+        overall.latencies += item.latencies
+        overall.failed += item.failed
+        overall.errors += item.errors
+        overall.queries += item.queries
+    return {
+        "rate": rate,
+        "duration": duration,
+        "concurrency": concurrency,
+        "elapsed": round(elapsed, 3),
+        "mix": dict(mix),
+        "operations": operations,
+        "total": overall.report(elapsed),
+    }
+
+
+def format_table(report: Mapping[str, Any]) -> str:
+    """Render a ``run_loadtest`` report as a text table."""
+    columns = (
+        ("count", "count"),
+        ("ops/s", "throughput"),
+        ("p50 ms", "p50_ms"),
+        ("p95 ms", "p95_ms"),
+        ("p99 ms", "p99_ms"),
+        ("queries/op", "queries_per_op"),
+        ("fail %", "failure_rate"),
+        ("error %", "error_rate"),
+    )
+    rows = [*report["operations"].items(), ("total", report["total"])]
+    width = max(len("operation"), *(len(name) for name, _ in rows))
+    lines = [f"{'operation':<{width}}" + "".join(f"{title:>12}" for title, _ in columns)]
+    for name, values in rows:
+        cells = [values[key] * 100 if key.endswith("_rate") else values[key] for _, key in columns]
+        lines.append(
+            f"{name:<{width}}"
+            + "".join(
+                f"{cell:>12,}" if isinstance(cell, int) else f"{cell:>12,.2f}" for cell in cells
+            )
+        )
+    lines.append(
+        f"target {report['rate']}/s for {report['duration']}s, "
+        f"elapsed {report['elapsed']}s, concurrency {report['concurrency']}"
+    )
+    return "\n".join(lines)
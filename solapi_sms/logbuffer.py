@@ -0,0 +1,234 @@
+"""
+Write-behind buffer for SMSLog rows of single sends.
+
+Configuration:
+    # settings.py
+    SOLAPI_LOG_WRITE_BEHIND = True
+    SOLAPI_LOG_BUFFER_BATCH_SIZE = 500     # flush once this many rows are waiting
+    SOLAPI_LOG_BUFFER_FLUSH_MS = 200       # ... or this long after the last flush
+    SOLAPI_LOG_BUFFER_MAX_ROWS = 10000     # bound; beyond it rows are inserted directly
+    SOLAPI_LOG_BUFFER_MAX_ATTEMPTS = 3     # flushes a rejected row may fail before it is dropped
+
+With write-behind on, ``SMSService._log_result`` (and ``_alog_result``)
+build the log row and hand it to this buffer instead of INSERTing it, so a
+send returns without waiting for the database. A background thread writes
+the rows with ``bulk_create`` and then sends ``sms_logs_flushed``.
+
+Consistency contract:
+    - ``sms_sent`` / ``sms_failed`` receivers get the row before it is
+      saved: ``log.pk`` is None and ``log.created_at`` unset. The same
+      instance gets its pk when flushed (on backends that return ids from
+      bulk inserts: PostgreSQL, SQLite 3.35+, MariaDB 10.5+).
+    - Receivers that need the saved row connect to ``sms_logs_flushed``
+      (``logs``: the saved rows) or call ``flush()`` first.
+    - ``created_at`` is the time of the flush, up to SOLAPI_LOG_BUFFER_FLUSH_MS
+      after the send.
+    - Rows are written outside the caller's transaction: they are kept even
+      if it rolls back.
+
+When a batch insert fails, its rows are inserted one by one so a single bad
+row (a constraint violation, ...) cannot hold back the others; a row the
+database keeps rejecting is logged and dropped after
+SOLAPI_LOG_BUFFER_MAX_ATTEMPTS flushes. Rows a receiver already saved are
+skipped. Connection errors put the rows back at the head of the buffer and
+retry on the next interval; while the buffer is full, new rows are inserted
+directly, so a database outage slows sends down instead of dropping logs.
+The buffer is flushed at interpreter exit (``atexit``, i.e. on SIGTERM/SIGINT shutdown
+of Celery, gunicorn and runserver); rows still waiting when a process is
+killed outright (SIGKILL, OOM) are lost, at most SOLAPI_LOG_BUFFER_MAX_ROWS.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import threading
+from collections import deque
+from typing import TYPE_CHECKING
+
+from django.db import InterfaceError, OperationalError, close_old_connections, router, transaction
+
+from . import settings
+
+if TYPE_CHECKING:
+    from django.db.models import Model
+
+logger = logging.getLogger(__name__)
+
+
+class LogBuffer:
+    """Bounded in-process queue of unsaved log rows of one model, flushed by a thread."""
+
+    def __init__(self, model: type[Model]) -> None:
+        self.model = model
+        self.rows: deque[Model] = deque()
+        self.lock = threading.Lock()
+        self.flush_lock = threading.Lock()
+        self.wakeup = threading.Event()
+        self.stopped = False
+        self.thread: threading.Thread | None = None
+
+    def add(self, row: Model) -> bool:
+        """Queue ``row``; False when the buffer is full and the caller must save it."""
+        with self.lock:
+            if self.stopped or len(self.rows) >= settings.SOLAPI_LOG_BUFFER_MAX_ROWS:
+                return False
+            self.rows.append(row)
+            waiting = len(self.rows)
+            if self.thread is None:
+                self.thread = threading.Thread(
+                    target=self._run, name="solapi-sms-log-buffer", daemon=True
+                )
+                self.thread.start()
+        if waiting >= settings.SOLAPI_LOG_BUFFER_BATCH_SIZE:
+            self.wakeup.set()
+        return True
+
+    def flush(self) -> int:
+        """
+        Write all queued rows now, in batches of SOLAPI_LOG_BUFFER_BATCH_SIZE.
+
+        Returns:
+            Rows written
+
+        Raises:
+            OperationalError: The database is unreachable; the unwritten rows
+                are back in the buffer
+        """
+        from .signals import sms_logs_flushed
+
+        written = 0
+        # Rows to try again on the next flush, requeued once this one ends.
+        retry: list[Model] = []
+        with self.flush_lock:
+            try:
+                while True:
+                    with self.lock:
+                        count = min(len(self.rows), settings.SOLAPI_LOG_BUFFER_BATCH_SIZE)
+                        batch = [self.rows.popleft() for _ in range(count)]
+                    if not batch:
+                        return written
+                    # A receiver may have saved a row itself.
+                    batch = [row for row in batch if row.pk is None]
+                    using = router.db_for_write(self.model)
+                    try:
+                        with transaction.atomic(using=using):
+                            self.model.objects.bulk_create(batch)  # type: ignore[attr-defined]
+                        saved, outage = batch, None
+                    except Exception:
+                        saved, outage = self._insert_each(batch, using, retry)
+                    written += len(saved)
+                    if saved:
+                        sms_logs_flushed.send(sender=self.model, logs=saved)
+                    if outage is not None:
+                        raise outage
+            finally:
+                if retry:
+                    with self.lock:
+                        self.rows.extendleft(reversed(retry))
+
+    def _insert_each(
+        self, batch: list[Model], using: str, retry: list[Model]
+    ) -> tuple[list[Model], Exception | None]:
+        """
+        Insert rows one by one, adding the ones to try again to ``retry``.
+
+        Returns:
+            The saved rows and the connection error that stopped the inserts
+        """
+        saved: list[Model] = []
+        for index, row in enumerate(batch):
+            try:
+                with transaction.atomic(using=using):
+                    row.save(force_insert=True, using=using)
+            except Exception as exc:
+                if isinstance(exc, OperationalError | InterfaceError):
+                    retry.extend(batch[index:])
+                    return saved, exc
+                attempts = row.__dict__.get("_solapi_flush_attempts", 0) + 1
+                if attempts >= settings.SOLAPI_LOG_BUFFER_MAX_ATTEMPTS:
+                    logger.exception("Dropping SMS log row after %d failed flushes", attempts)
+                else:
+                    row.__dict__["_solapi_flush_attempts"] = attempts
+                    retry.append(row)
+            else:
+                saved.append(row)
+        return saved, None
+
+    def _run(self) -> None:
+        while not self.stopped:
+            self.wakeup.wait(settings.SOLAPI_LOG_BUFFER_FLUSH_MS / 1000)
+            self.wakeup.clear()
+            if self.stopped:
+                break
+            close_old_connections()
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("SMS log flush failed, %d rows waiting", len(self.rows))
+
+    def shutdown(self) -> None:
+        """Stop the flusher thread and write what is left from the calling thread."""
+        with self.lock:
+            self.stopped = True
+            thread = self.thread
+        self.wakeup.set()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=settings.SOLAPI_LOG_BUFFER_FLUSH_MS / 1000 + 5)
+        try:
+            self.flush()
+        except Exception:
+            logger.exception("SMS log flush at shutdown failed, %d rows lost", len(self.rows))
+
+
+_buffers: dict[type[Model], LogBuffer] = {}
+_buffers_lock = threading.Lock()
+
+
+def is_enabled() -> bool:
+    return bool(settings.SOLAPI_LOG_WRITE_BEHIND)
+
+
+def get_buffer(model: type[Model]) -> LogBuffer:
+    with _buffers_lock:
+        buffer = _buffers.get(model)
+        if buffer is None:
+            buffer = _buffers[model] = LogBuffer(model)
+        return buffer
+
+
+def buffer_row(row: Model) -> bool:
+    """Queue an unsaved log row; False when it must be saved by the caller instead."""
+    return get_buffer(type(row)).add(row)
+
+
+def pending() -> int:
+    """Rows waiting in this process."""
+    return sum(len(buffer.rows) for buffer in list(_buffers.values()))
+
+
+def flush() -> int:
+    """Write every waiting row now; returns the number written."""
+    return sum(buffer.flush() for buffer in list(_buffers.values()))
+
+
+def shutdown() -> None:
+    """Flush and stop all buffers of this process. Runs at exit."""
+    with _buffers_lock:
+        buffers = list(_buffers.values())
+        _buffers.clear()
+    for buffer in buffers:
+        buffer.shutdown()
+
+
+def _reset_after_fork() -> None:
+    # A forked worker must not write the rows its parent queued, and
+    # does not inherit the parent's flusher thread.
+    global _buffers_lock
+    _buffers.clear()
+    _buffers_lock = threading.Lock()
+
+
+atexit.register(shutdown)
+os.register_at_fork(after_in_child=_reset_after_fork)
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from ...tasks.spool import run_drainer, spool_size
+
+
+class Command(BaseCommand):
+    help = "로컬 스풀에 보관된 SMS를 브로커/SOLAPI 복구 후 배치 단위로 재전송합니다."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--batch-size", type=int, default=None, help="배치당 처리 건수")
+        parser.add_argument("--interval", type=float, default=None, help="대기 간격(초)")
+        parser.add_argument("--once", action="store_true", help="한 번만 재전송 후 종료")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        total = run_drainer(
+            batch_size=options["batch_size"],
+            interval_seconds=options["interval"],
+            once=options["once"],
+        )
+        self.stdout.write(f"스풀 SMS {total}건 처리, {spool_size()}건 대기")
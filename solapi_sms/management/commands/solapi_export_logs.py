@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import sys
+from datetime import datetime
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from ...export import FORMATS, export_logs
+
+
+def _parse_time(value: str | None) -> datetime | None:
+    if not value:
+        return None
+    parsed = parse_datetime(value)
+    if parsed is None:
+        day = parse_date(value)
+        if day is None:
+            raise CommandError(f"날짜 형식이 올바르지 않습니다: {value}")
+        parsed = datetime(day.year, day.month, day.day)
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
+
+class Command(BaseCommand):
+    help = "SMS 발송기록을 CSV/JSONL로 스트리밍 내보냅니다 (메모리 사용량 일정)."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--output", "-o", default="-", help="출력 파일 경로 (기본: stdout)")
+        parser.add_argument("--format", choices=FORMATS, default="csv", help="출력 형식")
+        parser.add_argument("--since", default=None, help="시작 시각 (포함, YYYY-MM-DD 또는 ISO)")
+        parser.add_argument("--until", default=None, help="종료 시각 (미포함)")
+        parser.add_argument("--mask-phone", action="store_true", help="전화번호 마스킹")
+        parser.add_argument("--gzip", action="store_true", help="gzip 압축")
+        parser.add_argument("--batch-size", type=int, default=None, help="조회 배치 크기")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        chunks = export_logs(
+            options["format"],
+            since=_parse_time(options["since"]),
+            until=_parse_time(options["until"]),
+            mask=options["mask_phone"],
+            compress=options["gzip"],
+            batch_size=options["batch_size"],
+        )
+        if options["output"] == "-":
+            for chunk in chunks:
+                sys.stdout.buffer.write(chunk)
+            sys.stdout.buffer.flush()
+            return
+
+        with open(options["output"], "wb") as output:
+            for chunk in chunks:
+                output.write(chunk)
+        self.stderr.write(f"SMS 발송기록을 {options['output']}에 저장했습니다.")
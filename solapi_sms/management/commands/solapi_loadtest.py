@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from ...exceptions import SolapiSMSConfigError
+from ...loadtest import format_table, parse_mix, run_loadtest
+
+
+class Command(BaseCommand):
+    help = (
+        "가짜 SOLAPI 전송으로 enqueue_sms/인증번호 발송·검증 경로에 부하를 걸고 "
+        "처리량, 지연 시간 백분위, 작업당 쿼리 수, 오류율을 보고합니다."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--rate", type=float, default=100, help="초당 시나리오 수")
+        parser.add_argument("--duration", type=float, default=10, help="부하 시간(초)")
+        parser.add_argument(
+            "--mix",
+            default="otp:0.7,generic:0.3",
+            help="시나리오 비율 (otp 또는 메시지 타입 소문자, 예: otp:0.7,generic:0.3)",
+        )
+        parser.add_argument("--concurrency", type=int, default=32, help="작업 스레드 수")
+        parser.add_argument(
+            "--fake-latency-ms", type=float, default=50, help="가짜 SOLAPI 응답 시간(ms)"
+        )
+        parser.add_argument(
+            "--fake-error-rate", type=float, default=0.0, help="가짜 SOLAPI 503 응답 비율"
+        )
+        parser.add_argument("--seed", type=int, default=None, help="난수 시드")
+        parser.add_argument("--json", default=None, help="JSON 보고서 경로 (-: 표준 출력)")
+        parser.add_argument(
+            "--keep-rows", action="store_true", help="부하 테스트 발송기록/인증코드를 남김"
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if options["rate"] <= 0 or options["duration"] <= 0:
+            raise CommandError("--rate와 --duration은 0보다 커야 합니다.")
+        try:
+            mix = parse_mix(options["mix"])
+        except ValueError as exc:
+            raise CommandError(f"잘못된 --mix: {exc}") from exc
+        try:
+            report = run_loadtest(
+                rate=options["rate"],
+                duration=options["duration"],
+                mix=mix,
+                concurrency=options["concurrency"],
+                latency_ms=options["fake_latency_ms"],
+                error_rate=options["fake_error_rate"],
+                seed=options["seed"],
+                keep_rows=options["keep_rows"],
+            )
+        except SolapiSMSConfigError as exc:
+            raise CommandError(str(exc)) from exc
+
+        self.stdout.write(format_table(report))
+        if options["json"] == "-":
+            self.stdout.write(json.dumps(report, ensure_ascii=False, indent=2))
+        elif options["json"]:
+            Path(options["json"]).write_text(
+                json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8"
+            )
+            self.stdout.write(f"JSON 보고서: {options['json']}")
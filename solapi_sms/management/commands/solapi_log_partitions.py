@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from ...exceptions import SolapiSMSConfigError
+from ...partitions import convert, manage_partitions
+
+
+class Command(BaseCommand):
+    help = (
+        "SMS 발송기록 월별 파티션을 미리 만들고 보존 기간이 지난 파티션을 삭제/분리합니다 "
+        "(PostgreSQL, 그 외 DB는 만료된 행을 배치 삭제)."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--convert", action="store_true", help="기존 로그 테이블을 월별 파티션 테이블로 전환"
+        )
+        parser.add_argument("--months-ahead", type=int, default=None, help="미리 만들 개월 수")
+        parser.add_argument(
+            "--retention-months", type=int, default=None, help="보존할 개월 수 (만료 처리 기준)"
+        )
+        parser.add_argument(
+            "--detach", action="store_true", help="만료 파티션을 삭제하지 않고 분리만 함"
+        )
+        parser.add_argument("--dry-run", action="store_true", help="실행할 SQL만 출력")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        try:
+            if options["convert"]:
+                statements = convert(dry_run=options["dry_run"])
+                self._write_statements(statements)
+                if not options["dry_run"]:
+                    self.stdout.write("SMS 발송기록 테이블을 파티션 테이블로 전환했습니다.")
+                return
+            result = manage_partitions(
+                months_ahead=options["months_ahead"],
+                retention_months=options["retention_months"],
+                action="detach" if options["detach"] else None,
+                dry_run=options["dry_run"],
+            )
+        except SolapiSMSConfigError as exc:
+            raise CommandError(str(exc)) from exc
+
+        if options["dry_run"]:
+            self._write_statements(result["statements"])
+        if result["partitioned"]:
+            self.stdout.write(f"만료 파티션 {len(result['expired'])}개 처리")
+        else:
+            self.stdout.write(f"만료된 SMS 발송기록 {result['deleted']}건 삭제")
+
+    def _write_statements(self, statements: list[str]) -> None:
+        for statement in statements:
+            self.stdout.write(f"{statement};")
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from ...delivery import apply_delivery_reports, parse_delivery_reports
+
+
+class Command(BaseCommand):
+    help = "저장된 SOLAPI 수신결과 웹훅 페이로드(JSON/JSONL)를 재생합니다."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("path", help="JSON 배열 또는 JSONL 파일 경로")
+        parser.add_argument(
+            "--url",
+            default=None,
+            help="로컬 반영 대신 이 웹훅 URL로 POST 전송",
+        )
+        parser.add_argument("--batch-size", type=int, default=None, help="UPDATE 배치 크기")
+
+    def _load(self, path: Path) -> list[Any]:
+        text = path.read_text(encoding="utf-8").strip()
+        if text.startswith("["):
+            payload: list[Any] = json.loads(text)
+            return payload
+        return [json.loads(line) for line in text.splitlines() if line.strip()]
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        path = Path(options["path"])
+        if not path.exists():
+            raise CommandError(f"파일이 없습니다: {path}")
+        payload = self._load(path)
+
+        if options["url"]:
+            import httpx
+
+            response = httpx.post(options["url"], json=payload, timeout=30)
+            self.stdout.write(f"POST {options['url']} → {response.status_code} {response.text}")
+            return
+
+        reports = parse_delivery_reports(payload)
+        updated = apply_delivery_reports(reports, batch_size=options["batch_size"])
+        self.stdout.write(f"수신결과 {len(reports)}건 재생, SMSLog {updated}건 갱신")
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from ...scheduler import run_scheduler
+
+
+class Command(BaseCommand):
+    help = "예약된 SMS 중 발송 시간이 된 메시지를 배치 단위로 발송합니다."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--batch-size", type=int, default=None, help="틱당 처리 건수")
+        parser.add_argument("--interval", type=float, default=None, help="대기 간격(초)")
+        parser.add_argument("--once", action="store_true", help="현재 대상만 처리 후 종료")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        total = run_scheduler(
+            batch_size=options["batch_size"],
+            interval_seconds=options["interval"],
+            once=options["once"],
+        )
+        self.stdout.write(f"예약 SMS {total}건 처리")
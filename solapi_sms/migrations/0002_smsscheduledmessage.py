@@ -0,0 +1,73 @@
+# Generated by Django 6.0 on 2026-10-19 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("solapi_sms", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SMSScheduledMessage",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("phone", models.CharField(max_length=20, verbose_name="수신번호")),
+                ("message", models.TextField(verbose_name="메시지 내용")),
+                (
+                    "message_type",
+                    models.CharField(
+                        choices=[
+                            ("VERIFICATION", "인증코드"),
+                            ("LOGIN_NOTIFICATION", "로그인 알림"),
+                            ("WELCOME", "회원가입 환영"),
+                            ("GENERIC", "일반"),
+                        ],
+                        default="GENERIC",
+                        max_length=30,
+                        verbose_name="메시지 타입",
+                    ),
+                ),
+                ("send_at", models.DateTimeField(verbose_name="예약발송시간")),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("PENDING", "대기"),
+                            ("PROCESSING", "처리중"),
+                            ("SENT", "발송완료"),
+                            ("FAILED", "실패"),
+                            ("CANCELED", "취소"),
+                        ],
+                        default="PENDING",
+                        max_length=20,
+                        verbose_name="예약상태",
+                    ),
+                ),
+                (
+                    "claimed_at",
+                    models.DateTimeField(blank=True, null=True, verbose_name="처리시작시간"),
+                ),
+                (
+                    "processed_at",
+                    models.DateTimeField(blank=True, null=True, verbose_name="처리완료시간"),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True, verbose_name="생성시간")),
+            ],
+            options={
+                "verbose_name": "SMS 예약발송",
+                "verbose_name_plural": "SMS 예약발송",
+                "ordering": ["send_at"],
+                "abstract": False,
+                "indexes": [
+                    models.Index(fields=["status", "send_at"], name="solapi_sms__status_7b2c6c_idx")
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 6.0 on 2026-10-19 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("solapi_sms", "0002_smsscheduledmessage"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="smslog",
+            name="delivered_at",
+            field=models.DateTimeField(blank=True, null=True, verbose_name="수신결과 시간"),
+        ),
+        migrations.AddField(
+            model_name="smslog",
+            name="delivery_status",
+            field=models.CharField(
+                blank=True,
+                choices=[("DELIVERED", "수신완료"), ("UNDELIVERED", "수신실패")],
+                default="",
+                max_length=20,
+                verbose_name="수신상태",
+            ),
+        ),
+        migrations.AddField(
+            model_name="smslog",
+            name="delivery_status_code",
+            field=models.CharField(
+                blank=True, default="", max_length=10, verbose_name="수신결과 코드"
+            ),
+        ),
+        migrations.AddField(
+            model_name="smslog",
+            name="message_id",
+            field=models.CharField(
+                blank=True,
+                db_index=True,
+                default="",
+                max_length=50,
+                verbose_name="SOLAPI 메시지 ID",
+            ),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 6.0 on 2026-10-19 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("solapi_sms", "0003_smslog_delivery_status"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="smslog",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("SUCCESS", "성공"),
+                    ("FAILED", "실패"),
+                    ("TIMEOUT", "시간초과"),
+                    ("SKIPPED", "스킵"),
+                ],
+                max_length=20,
+                verbose_name="발송상태",
+            ),
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 6.0 on 2026-10-19 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("solapi_sms", "0004_smslog_timeout_status"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SMSTemplateVersion",
+            fields=[
+                (
+                    "version",
+                    models.CharField(
+                        max_length=16, primary_key=True, serialize=False, verbose_name="버전"
+                    ),
+                ),
+                ("template_key", models.CharField(max_length=50, verbose_name="템플릿 키")),
+                ("template", models.TextField(verbose_name="템플릿")),
+                ("created_at", models.DateTimeField(auto_now_add=True, verbose_name="생성시간")),
+            ],
+            options={
+                "verbose_name": "SMS 템플릿 버전",
+                "verbose_name_plural": "SMS 템플릿 버전",
+            },
+        ),
+        migrations.AddField(
+            model_name="smslog",
+            name="template_key",
+            field=models.CharField(blank=True, default="", max_length=50, verbose_name="템플릿 키"),
+        ),
+        migrations.AddField(
+            model_name="smslog",
+            name="template_params",
+            field=models.JSONField(blank=True, null=True, verbose_name="템플릿 파라미터"),
+        ),
+        migrations.AddField(
+            model_name="smslog",
+            name="template_version",
+            field=models.CharField(
+                blank=True, default="", max_length=16, verbose_name="템플릿 버전"
+            ),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 6.0 on 2026-10-19 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("solapi_sms", "0005_smslog_template_reference"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="smslog",
+            name="next_retry_at",
+            field=models.DateTimeField(
+                blank=True, db_index=True, null=True, verbose_name="다음 재시도 시간"
+            ),
+        ),
+        migrations.AddField(
+            model_name="smslog",
+            name="retry_count",
+            field=models.PositiveIntegerField(default=0, verbose_name="재시도 횟수"),
+        ),
+    ]
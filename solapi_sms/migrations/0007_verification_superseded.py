@@ -0,0 +1,25 @@
+# Generated by Django 6.0 on 2026-10-19 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("solapi_sms", "0006_smslog_retry"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="smsverificationcode",
+            name="superseded_at",
+            field=models.DateTimeField(blank=True, null=True, verbose_name="대체된 시간"),
+        ),
+        migrations.AddIndex(
+            model_name="smsverificationcode",
+            index=models.Index(
+                condition=models.Q(("superseded_at__isnull", True), ("verified_at__isnull", True)),
+                fields=["phone", "-created_at"],
+                name="solapi_sms_verif_active_idx",
+            ),
+        ),
+    ]
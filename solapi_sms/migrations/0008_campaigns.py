@@ -0,0 +1,126 @@
+# Generated by Django 6.0 on 2026-10-19 12:00
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("solapi_sms", "0007_verification_superseded"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SMSCampaign",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("name", models.CharField(max_length=100, verbose_name="이름")),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("RUNNING", "발송중"),
+                            ("PAUSED", "일시정지"),
+                            ("CANCELED", "취소"),
+                            ("COMPLETED", "완료"),
+                        ],
+                        default="RUNNING",
+                        max_length=20,
+                        verbose_name="상태",
+                    ),
+                ),
+                ("total", models.PositiveIntegerField(default=0, verbose_name="전체 건수")),
+                ("created_at", models.DateTimeField(auto_now_add=True, verbose_name="생성시간")),
+                (
+                    "finished_at",
+                    models.DateTimeField(blank=True, null=True, verbose_name="종료시간"),
+                ),
+            ],
+            options={
+                "verbose_name": "SMS 캠페인",
+                "verbose_name_plural": "SMS 캠페인",
+                "ordering": ["-created_at"],
+            },
+        ),
+        migrations.AddField(
+            model_name="smslog",
+            name="campaign",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to="solapi_sms.smscampaign",
+                verbose_name="캠페인",
+            ),
+        ),
+        migrations.CreateModel(
+            name="SMSCampaignChunk",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("messages", models.JSONField(verbose_name="메시지")),
+                ("created_at", models.DateTimeField(auto_now_add=True, verbose_name="생성시간")),
+                (
+                    "campaign",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="held_chunks",
+                        to="solapi_sms.smscampaign",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "SMS 캠페인 보류 묶음",
+                "verbose_name_plural": "SMS 캠페인 보류 묶음",
+            },
+        ),
+        migrations.CreateModel(
+            name="SMSCampaignCounter",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("shard", models.PositiveSmallIntegerField(verbose_name="샤드")),
+                ("sent", models.PositiveIntegerField(default=0, verbose_name="성공")),
+                ("failed", models.PositiveIntegerField(default=0, verbose_name="실패")),
+                ("skipped", models.PositiveIntegerField(default=0, verbose_name="스킵")),
+                (
+                    "updated_at",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now, verbose_name="갱신시간"
+                    ),
+                ),
+                (
+                    "campaign",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="counters",
+                        to="solapi_sms.smscampaign",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "SMS 캠페인 카운터",
+                "verbose_name_plural": "SMS 캠페인 카운터",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("campaign", "shard"), name="solapi_sms_campaign_counter_uniq"
+                    )
+                ],
+            },
+        ),
+    ]
@@ -1,20 +1,29 @@
 from __future__ import annotations
 
+import hashlib
 from datetime import timedelta
 from typing import Self
 
 from django.db import models
+from django.db.models import Q
 from django.utils import timezone
 
 from . import settings
+from .utils import build_message
 
 
 class SMSLogStatus(models.TextChoices):
     SUCCESS = "SUCCESS", "성공"
     FAILED = "FAILED", "실패"
+    TIMEOUT = "TIMEOUT", "시간초과"
     SKIPPED = "SKIPPED", "스킵"
 
 
+class SMSDeliveryStatus(models.TextChoices):
+    DELIVERED = "DELIVERED", "수신완료"
+    UNDELIVERED = "UNDELIVERED", "수신실패"
+
+
 class SMSMessageType(models.TextChoices):
     VERIFICATION = "VERIFICATION", "인증코드"
     LOGIN_NOTIFICATION = "LOGIN_NOTIFICATION", "로그인 알림"
@@ -22,6 +31,21 @@ class SMSMessageType(models.TextChoices):
     GENERIC = "GENERIC", "일반"
 
 
+class SMSScheduledStatus(models.TextChoices):
+    PENDING = "PENDING", "대기"
+    PROCESSING = "PROCESSING", "처리중"
+    SENT = "SENT", "발송완료"
+    FAILED = "FAILED", "실패"
+    CANCELED = "CANCELED", "취소"
+
+
+class SMSCampaignStatus(models.TextChoices):
+    RUNNING = "RUNNING", "발송중"
+    PAUSED = "PAUSED", "일시정지"
+    CANCELED = "CANCELED", "취소"
+    COMPLETED = "COMPLETED", "완료"
+
+
 class AbstractSMSLog(models.Model):
     phone = models.CharField("수신번호", max_length=20, db_index=True)
     message = models.TextField("메시지 내용")
@@ -38,6 +62,34 @@ class AbstractSMSLog(models.Model):
     )
     response_data = models.JSONField("응답 데이터", null=True, blank=True)
     error_message = models.TextField("에러 메시지", blank=True, default="")
+    message_id = models.CharField(
+        "SOLAPI 메시지 ID", max_length=50, blank=True, default="", db_index=True
+    )
+    delivery_status = models.CharField(
+        "수신상태",
+        max_length=20,
+        choices=SMSDeliveryStatus.choices,
+        blank=True,
+        default="",
+    )
+    delivery_status_code = models.CharField("수신결과 코드", max_length=10, blank=True, default="")
+    delivered_at = models.DateTimeField("수신결과 시간", null=True, blank=True)
+    # Set instead of ``message`` when logged with SOLAPI_LOG_TEMPLATE_REFERENCES.
+    template_key = models.CharField("템플릿 키", max_length=50, blank=True, default="")
+    template_version = models.CharField("템플릿 버전", max_length=16, blank=True, default="")
+    template_params = models.JSONField("템플릿 파라미터", null=True, blank=True)
+    # DB-driven retries (see solapi_sms.retries)
+    retry_count = models.PositiveIntegerField("재시도 횟수", default=0)
+    next_retry_at = models.DateTimeField("다음 재시도 시간", null=True, blank=True, db_index=True)
+    campaign = models.ForeignKey(
+        "solapi_sms.SMSCampaign",
+        verbose_name="캠페인",
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name="+",
+        db_index=True,
+    )
     created_at = models.DateTimeField("발송시간", auto_now_add=True, db_index=True)
 
     class Meta:
@@ -47,6 +99,20 @@ class AbstractSMSLog(models.Model):
     def __str__(self) -> str:
         return f"{self.phone} - {self.message_type} - {self.status}"
 
+    @property
+    def rendered_message(self) -> str:
+        """Message text, rebuilt from the template version for rows logged by reference."""
+        if self.message or not self.template_version:
+            return self.message
+        template = (
+            SMSTemplateVersion.objects.filter(version=self.template_version)
+            .values_list("template", flat=True)
+            .first()
+        )
+        if template is None:
+            return ""
+        return build_message(template, **(self.template_params or {}))
+
 
 class SMSLog(AbstractSMSLog):
     class Meta(AbstractSMSLog.Meta):
@@ -54,12 +120,99 @@ class SMSLog(AbstractSMSLog):
         verbose_name_plural = "SMS 발송기록"
 
 
+class SMSTemplateVersion(models.Model):
+    """Template text referenced by SMSLog rows logged with SOLAPI_LOG_TEMPLATE_REFERENCES."""
+
+    version = models.CharField("버전", max_length=16, primary_key=True)
+    template_key = models.CharField("템플릿 키", max_length=50)
+    template = models.TextField("템플릿")
+    created_at = models.DateTimeField("생성시간", auto_now_add=True)
+
+    class Meta:
+        verbose_name = "SMS 템플릿 버전"
+        verbose_name_plural = "SMS 템플릿 버전"
+
+    def __str__(self) -> str:
+        return f"{self.template_key} - {self.version}"
+
+    @staticmethod
+    def version_of(template: str) -> str:
+        return hashlib.sha256(template.encode()).hexdigest()[:16]
+
+
+class SMSCampaign(models.Model):
+    """
+    A large send tracked as one unit (see solapi_sms.campaigns).
+
+    Progress is summed from ``SMSCampaignCounter`` shards, so workers
+    never update this row while the campaign runs.
+    """
+
+    name = models.CharField("이름", max_length=100)
+    status = models.CharField(
+        "상태",
+        max_length=20,
+        choices=SMSCampaignStatus.choices,
+        default=SMSCampaignStatus.RUNNING,
+    )
+    total = models.PositiveIntegerField("전체 건수", default=0)
+    created_at = models.DateTimeField("생성시간", auto_now_add=True)
+    finished_at = models.DateTimeField("종료시간", null=True, blank=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+        verbose_name = "SMS 캠페인"
+        verbose_name_plural = "SMS 캠페인"
+
+    def __str__(self) -> str:
+        return f"{self.name} - {self.status}"
+
+
+class SMSCampaignCounter(models.Model):
+    """One of up to SOLAPI_CAMPAIGN_COUNTER_SHARDS counter rows of a campaign."""
+
+    campaign = models.ForeignKey(SMSCampaign, on_delete=models.CASCADE, related_name="counters")
+    shard = models.PositiveSmallIntegerField("샤드")
+    sent = models.PositiveIntegerField("성공", default=0)
+    failed = models.PositiveIntegerField("실패", default=0)
+    skipped = models.PositiveIntegerField("스킵", default=0)
+    updated_at = models.DateTimeField("갱신시간", default=timezone.now)
+
+    class Meta:
+        verbose_name = "SMS 캠페인 카운터"
+        verbose_name_plural = "SMS 캠페인 카운터"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["campaign", "shard"], name="solapi_sms_campaign_counter_uniq"
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.campaign_id} #{self.shard}"
+
+
+class SMSCampaignChunk(models.Model):
+    """Messages a worker picked up while their campaign was paused; republished on resume."""
+
+    campaign = models.ForeignKey(SMSCampaign, on_delete=models.CASCADE, related_name="held_chunks")
+    messages = models.JSONField("메시지")
+    created_at = models.DateTimeField("생성시간", auto_now_add=True)
+
+    class Meta:
+        verbose_name = "SMS 캠페인 보류 묶음"
+        verbose_name_plural = "SMS 캠페인 보류 묶음"
+
+    def __str__(self) -> str:
+        return f"{self.campaign_id} - {len(self.messages)}"
+
+
 class AbstractSMSVerificationCode(models.Model):
     phone = models.CharField("전화번호", max_length=20, db_index=True)
     code = models.CharField("인증코드", max_length=6)
     created_at = models.DateTimeField("생성시간", auto_now_add=True)
     expires_at = models.DateTimeField("만료시간", db_index=True)
     verified_at = models.DateTimeField("인증완료시간", null=True, blank=True)
+    superseded_at = models.DateTimeField("대체된 시간", null=True, blank=True)
     attempts = models.PositiveIntegerField("시도 횟수", default=0)
 
     class Meta:
@@ -80,9 +233,18 @@ class AbstractSMSVerificationCode(models.Model):
     def is_verified(self) -> bool:
         return self.verified_at is not None
 
+    @property
+    def is_superseded(self) -> bool:
+        return self.superseded_at is not None
+
     def is_valid(self, max_attempts: int | None = None) -> bool:
         max_attempts = max_attempts or settings.SOLAPI_VERIFICATION_MAX_ATTEMPTS
-        return not self.is_expired and not self.is_verified and self.attempts < max_attempts
+        return (
+            not self.is_expired
+            and not self.is_verified
+            and not self.is_superseded
+            and self.attempts < max_attempts
+        )
 
     def mark_attempt(self) -> None:
         self.attempts += 1
@@ -92,17 +254,102 @@ class AbstractSMSVerificationCode(models.Model):
         self.verified_at = timezone.now()
         self.save(update_fields=["verified_at"])
 
+    async def amark_attempt(self) -> None:
+        self.attempts += 1
+        await self.asave(update_fields=["attempts"])
+
+    async def amark_verified(self) -> None:
+        self.verified_at = timezone.now()
+        await self.asave(update_fields=["verified_at"])
+
+    @classmethod
+    def active(cls, phone: str) -> models.QuerySet[Self]:
+        """
+        Codes for ``phone`` that are neither verified nor superseded.
+
+        At most one row per phone matches, found through the partial
+        ``active_verification_index`` where the database supports it.
+        """
+        return cls.objects.filter(  # type: ignore[attr-defined, no-any-return]
+            phone=phone, verified_at__isnull=True, superseded_at__isnull=True
+        )
+
     @classmethod
     def create_verification(cls, phone: str, code: str, ttl_seconds: int | None = None) -> Self:
         ttl = ttl_seconds or settings.SOLAPI_VERIFICATION_TTL_SECONDS
         expires_at = timezone.now() + timedelta(seconds=ttl)
-        cls.objects.filter(phone=phone, verified_at__isnull=True).update(  # type: ignore[attr-defined]
-            verified_at=timezone.now()
-        )
+        cls.active(phone).update(superseded_at=timezone.now())
         return cls.objects.create(phone=phone, code=code, expires_at=expires_at)  # type: ignore[attr-defined, no-any-return]
 
+    @classmethod
+    async def acreate_verification(
+        cls, phone: str, code: str, ttl_seconds: int | None = None
+    ) -> Self:
+        ttl = ttl_seconds or settings.SOLAPI_VERIFICATION_TTL_SECONDS
+        expires_at = timezone.now() + timedelta(seconds=ttl)
+        await cls.active(phone).aupdate(superseded_at=timezone.now())
+        return await cls.objects.acreate(phone=phone, code=code, expires_at=expires_at)  # type: ignore[attr-defined, no-any-return]
+
+
+def active_verification_index(name: str) -> models.Index:
+    """
+    Partial index on a verification model's active codes.
+
+    Lookups and superseding only ever touch the newest unverified code of a
+    phone, so the index holds one entry per phone with a pending code
+    instead of every code ever sent. Databases without partial indexes
+    (MySQL) skip it and use the plain ``(phone, -created_at)`` index.
+    Custom verification models add it to their own ``Meta.indexes``.
+    """
+    return models.Index(
+        fields=["phone", "-created_at"],
+        condition=Q(verified_at__isnull=True, superseded_at__isnull=True),
+        name=name,
+    )
+
 
 class SMSVerificationCode(AbstractSMSVerificationCode):
     class Meta(AbstractSMSVerificationCode.Meta):
         verbose_name = "SMS 인증코드"
         verbose_name_plural = "SMS 인증코드"
+        indexes = [
+            *AbstractSMSVerificationCode.Meta.indexes,
+            active_verification_index("solapi_sms_verif_active_idx"),
+        ]
+
+
+class AbstractSMSScheduledMessage(models.Model):
+    phone = models.CharField("수신번호", max_length=20)
+    message = models.TextField("메시지 내용")
+    message_type = models.CharField(
+        "메시지 타입",
+        max_length=30,
+        choices=SMSMessageType.choices,
+        default=SMSMessageType.GENERIC,
+    )
+    send_at = models.DateTimeField("예약발송시간")
+    status = models.CharField(
+        "예약상태",
+        max_length=20,
+        choices=SMSScheduledStatus.choices,
+        default=SMSScheduledStatus.PENDING,
+    )
+    claimed_at = models.DateTimeField("처리시작시간", null=True, blank=True)
+    processed_at = models.DateTimeField("처리완료시간", null=True, blank=True)
+    created_at = models.DateTimeField("생성시간", auto_now_add=True)
+
+    class Meta:
+        abstract = True
+        ordering = ["send_at"]
+        indexes = [
+            models.Index(fields=["status", "send_at"]),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.phone} - {self.send_at} - {self.status}"
+
+
+class SMSScheduledMessage(AbstractSMSScheduledMessage):
+    class Meta(AbstractSMSScheduledMessage.Meta):
+        verbose_name = "SMS 예약발송"
+        verbose_name_plural = "SMS 예약발송"
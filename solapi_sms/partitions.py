@@ -0,0 +1,309 @@
+"""
+Monthly range partitioning of the SMS log table (PostgreSQL).
+
+Configuration:
+    # settings.py
+    SOLAPI_LOG_PARTITION_MONTHS_AHEAD = 3        # partitions created ahead of time
+    SOLAPI_LOG_RETENTION_MONTHS = 12             # None keeps every row (default)
+    SOLAPI_LOG_PARTITION_EXPIRE_ACTION = "drop"  # or "detach" to keep expired months as tables
+
+Usage:
+    python manage.py solapi_log_partitions --convert  # once: partition the existing table
+    python manage.py solapi_log_partitions            # daily: add future months, expire old ones
+
+``--convert`` renames the log table to the current month's partition,
+creates a parent table ``PARTITION BY RANGE (created_at)`` with the same
+columns, indexes and foreign keys, and attaches the old table as the
+partition holding everything before next month. The primary key of the
+parent becomes ``(id, created_at)``, as PostgreSQL requires the partition
+key in unique constraints; ``id`` keeps coming from a sequence continuing
+the old ids. The table is locked during the conversion, and attaching
+scans the old rows once.
+
+The legacy partition is bounded ``FROM (MINVALUE)``, so it holds all
+history from before the conversion but is named after the conversion
+month. It is therefore expired as a whole, and only once the conversion
+month itself leaves the retention: until then its old rows are kept past
+SOLAPI_LOG_RETENTION_MONTHS (trim them with a DELETE before converting if
+that matters).
+
+Partitions are named ``<table>_pYYYYMM`` and cover one calendar month in
+UTC. Expiring a month is a ``DROP TABLE`` or ``DETACH PARTITION``: a
+catalog change instead of a long DELETE. Queries that filter on
+``created_at`` (admin date hierarchy, exports, delivery reports once
+SOLAPI_DELIVERY_REPORT_MAX_AGE_DAYS is set) only touch the matching
+partitions.
+
+On other databases, or before ``--convert``, rows older than the retention
+are deleted in batches of SOLAPI_LOG_RETENTION_DELETE_BATCH_SIZE instead.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+
+from django.db import connections, models, router, transaction
+from django.utils import timezone
+
+from . import settings
+from .exceptions import SolapiSMSConfigError
+from .services import get_sms_log_model
+
+if TYPE_CHECKING:
+    from django.db.backends.base.base import BaseDatabaseWrapper
+    from django.db.models import Model
+
+logger = logging.getLogger(__name__)
+
+PARTITION_KEY = "created_at"
+
+
+def month_start(value: datetime) -> datetime:
+    """First instant of ``value``'s month, in UTC."""
+    value = value.astimezone(UTC)
+    return datetime(value.year, value.month, 1, tzinfo=UTC)
+
+
+def add_months(month: datetime, months: int) -> datetime:
+    """``month`` (a month start) shifted by ``months``."""
+    index = month.year * 12 + month.month - 1 + months
+    return datetime(index // 12, index % 12 + 1, 1, tzinfo=UTC)
+
+
+def partition_name(table: str, month: datetime) -> str:
+    return f"{table}_p{month:%Y%m}"
+
+
+def partition_month(table: str, name: str) -> datetime | None:
+    """Month a partition named by ``partition_name`` covers, or None for other tables."""
+    matched = re.fullmatch(re.escape(table) + r"_p(\d{4})(\d{2})", name)
+    if matched is None:
+        return None
+    return datetime(int(matched[1]), int(matched[2]), 1, tzinfo=UTC)
+
+
+def retention_cutoff(retention_months: int, now: datetime | None = None) -> datetime:
+    """Rows created before this are expired: ``retention_months`` full months are kept."""
+    return add_months(month_start(now or timezone.now()), -retention_months)
+
+
+def expired_partitions(table: str, names: list[str], cutoff: datetime) -> list[str]:
+    """Partitions whose whole month lies before ``cutoff``, oldest first."""
+    months = {name: partition_month(table, name) for name in names}
+    return sorted(
+        name
+        for name, month in months.items()
+        if month is not None and add_months(month, 1) <= cutoff
+    )
+
+
+def _connection(model: type[Model]) -> BaseDatabaseWrapper:
+    return connections[router.db_for_write(model)]
+
+
+def is_partitioned(model: type[Model]) -> bool:
+    """True when the model's table is a PostgreSQL partitioned table."""
+    connection = _connection(model)
+    if connection.vendor != "postgresql":
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(%s))",
+            [model._meta.db_table],
+        )
+        return bool(cursor.fetchone()[0])
+
+
+def list_partitions(model: type[Model]) -> list[str]:
+    """Names of the partitions attached to the model's table."""
+    with _connection(model).cursor() as cursor:
+        cursor.execute(
+            "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = to_regclass(%s) ORDER BY c.relname",
+            [model._meta.db_table],
+        )
+        return [row[0] for row in cursor.fetchall()]
+
+
+def _bound(month: datetime) -> str:
+    return f"'{month.isoformat()}'"
+
+
+def create_statements(
+    model: type[Model], months_ahead: int, now: datetime | None = None
+) -> list[str]:
+    """SQL creating the partitions of this month and the next ``months_ahead`` months."""
+    quote = _connection(model).ops.quote_name
+    table = model._meta.db_table
+    current = month_start(now or timezone.now())
+    statements = []
+    for offset in range(months_ahead + 1):
+        month = add_months(current, offset)
+        statements.append(
+            f"CREATE TABLE IF NOT EXISTS {quote(partition_name(table, month))} "
+            f"PARTITION OF {quote(table)} "
+            f"FOR VALUES FROM ({_bound(month)}) TO ({_bound(add_months(month, 1))})"
+        )
+    return statements
+
+
+def expire_statements(model: type[Model], names: list[str], action: str) -> list[str]:
+    """SQL dropping or detaching the partitions ``names``."""
+    if action not in ("drop", "detach"):
+        raise SolapiSMSConfigError(
+            f"SOLAPI_LOG_PARTITION_EXPIRE_ACTION={action!r}: 'drop' 또는 'detach'여야 합니다."
+        )
+    quote = _connection(model).ops.quote_name
+    if action == "drop":
+        return [f"DROP TABLE {quote(name)}" for name in names]
+    table = quote(model._meta.db_table)
+    return [f"ALTER TABLE {table} DETACH PARTITION {quote(name)}" for name in names]
+
+
+def convert_statements(model: type[Model], now: datetime | None = None) -> list[str]:
+    """SQL turning the model's plain table into a partitioned one (see module docstring)."""
+    connection = _connection(model)
+    quote = connection.ops.quote_name
+    opts = model._meta
+    table = opts.db_table
+    month = month_start(now or timezone.now())
+    current = partition_name(table, month)
+    pk = str(opts.pk.column)
+    sequence = f"{table}_{pk}_part_seq"
+    statements = [
+        f"LOCK TABLE {quote(table)} IN ACCESS EXCLUSIVE MODE",
+        f"ALTER TABLE {quote(table)} RENAME TO {quote(current)}",
+        f"ALTER TABLE {quote(current)} ALTER COLUMN {quote(pk)} DROP IDENTITY IF EXISTS",
+        f"ALTER TABLE {quote(current)} ALTER COLUMN {quote(pk)} DROP DEFAULT",
+        f"CREATE TABLE {quote(table)} (LIKE {quote(current)} INCLUDING DEFAULTS "
+        f"INCLUDING CONSTRAINTS) PARTITION BY RANGE ({quote(PARTITION_KEY)})",
+        f"ALTER TABLE {quote(table)} ADD PRIMARY KEY ({quote(pk)}, {quote(PARTITION_KEY)})",
+        f"CREATE SEQUENCE {quote(sequence)} OWNED BY {quote(table)}.{quote(pk)}",
+        f"SELECT setval('{sequence}', "  # noqa: S608
+        f"(SELECT COALESCE(MAX({quote(pk)}), 0) + 1 FROM {quote(current)}), false)",
+        f"ALTER TABLE {quote(table)} ALTER COLUMN {quote(pk)} SET DEFAULT nextval('{sequence}')",
+    ]
+    for field in opts.local_fields:
+        column = str(field.column)
+        if field.primary_key:
+            continue
+        if getattr(field, "db_index", False):
+            statements.append(f"CREATE INDEX ON {quote(table)} ({quote(column)})")
+        if isinstance(field, models.ForeignKey) and getattr(field, "db_constraint", True):
+            target: Any = field.foreign_related_fields[0]
+            statements.append(
+                f"ALTER TABLE {quote(table)} ADD FOREIGN KEY ({quote(column)}) "
+                f"REFERENCES {quote(target.model._meta.db_table)} ({quote(target.column)}) "
+                "DEFERRABLE INITIALLY DEFERRED"
+            )
+    with connection.schema_editor(collect_sql=True) as editor:
+        for index in opts.indexes:
+            # The old table keeps its index under a new name, the parent's takes the original.
+            statements.append(
+                f"ALTER INDEX {quote(index.name)} RENAME TO "
+                f"{quote(f'{index.name[:50]}_p{month:%Y%m}')}"
+            )
+            statements.append(str(index.create_sql(model, editor)))
+    statements.append(
+        f"ALTER TABLE {quote(table)} ATTACH PARTITION {quote(current)} "
+        f"FOR VALUES FROM (MINVALUE) TO ({_bound(add_months(month, 1))})"
+    )
+    return statements
+
+
+def _execute(model: type[Model], statements: list[str]) -> None:
+    alias = router.db_for_write(model)
+    with transaction.atomic(using=alias), connections[alias].cursor() as cursor:
+        for statement in statements:
+            cursor.execute(statement)
+
+
+def convert(*, dry_run: bool = False, now: datetime | None = None) -> list[str]:
+    """
+    Partition the log table by month, creating SOLAPI_LOG_PARTITION_MONTHS_AHEAD months ahead.
+
+    Returns:
+        The SQL executed (or that would be, with ``dry_run``)
+
+    Raises:
+        SolapiSMSConfigError: Not PostgreSQL, or already partitioned
+    """
+    model = get_sms_log_model()
+    if _connection(model).vendor != "postgresql":
+        raise SolapiSMSConfigError("SMS 로그 파티셔닝은 PostgreSQL에서만 지원됩니다.")
+    if is_partitioned(model):
+        raise SolapiSMSConfigError(f"{model._meta.db_table}은(는) 이미 파티션 테이블입니다.")
+    now = now or timezone.now()
+    statements = convert_statements(model, now) + create_statements(
+        model, settings.SOLAPI_LOG_PARTITION_MONTHS_AHEAD, now
+    )
+    if not dry_run:
+        _execute(model, statements)
+        logger.info("Converted %s to a partitioned table", model._meta.db_table)
+    return statements
+
+
+def delete_expired_rows(cutoff: datetime, *, batch_size: int | None = None) -> int:
+    """Delete log rows created before ``cutoff`` in batches (non-partitioned fallback)."""
+    model = get_sms_log_model()
+    size = batch_size or settings.SOLAPI_LOG_RETENTION_DELETE_BATCH_SIZE
+    expired = model.objects.filter(created_at__lt=cutoff)  # type: ignore[attr-defined]
+    deleted = 0
+    while pks := list(expired.values_list("pk", flat=True)[:size]):
+        deleted += model.objects.filter(pk__in=pks).delete()[0]  # type: ignore[attr-defined]
+    return deleted
+
+
+def manage_partitions(
+    *,
+    months_ahead: int | None = None,
+    retention_months: int | None = None,
+    action: str | None = None,
+    dry_run: bool = False,
+    now: datetime | None = None,
+) -> dict[str, Any]:
+    """
+    Create upcoming partitions and expire old ones; delete old rows when not partitioned.
+
+    Args:
+        months_ahead: Months created ahead (default SOLAPI_LOG_PARTITION_MONTHS_AHEAD)
+        retention_months: Full months kept (default SOLAPI_LOG_RETENTION_MONTHS, None: keep all)
+        action: "drop" or "detach" (default SOLAPI_LOG_PARTITION_EXPIRE_ACTION)
+        dry_run: Only return the SQL; the fallback counts rows instead of deleting them
+        now: Reference time (default: now)
+
+    Returns:
+        dict with 'partitioned', 'statements', 'expired' (partition names) and
+        'deleted' (rows removed by the fallback)
+    """
+    model = get_sms_log_model()
+    now = now or timezone.now()
+    if months_ahead is None:
+        months_ahead = settings.SOLAPI_LOG_PARTITION_MONTHS_AHEAD
+    if retention_months is None:
+        retention_months = settings.SOLAPI_LOG_RETENTION_MONTHS
+    action = action or settings.SOLAPI_LOG_PARTITION_EXPIRE_ACTION
+    cutoff = retention_cutoff(retention_months, now) if retention_months else None
+    result: dict[str, Any] = {"partitioned": False, "statements": [], "expired": [], "deleted": 0}
+
+    if not is_partitioned(model):
+        if cutoff is not None:
+            result["deleted"] = (
+                model.objects.filter(created_at__lt=cutoff).count()  # type: ignore[attr-defined]
+                if dry_run
+                else delete_expired_rows(cutoff)
+            )
+        return result
+
+    result["partitioned"] = True
+    statements = create_statements(model, months_ahead, now)
+    if cutoff is not None:
+        result["expired"] = expired_partitions(model._meta.db_table, list_partitions(model), cutoff)
+        statements += expire_statements(model, result["expired"], action)
+    result["statements"] = statements
+    if not dry_run:
+        _execute(model, statements)
+    return result
@@ -0,0 +1,205 @@
+"""
+Sampling profiler for the send pipeline.
+
+Configuration:
+    # settings.py
+    SOLAPI_PROFILE_SAMPLE_RATE = 1000     # profile 1 in 1000 calls (0 disables, default)
+    SOLAPI_PROFILE_TRACEMALLOC = True     # also record allocations of sampled calls
+    SOLAPI_PROFILE_DIR = BASE_DIR / "var" / "solapi_profiles"
+
+Sampled calls of ``SMSService.send_sms``, ``send_bulk`` and ``verify_code``
+run under ``cProfile``; their stats are merged per method, so the report
+shows which functions dominate across many real sends (serialization, ORM,
+signal receivers, ...). With SOLAPI_PROFILE_DIR the merged stats are
+written every SOLAPI_PROFILE_FLUSH_EVERY samples and at exit as
+``<method>.<pid>.prof`` (readable with ``pstats`` or snakeviz) plus
+``<method>.<pid>.alloc.txt``. Superusers can read the current process's
+report at the ``solapi_sms:profile_report`` URL.
+
+Only one call is profiled at a time per process: a sample that comes due
+while another one runs (another thread, or a nested send) is skipped.
+
+With SOLAPI_PROFILE_SAMPLE_RATE = 0 at startup the methods are not wrapped
+at all, so profiling costs nothing when it is off.
+"""
+
+from __future__ import annotations
+
+import atexit
+import cProfile
+import functools
+import io
+import itertools
+import os
+import pstats
+import threading
+import tracemalloc
+from collections import Counter
+from collections.abc import Callable
+from pathlib import Path
+from typing import ParamSpec, TypeVar
+
+from . import settings
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+# Allocation sites kept per method.
+_TOP_ALLOCATIONS = 25
+
+
+class _Profile:
+    """Merged samples of one method."""
+
+    def __init__(self) -> None:
+        self.samples = 0
+        self.stats: pstats.Stats | None = None
+        self.allocated: Counter[str] = Counter()
+        self.peak = 0
+
+    def add(self, profile: cProfile.Profile, snapshot: tracemalloc.Snapshot | None) -> None:
+        self.samples += 1
+        if self.stats is None:
+            self.stats = pstats.Stats(profile)
+        else:
+            self.stats.add(profile)
+        if snapshot is not None:
+            for stat in snapshot.statistics("lineno")[:_TOP_ALLOCATIONS]:
+                frame = stat.traceback[0]
+                self.allocated[f"{frame.filename}:{frame.lineno}"] += stat.size
+
+
+_profiles: dict[str, _Profile] = {}
+_counters: dict[str, itertools.count[int]] = {}
+_busy = threading.Lock()
+_lock = threading.Lock()
+
+
+def is_enabled() -> bool:
+    return bool(settings.SOLAPI_PROFILE_SAMPLE_RATE)
+
+
+def _start() -> tuple[cProfile.Profile, bool] | None:
+    profile = cProfile.Profile()
+    try:
+        profile.enable()
+    except ValueError:
+        # Another profiler (debugger, coverage, ...) owns the profiling hook.
+        return None
+    track_memory = settings.SOLAPI_PROFILE_TRACEMALLOC and not tracemalloc.is_tracing()
+    if track_memory:
+        tracemalloc.start()
+    return profile, track_memory
+
+
+def _finish(name: str, profile: cProfile.Profile, track_memory: bool) -> None:
+    profile.disable()
+    snapshot, peak = None, 0
+    if track_memory:
+        snapshot = tracemalloc.take_snapshot()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    with _lock:
+        entry = _profiles.setdefault(name, _Profile())
+        entry.add(profile, snapshot)
+        entry.peak = max(entry.peak, peak)
+        flush = (
+            settings.SOLAPI_PROFILE_DIR and entry.samples % settings.SOLAPI_PROFILE_FLUSH_EVERY == 0
+        )
+    if flush:
+        write_profiles()
+
+
+def sampled(name: str) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """
+    Profile 1 in SOLAPI_PROFILE_SAMPLE_RATE calls of the decorated function.
+
+    Returns the function unchanged when sampling is off at import time.
+    """
+
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        if not is_enabled():
+            return func
+        counter = _counters.setdefault(name, itertools.count(1))
+
+        @functools.wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            rate = settings.SOLAPI_PROFILE_SAMPLE_RATE
+            if not rate or next(counter) % rate or not _busy.acquire(blocking=False):
+                return func(*args, **kwargs)
+            try:
+                started = _start()
+                if started is None:
+                    return func(*args, **kwargs)
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    _finish(name, *started)
+            finally:
+                _busy.release()
+
+        return wrapper
+
+    return decorator
+
+
+def report(name: str | None = None, limit: int = 40, sort: str = "cumulative") -> str:
+    """Merged stats of this process as text, the top ``limit`` functions per method."""
+    if sort not in pstats.Stats.sort_arg_dict_default:
+        sort = "cumulative"
+    with _lock:
+        items = [(key, entry) for key, entry in sorted(_profiles.items()) if name in (None, key)]
+        output = io.StringIO()
+        for key, entry in items:
+            output.write(f"== {key}: {entry.samples} samples ==\n")
+            if entry.stats is not None:
+                entry.stats.stream = output  # type: ignore[attr-defined]
+                entry.stats.sort_stats(sort).print_stats(limit)
+            if entry.allocated:
+                output.write(f"Allocations (peak {entry.peak / 1024:.1f} KiB per sample):\n")
+                for site, size in entry.allocated.most_common(_TOP_ALLOCATIONS):
+                    output.write(f"{size / 1024:>12.1f} KiB  {site}\n")
+            output.write("\n")
+    return output.getvalue()
+
+
+def write_profiles(directory: str | os.PathLike[str] | None = None) -> list[Path]:
+    """
+    Write the merged stats to ``directory`` (default SOLAPI_PROFILE_DIR).
+
+    Returns:
+        Paths written (``<method>.<pid>.prof`` and ``<method>.<pid>.alloc.txt``)
+    """
+    directory = directory or settings.SOLAPI_PROFILE_DIR
+    if not directory:
+        return []
+    path = Path(directory)
+    path.mkdir(parents=True, exist_ok=True)
+    written = []
+    with _lock:
+        for key, entry in _profiles.items():
+            if entry.stats is None:
+                continue
+            prof = path / f"{key}.{os.getpid()}.prof"
+            entry.stats.dump_stats(prof)
+            written.append(prof)
+            if entry.allocated:
+                alloc = path / f"{key}.{os.getpid()}.alloc.txt"
+                alloc.write_text(
+                    "".join(
+                        f"{size}\t{site}\n"
+                        for site, size in entry.allocated.most_common(_TOP_ALLOCATIONS)
+                    ),
+                    encoding="utf-8",
+                )
+                written.append(alloc)
+    return written
+
+
+def reset() -> None:
+    """Forget all samples of this process."""
+    with _lock:
+        _profiles.clear()
+
+
+atexit.register(write_profiles)
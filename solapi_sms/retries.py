@@ -0,0 +1,277 @@
+"""
+DB-driven retries of FAILED sends.
+
+Configuration:
+    # settings.py
+    SOLAPI_RETRY_MAX_ATTEMPTS = 5          # 0 disables retries (default)
+    SOLAPI_RETRY_BACKOFF_SECONDS = 30      # first delay, doubled per attempt
+    SOLAPI_RETRY_BACKOFF_MAX_SECONDS = 3600
+
+A FAILED log row whose error is retryable gets ``next_retry_at``; the
+sweeper (``manage.py solapi_retry_failed`` or ``run_retry_sweeper()``)
+claims due rows in batches through the ``next_retry_at`` index with
+``SELECT ... FOR UPDATE SKIP LOCKED``, re-sends them through the send-many
+path and updates the same rows with the outcome and ``retry_count``.
+
+Delays grow exponentially with "equal jitter": half of the delay is fixed,
+the other half random, so rows that failed together during an outage come
+back spread over the window instead of in one synchronized wave.
+
+Never retried: TIMEOUT rows (SOLAPI may have accepted the message), rows
+kept in the local spool, errors listed in SOLAPI_RETRY_NON_RETRYABLE_CODES
+(invalid or blocked recipients, authentication errors, ...), rows logged by
+template reference whose template version is gone, and sends older than
+their message type's TTL (e.g. expired verification codes).
+
+A retry that succeeds moves the message from ``failed`` to ``sent`` in its
+campaign's counters.
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import time
+from collections import Counter
+from collections.abc import Mapping
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+from django.db import router, transaction
+from django.utils import timezone
+
+from . import settings
+from .models import SMSLogStatus, SMSTemplateVersion
+from .services import SMSService, _link_scheduled, get_sms_log_model
+from .tasks.backpressure import message_ttl
+from .utils import build_message
+
+if TYPE_CHECKING:
+    from django.db.models import Model
+
+logger = logging.getLogger(__name__)
+
+
+def backoff_seconds(attempt: int) -> float:
+    """Delay before retry number ``attempt + 1``: exponential, capped, with equal jitter."""
+    delay = min(
+        settings.SOLAPI_RETRY_BACKOFF_MAX_SECONDS,
+        settings.SOLAPI_RETRY_BACKOFF_SECONDS * 2**attempt,
+    )
+    return float(delay / 2 + random.uniform(0, delay / 2))  # noqa: S311
+
+
+def error_code(response_data: Mapping[str, Any] | None) -> str:
+    """SOLAPI error or status code recorded in a log row's response data."""
+    if not response_data:
+        return ""
+    for key in ("error_code", "errorCode", "status_code", "statusCode"):
+        if response_data.get(key):
+            return str(response_data[key])
+    return ""
+
+
+def is_permanent_error(code: str) -> bool:
+    """Whether ``code`` matches SOLAPI_RETRY_NON_RETRYABLE_CODES ("1*" matches by prefix)."""
+    if not code:
+        return False
+    for pattern in settings.SOLAPI_RETRY_NON_RETRYABLE_CODES:
+        if code == pattern or (pattern.endswith("*") and code.startswith(pattern[:-1])):
+            return True
+    return False
+
+
+def is_retryable(status: str, response_data: Mapping[str, Any] | None) -> bool:
+    if status != SMSLogStatus.FAILED or (response_data or {}).get("spooled"):
+        return False
+    return not is_permanent_error(error_code(response_data))
+
+
+def retry_fields(
+    status: str,
+    response_data: Mapping[str, Any] | None,
+    retry_count: int = 0,
+    now: datetime | None = None,
+) -> dict[str, Any]:
+    """``next_retry_at`` for a log row after attempt ``retry_count`` ended with ``status``."""
+    if (
+        not settings.SOLAPI_RETRY_MAX_ATTEMPTS
+        or retry_count >= settings.SOLAPI_RETRY_MAX_ATTEMPTS
+        or not is_retryable(status, response_data)
+    ):
+        return {"next_retry_at": None}
+    now = now or timezone.now()
+    return {"next_retry_at": now + timedelta(seconds=backoff_seconds(retry_count))}
+
+
+def _is_expired(row: Any, now: datetime) -> bool:
+    ttl = message_ttl(row.message_type)
+    return ttl is not None and row.created_at < now - timedelta(seconds=ttl)
+
+
+def claim_due_retries(
+    *,
+    batch_size: int | None = None,
+    now: datetime | None = None,
+) -> list[Model]:
+    """
+    Claim up to ``batch_size`` FAILED rows whose retry is due.
+
+    Claimed rows get ``next_retry_at`` pushed SOLAPI_SCHEDULER_STALE_SECONDS
+    ahead, so rows of a crashed sweeper come due again by themselves.
+    Rows locked by another sweeper are skipped rather than waited on.
+    """
+    model = get_sms_log_model()
+    now = now or timezone.now()
+    limit = batch_size or settings.SOLAPI_RETRY_BATCH_SIZE
+    with transaction.atomic(using=router.db_for_write(model)):
+        rows = list(
+            model.objects.select_for_update(skip_locked=True)  # type: ignore[attr-defined]
+            .filter(next_retry_at__lte=now, status=SMSLogStatus.FAILED)
+            .order_by("next_retry_at")[:limit]
+        )
+        if rows:
+            model.objects.filter(pk__in=[row.pk for row in rows]).update(  # type: ignore[attr-defined]
+                next_retry_at=now + timedelta(seconds=settings.SOLAPI_SCHEDULER_STALE_SECONDS)
+            )
+    return rows
+
+
+def retry_due_sends(
+    *,
+    batch_size: int | None = None,
+    now: datetime | None = None,
+    service: SMSService | None = None,
+) -> int:
+    """
+    Claim one batch of due retries and re-send it via send-many.
+
+    Each row is updated in place: status, response, ``retry_count`` and the
+    next ``next_retry_at`` (None once it succeeded, became non-retryable or
+    ran out of attempts). Fires ``sms_sent`` / ``sms_failed`` per row.
+
+    Returns:
+        Number of rows claimed (0 when nothing is due)
+    """
+    from .signals import sms_failed, sms_sent
+
+    rows = claim_due_retries(batch_size=batch_size, now=now)
+    if not rows:
+        return 0
+
+    now = timezone.now()
+    texts = _render_messages(rows)
+    expired = [row for row in rows if _is_expired(row, now)]
+    expired_pks = {row.pk for row in expired}
+    unrenderable = [row for row in rows if texts[row.pk] is None and row.pk not in expired_pks]
+    live = [row for row in rows if texts[row.pk] is not None and row.pk not in expired_pks]
+    service = service or SMSService()
+    for start in range(0, len(live), settings.SOLAPI_BULK_BATCH_SIZE):
+        chunk = live[start : start + settings.SOLAPI_BULK_BATCH_SIZE]
+        outcomes = service._send_bulk_chunk(
+            [(row.phone, texts[row.pk] or "", row.message_type) for row in chunk]  # type: ignore[attr-defined]
+        )
+        for row, (status, response_data, error_message) in zip(chunk, outcomes, strict=True):
+            row.retry_count += 1  # type: ignore[attr-defined]
+            row.status = status  # type: ignore[attr-defined]
+            # Keep the scheduled-row link so a stale claim still finds this log.
+            row.response_data = _link_scheduled(  # type: ignore[attr-defined]
+                response_data,
+                (row.response_data or {}).get("scheduled_id"),  # type: ignore[attr-defined]
+            )
+            row.error_message = error_message  # type: ignore[attr-defined]
+            row.message_id = service._extract_message_id(response_data)  # type: ignore[attr-defined]
+            row.next_retry_at = retry_fields(status, response_data, row.retry_count, now)[  # type: ignore[attr-defined]
+                "next_retry_at"
+            ]
+    for row in [*expired, *unrenderable]:
+        row.next_retry_at = None  # type: ignore[attr-defined]
+
+    model = get_sms_log_model()
+    model.objects.bulk_update(  # type: ignore[attr-defined]
+        rows,
+        ["retry_count", "status", "response_data", "error_message", "message_id", "next_retry_at"],
+    )
+    _record_recovered(live)
+    for row in live:
+        signal = sms_sent if row.status == SMSLogStatus.SUCCESS else sms_failed  # type: ignore[attr-defined]
+        extra = {"skipped": False} if signal is sms_sent else {}
+        signal.send(
+            sender=SMSService,
+            phone=row.phone,  # type: ignore[attr-defined]
+            message=texts[row.pk],
+            message_type=row.message_type,  # type: ignore[attr-defined]
+            log=row,
+            **extra,
+        )
+    if expired:
+        logger.info("Dropped %d SMS retries past their TTL", len(expired))
+    if unrenderable:
+        logger.warning(
+            "Dropped %d SMS retries whose template version no longer exists", len(unrenderable)
+        )
+    return len(rows)
+
+
+def _render_messages(rows: list[Any]) -> dict[Any, str | None]:
+    """Text to re-send per row pk; None when its template version is missing."""
+    versions = {row.template_version for row in rows if not row.message and row.template_version}
+    templates = SMSTemplateVersion.objects.in_bulk(versions) if versions else {}
+    texts: dict[Any, str | None] = {}
+    for row in rows:
+        if row.message or not row.template_version:
+            texts[row.pk] = row.message
+        elif row.template_version in templates:
+            texts[row.pk] = build_message(
+                templates[row.template_version].template, **(row.template_params or {})
+            )
+        else:
+            texts[row.pk] = None
+    return texts
+
+
+def _record_recovered(rows: list[Any]) -> None:
+    """Move campaign messages whose retry succeeded from ``failed`` to ``sent``."""
+    from .campaigns import record_recovered
+
+    recovered = Counter(
+        campaign_id
+        for row in rows
+        if row.status == SMSLogStatus.SUCCESS
+        and (campaign_id := getattr(row, "campaign_id", None)) is not None
+    )
+    for campaign_id, count in recovered.items():
+        record_recovered(campaign_id, count)
+
+
+def run_retry_sweeper(
+    *,
+    batch_size: int | None = None,
+    interval_seconds: float | None = None,
+    once: bool = False,
+) -> int:
+    """
+    Retry due FAILED sends until interrupted.
+
+    Full batches are followed immediately by the next claim; the loop only
+    sleeps once a tick finds less than a full batch.
+
+    Returns:
+        Total number of rows retried
+    """
+    limit = batch_size or settings.SOLAPI_RETRY_BATCH_SIZE
+    interval = (
+        interval_seconds
+        if interval_seconds is not None
+        else settings.SOLAPI_SCHEDULER_INTERVAL_SECONDS
+    )
+    total = 0
+    while True:
+        while True:
+            retried = retry_due_sends(batch_size=limit)
+            total += retried
+            if retried < limit:
+                break
+        if once:
+            return total
+        time.sleep(interval)
@@ -0,0 +1,110 @@
+"""
+Database router for the SMS tables.
+
+Configuration:
+    # settings.py
+    DATABASES = {"default": {...}, "sms": {...}, "sms_replica": {...}}
+    DATABASE_ROUTERS = ["solapi_sms.routers.SolapiSMSRouter"]
+    SOLAPI_DATABASE = "sms"
+    SOLAPI_REPLICA_DATABASE = "sms_replica"  # optional
+
+Writes (and migrations) of the SMS models, including log and verification
+models swapped in from another app, go to SOLAPI_DATABASE. Reads of
+logs and scheduled messages, i.e. the admin and statistics queries, go to
+SOLAPI_REPLICA_DATABASE when set. Verification codes are read from the
+primary unless SOLAPI_VERIFICATION_READ_PRIMARY is False.
+
+After a thread or asyncio task writes an SMS table, its reads stay on the
+primary for SOLAPI_READ_AFTER_WRITE_SECONDS so it sees its own writes
+despite replica lag.
+"""
+
+from __future__ import annotations
+
+import time
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any
+
+from . import settings
+
+if TYPE_CHECKING:
+    from django.db.models import Model
+
+APP_LABEL = "solapi_sms"
+
+# Monotonic time of the last SMS table write in this thread / asyncio task.
+_last_write: ContextVar[float | None] = ContextVar("solapi_sms_last_write", default=None)
+
+
+def _sms_models() -> tuple[type[Model], ...]:
+    from .services import get_sms_log_model, get_sms_scheduled_model
+
+    return get_sms_log_model(), get_sms_scheduled_model()
+
+
+def _is_verification_model(model: type[Model]) -> bool:
+    from .models import AbstractSMSVerificationCode
+    from .services import get_sms_verification_model
+
+    return issubclass(model, AbstractSMSVerificationCode) or model is get_sms_verification_model()
+
+
+def _is_sms_model(model: type[Model]) -> bool:
+    return (
+        model._meta.app_label == APP_LABEL
+        or model in _sms_models()
+        or _is_verification_model(model)
+    )
+
+
+def _sms_model_labels() -> set[str]:
+    from .services import get_sms_verification_model
+
+    return {model._meta.label_lower for model in (*_sms_models(), get_sms_verification_model())}
+
+
+def _recently_wrote() -> bool:
+    last_write = _last_write.get()
+    return (
+        last_write is not None
+        and time.monotonic() - last_write < settings.SOLAPI_READ_AFTER_WRITE_SECONDS
+    )
+
+
+class SolapiSMSRouter:
+    """Route SMS models to SOLAPI_DATABASE, with optional replica reads."""
+
+    def db_for_read(self, model: type[Model], **hints: Any) -> str | None:
+        if not _is_sms_model(model):
+            return None
+        replica = settings.SOLAPI_REPLICA_DATABASE
+        if not replica or _recently_wrote():
+            return settings.SOLAPI_DATABASE
+        if _is_verification_model(model) and settings.SOLAPI_VERIFICATION_READ_PRIMARY:
+            return settings.SOLAPI_DATABASE
+        return replica  # type: ignore[no-any-return]
+
+    def db_for_write(self, model: type[Model], **hints: Any) -> str | None:
+        if not _is_sms_model(model):
+            return None
+        _last_write.set(time.monotonic())
+        return settings.SOLAPI_DATABASE
+
+    def allow_relation(self, obj1: Model, obj2: Model, **hints: Any) -> bool | None:
+        if _is_sms_model(type(obj1)) and _is_sms_model(type(obj2)):
+            return True
+        return None
+
+    def allow_migrate(
+        self, db: str, app_label: str, model_name: str | None = None, **hints: Any
+    ) -> bool | None:
+        if not settings.SOLAPI_DATABASE:
+            return None
+        if app_label != APP_LABEL:
+            # Migrations pass historical models, so swapped models are matched by label.
+            model = hints.get("model")
+            if model is not None:
+                model_name = model._meta.model_name
+            if model_name is None or f"{app_label}.{model_name}".lower() not in _sms_model_labels():
+                return None
+        return bool(db == settings.SOLAPI_DATABASE)
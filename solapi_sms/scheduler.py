@@ -0,0 +1,269 @@
+"""
+Scheduled SMS sending.
+
+Usage:
+    from solapi_sms.tasks import enqueue_sms
+
+    enqueue_sms("01012345678", "[서비스명] 내일 예약이 있습니다.", send_at=tomorrow_9am)
+
+Due rows are picked up by ``manage.py solapi_run_scheduler`` (or ``run_scheduler()``),
+which claims them in batches through the ``(status, send_at)`` index with
+``SELECT ... FOR UPDATE SKIP LOCKED`` so several schedulers can run side by side.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+from django.db import router, transaction
+from django.utils import timezone
+
+from . import settings
+from .models import SMSLogStatus, SMSMessageType, SMSScheduledStatus
+from .services import SMSService, get_sms_log_model, get_sms_scheduled_model
+from .utils import normalize_phone
+
+if TYPE_CHECKING:
+    from django.db.models import Model
+
+logger = logging.getLogger(__name__)
+
+# Message key linking a send_bulk message to its scheduled row; stored as
+# ``response_data["scheduled_id"]`` on the log row.
+SCHEDULED_KEY = "scheduled"
+
+
+def schedule_sms(
+    phone: str,
+    message: str,
+    message_type: str = SMSMessageType.GENERIC,
+    *,
+    send_at: datetime,
+) -> Model:
+    """
+    Store an SMS to be sent at ``send_at``.
+
+    Args:
+        phone: Recipient phone number
+        message: Message content
+        message_type: Message type (default: "GENERIC")
+        send_at: When the message becomes due
+
+    Returns:
+        The created scheduled message row
+    """
+    model = get_sms_scheduled_model()
+    return model.objects.create(  # type: ignore[attr-defined, no-any-return]
+        phone=normalize_phone(phone),
+        message=message,
+        message_type=message_type,
+        send_at=send_at,
+    )
+
+
+def cancel_scheduled_sms(pk: int) -> bool:
+    """Cancel a pending scheduled message. Returns False if it was already claimed."""
+    model = get_sms_scheduled_model()
+    updated: int = model.objects.filter(  # type: ignore[attr-defined]
+        pk=pk, status=SMSScheduledStatus.PENDING
+    ).update(status=SMSScheduledStatus.CANCELED, processed_at=timezone.now())
+    return updated > 0
+
+
+def claim_due_messages(
+    *,
+    batch_size: int | None = None,
+    now: datetime | None = None,
+) -> list[Model]:
+    """
+    Claim up to ``batch_size`` due PENDING rows and mark them PROCESSING.
+
+    Rows locked by another scheduler are skipped rather than waited on.
+    """
+    model = get_sms_scheduled_model()
+    now = now or timezone.now()
+    limit = batch_size or settings.SOLAPI_SCHEDULER_BATCH_SIZE
+    # The lock must be taken in a transaction on the database holding the table.
+    with transaction.atomic(using=router.db_for_write(model)):
+        rows = list(
+            model.objects.select_for_update(skip_locked=True)  # type: ignore[attr-defined]
+            .filter(status=SMSScheduledStatus.PENDING, send_at__lte=now)
+            .order_by("send_at")[:limit]
+        )
+        if rows:
+            model.objects.filter(pk__in=[row.pk for row in rows]).update(  # type: ignore[attr-defined]
+                status=SMSScheduledStatus.PROCESSING, claimed_at=now
+            )
+    return rows
+
+
+def release_stale_claims(*, stale_seconds: int | None = None) -> int:
+    """
+    Resolve rows stuck in PROCESSING (e.g. after a crashed scheduler).
+
+    A scheduler may crash after SOLAPI accepted the batch but before the
+    rows were marked SENT. Rows with a log row linked to them (see
+    ``SCHEDULED_KEY``) are therefore finished from that log instead of being
+    sent again; only rows without one go back to PENDING. When sends are not
+    logged at all a missing log proves nothing, so stale rows are marked
+    FAILED rather than risking a second delivery.
+
+    Returns:
+        Number of rows returned to PENDING
+    """
+    model = get_sms_scheduled_model()
+    seconds = stale_seconds or settings.SOLAPI_SCHEDULER_STALE_SECONDS
+    cutoff = timezone.now() - timedelta(seconds=seconds)
+    rows = list(
+        model.objects.filter(  # type: ignore[attr-defined]
+            status=SMSScheduledStatus.PROCESSING, claimed_at__lt=cutoff
+        ).only("pk", "phone", "message", "claimed_at")
+    )
+    if not rows:
+        return 0
+
+    processed_at = timezone.now()
+    if not _sends_are_logged():
+        count: int = model.objects.filter(  # type: ignore[attr-defined]
+            pk__in=[row.pk for row in rows], status=SMSScheduledStatus.PROCESSING
+        ).update(status=SMSScheduledStatus.FAILED, processed_at=processed_at)
+        logger.warning(
+            "Marked %d stale scheduled SMS claims FAILED: sends are not logged, "
+            "so they may already have been delivered",
+            count,
+        )
+        return 0
+
+    logged = _logged_statuses(rows)
+    released: list[int] = []
+    for row in rows:
+        log_status = logged.get(row.pk)
+        if log_status is None:
+            released.append(row.pk)
+            continue
+        status = (
+            SMSScheduledStatus.FAILED
+            if log_status == SMSLogStatus.FAILED
+            else SMSScheduledStatus.SENT
+        )
+        model.objects.filter(  # type: ignore[attr-defined]
+            pk=row.pk, status=SMSScheduledStatus.PROCESSING
+        ).update(status=status, processed_at=processed_at)
+    resolved = len(rows) - len(released)
+    if resolved:
+        logger.warning("Finished %d stale scheduled SMS claims from their send logs", resolved)
+    count = model.objects.filter(  # type: ignore[attr-defined]
+        pk__in=released, status=SMSScheduledStatus.PROCESSING
+    ).update(status=SMSScheduledStatus.PENDING, claimed_at=None)
+    return count
+
+
+def _sends_are_logged() -> bool:
+    """Whether ``send_bulk`` writes a log row for every scheduled send."""
+    if not settings.SOLAPI_LOG_ENABLED:
+        return False
+    return settings.SOLAPI_LOG_SKIPPED or not SMSService()._is_debug_skip()
+
+
+def _logged_statuses(rows: list[Any]) -> dict[int, str]:
+    """Log status of each scheduled row, matched on the ``scheduled_id`` its send stored."""
+    log_model = get_sms_log_model()
+    candidates = log_model.objects.filter(  # type: ignore[attr-defined]
+        phone__in={row.phone for row in rows},
+        created_at__gte=min(row.claimed_at for row in rows),
+    ).values_list("response_data", "status")
+    pks = {row.pk for row in rows}
+    statuses: dict[int, str] = {}
+    for response_data, status in candidates:
+        scheduled_id = (response_data or {}).get("scheduled_id")
+        if scheduled_id is not None and scheduled_id in pks:
+            statuses[scheduled_id] = status
+    return statuses
+
+
+def dispatch_due_messages(
+    *,
+    batch_size: int | None = None,
+    now: datetime | None = None,
+    service: SMSService | None = None,
+) -> int:
+    """
+    Claim one batch of due messages and send it through ``SMSService.send_bulk``.
+
+    Returns:
+        Number of messages dispatched (0 when nothing is due)
+    """
+    rows = claim_due_messages(batch_size=batch_size, now=now)
+    if not rows:
+        return 0
+
+    service = service or SMSService()
+    results = service.send_bulk(
+        [
+            {
+                "phone": row.phone,  # type: ignore[attr-defined]
+                "message": row.message,  # type: ignore[attr-defined]
+                "message_type": row.message_type,  # type: ignore[attr-defined]
+                SCHEDULED_KEY: str(row.pk),
+            }
+            for row in rows
+        ]
+    )
+
+    model = get_sms_scheduled_model()
+    processed_at = timezone.now()
+    sent_ids = [row.pk for row, success in zip(rows, results, strict=True) if success]
+    failed_ids = [row.pk for row, success in zip(rows, results, strict=True) if not success]
+    if sent_ids:
+        model.objects.filter(pk__in=sent_ids).update(  # type: ignore[attr-defined]
+            status=SMSScheduledStatus.SENT, processed_at=processed_at
+        )
+    if failed_ids:
+        model.objects.filter(pk__in=failed_ids).update(  # type: ignore[attr-defined]
+            status=SMSScheduledStatus.FAILED, processed_at=processed_at
+        )
+    return len(rows)
+
+
+def run_scheduler(
+    *,
+    batch_size: int | None = None,
+    interval_seconds: float | None = None,
+    once: bool = False,
+) -> int:
+    """
+    Dispatch due messages until interrupted.
+
+    Full batches are followed immediately by the next claim; the loop only
+    sleeps once a tick finds less than a full batch.
+
+    Args:
+        batch_size: Rows claimed per tick
+        interval_seconds: Sleep between idle ticks
+        once: Drain currently due messages and return instead of looping
+
+    Returns:
+        Total number of messages dispatched
+    """
+    limit = batch_size or settings.SOLAPI_SCHEDULER_BATCH_SIZE
+    interval = (
+        interval_seconds
+        if interval_seconds is not None
+        else settings.SOLAPI_SCHEDULER_INTERVAL_SECONDS
+    )
+    total = 0
+    while True:
+        released = release_stale_claims()
+        if released:
+            logger.warning("Released %d stale scheduled SMS claims", released)
+        while True:
+            dispatched = dispatch_due_messages(batch_size=limit)
+            total += dispatched
+            if dispatched < limit:
+                break
+        if once:
+            return total
+        time.sleep(interval)
@@ -1,21 +1,44 @@
 from __future__ import annotations
 
+import hashlib
 import logging
+import time
+from collections.abc import Awaitable, Callable, Mapping, Sequence
 from typing import TYPE_CHECKING, Any
 
+import httpx
 from django.apps import apps as django_apps
 from django.conf import settings as django_settings
+from django.core.cache import cache
+from solapi.error.MessageNotReceiveError import MessageNotReceivedError
 
-from .client import SolapiClient
+from . import logbuffer, profiling, tracing
+from .client import SolapiClient, get_client
+from .credentials import get_credential_pool
 
 if TYPE_CHECKING:
     from django.db.models import Model
-from .exceptions import SolapiSMSConfigError, SolapiSMSSendError
-from .models import SMSLog, SMSLogStatus, SMSMessageType, SMSVerificationCode
+
+    from .credentials import Credential
+from .exceptions import (
+    SolapiSMSAPIError,
+    SolapiSMSConfigError,
+    SolapiSMSSendError,
+    SolapiSMSTimeoutError,
+)
+from .models import (
+    SMSLog,
+    SMSLogStatus,
+    SMSMessageType,
+    SMSScheduledMessage,
+    SMSTemplateVersion,
+    SMSVerificationCode,
+)
 from .settings import (
     SOLAPI_API_KEY,
     SOLAPI_API_SECRET,
     SOLAPI_APP_NAME,
+    SOLAPI_BULK_BATCH_SIZE,
     SOLAPI_DEBUG_SKIP,
     SOLAPI_LOG_SKIPPED,
     SOLAPI_SENDER_PHONE,
@@ -29,6 +52,59 @@ from .utils import build_message, generate_verification_code, normalize_phone
 
 logger = logging.getLogger(__name__)
 
+# Timeouts after which SOLAPI may already have accepted the request: failing
+# over to another credential could send the message twice.
+_AMBIGUOUS_TIMEOUTS = (httpx.ReadTimeout, httpx.WriteTimeout)
+
+# HTTP statuses of account problems (auth, rate limit) that another credential may not have.
+_FAILOVER_STATUS_CODES = frozenset({401, 403, 429})
+
+# SMSTemplateVersion rows known to exist, so logging by reference costs no extra query.
+_template_versions: set[str] = set()
+
+
+def _is_timeout(exc: BaseException) -> bool:
+    return isinstance(exc, (httpx.TimeoutException, SolapiSMSTimeoutError))
+
+
+def is_unavailable(exc: BaseException) -> bool:
+    """True when a send failed before SOLAPI received it, so it is safe to send again later."""
+    return isinstance(exc, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout))
+
+
+def _is_credential_error(exc: BaseException) -> bool:
+    """True when a send failed on the account or connection, so another credential may succeed."""
+    from .settings import SOLAPI_CREDENTIAL_FAILOVER_CODES
+
+    if is_unavailable(exc) or isinstance(exc, ConnectionError):
+        return True
+    if isinstance(exc, SolapiSMSAPIError) and exc.status_code in _FAILOVER_STATUS_CODES:
+        return True
+    return bool(exc.args) and exc.args[0] in SOLAPI_CREDENTIAL_FAILOVER_CODES
+
+
+def _is_server_error(exc: BaseException) -> bool:
+    return isinstance(exc, SolapiSMSAPIError) and exc.status_code >= 500
+
+
+def _link_scheduled(
+    response_data: dict[str, Any], scheduled_id: str | int | None
+) -> dict[str, Any]:
+    """Copy of ``response_data`` naming the scheduled row it was sent for, if any."""
+    if not scheduled_id:
+        return response_data
+    return {**response_data, "scheduled_id": int(scheduled_id)}
+
+
+def _remaining(expires_at: float | None) -> float | None:
+    """Seconds left until ``expires_at`` (monotonic), raising once it has passed."""
+    if expires_at is None:
+        return None
+    remaining = expires_at - time.monotonic()
+    if remaining <= 0:
+        raise SolapiSMSTimeoutError("SOLAPI 발송 기한을 초과했습니다.")
+    return remaining
+
 
 def get_sms_log_model() -> type[Model]:
     """Return the configured SMS log model class."""
@@ -46,6 +122,14 @@ def get_sms_verification_model() -> type[Model]:
     return SMSVerificationCode
 
 
+def get_sms_scheduled_model() -> type[Model]:
+    """Return the configured SMS scheduled message model class."""
+    model_path: str | None = getattr(django_settings, "SOLAPI_SMS_SCHEDULED_MODEL", None)
+    if model_path:
+        return django_apps.get_model(model_path)
+    return SMSScheduledMessage
+
+
 class SMSService:
     """SOLAPI SMS service with logging and verification helpers."""
 
@@ -60,20 +144,248 @@ class SMSService:
         self.api_secret = api_secret or SOLAPI_API_SECRET
         self.sender = sender or SOLAPI_SENDER_PHONE
         self.app_name = app_name or SOLAPI_APP_NAME
+        # Explicit credentials bypass the SOLAPI_CREDENTIALS pool.
+        explicit = any([api_key, api_secret, sender])
+        self.credential_pool = None if explicit else get_credential_pool()
 
     def _validate_config(self) -> None:
         if not all([self.api_key, self.api_secret, self.sender]):
             raise SolapiSMSConfigError("SOLAPI 설정이 누락되었습니다.")
 
+    def _is_configured(self) -> bool:
+        return self.credential_pool is not None or all([self.api_key, self.api_secret, self.sender])
+
+    def _candidates(self, phone: str = "", count: int = 1) -> list[Credential] | None:
+        if self.credential_pool is None:
+            return None
+        return self.credential_pool.candidates(phone, count)
+
+    def _with_failover(
+        self,
+        candidates: list[Credential] | None,
+        count: int,
+        send: Callable[[SolapiClient, str, float | None], Any],
+        deadline: float | None = None,
+    ) -> Any:
+        """
+        Call ``send(client, sender, timeout)`` on each candidate until one succeeds.
+
+        Only account and connection errors (see ``_is_credential_error``)
+        move on to the next candidate. Request errors such as a bad phone
+        number are raised without touching credential health; 5xx responses
+        and read timeouts count against the credential but are raised too,
+        as SOLAPI may already have accepted the message.
+
+        ``deadline`` is the time budget in seconds for all attempts; each
+        attempt gets the remaining budget as its timeout.
+        """
+        expires_at = None if deadline is None else time.monotonic() + deadline
+        if candidates is None:
+            self._validate_config()
+            return send(
+                get_client(self.api_key, self.api_secret), self.sender, _remaining(expires_at)
+            )
+
+        last_exc: Exception | None = None
+        for credential in candidates:
+            try:
+                response = send(credential.client, credential.sender, _remaining(expires_at))
+            except MessageNotReceivedError:
+                # Every recipient was rejected: not an account problem, so no failover.
+                raise
+            except SolapiSMSTimeoutError:
+                # Deadline passed before this attempt started.
+                raise
+            except _AMBIGUOUS_TIMEOUTS:
+                credential.record_failure()
+                raise
+            except Exception as exc:
+                if not _is_credential_error(exc):
+                    if _is_server_error(exc):
+                        credential.record_failure()
+                    raise
+                credential.record_failure()
+                logger.warning("SOLAPI credential %s failed", credential.name, exc_info=exc)
+                last_exc = exc
+                continue
+            credential.record_success(count)
+            return response
+        assert last_exc is not None  # candidates is never empty
+        raise last_exc
+
+    async def _awith_failover(
+        self,
+        candidates: list[Credential] | None,
+        count: int,
+        send: Callable[[SolapiClient, str, float | None], Awaitable[Any]],
+        deadline: float | None = None,
+    ) -> Any:
+        """Async variant of ``_with_failover``."""
+        expires_at = None if deadline is None else time.monotonic() + deadline
+        if candidates is None:
+            self._validate_config()
+            return await send(
+                get_client(self.api_key, self.api_secret), self.sender, _remaining(expires_at)
+            )
+
+        last_exc: Exception | None = None
+        for credential in candidates:
+            try:
+                response = await send(credential.client, credential.sender, _remaining(expires_at))
+            except MessageNotReceivedError:
+                raise
+            except SolapiSMSTimeoutError:
+                raise
+            except _AMBIGUOUS_TIMEOUTS:
+                credential.record_failure()
+                raise
+            except Exception as exc:
+                if not _is_credential_error(exc):
+                    if _is_server_error(exc):
+                        credential.record_failure()
+                    raise
+                credential.record_failure()
+                logger.warning("SOLAPI credential %s failed", credential.name, exc_info=exc)
+                last_exc = exc
+                continue
+            credential.record_success(count)
+            return response
+        assert last_exc is not None  # candidates is never empty
+        raise last_exc
+
     def _serialize_response(self, response: Any) -> dict[str, Any]:
         return SolapiClient.serialize_response(response)
 
+    @staticmethod
+    def _extract_message_id(response_data: dict[str, Any] | None) -> str:
+        """Return the SOLAPI message id from a single or send-many item response."""
+        if not response_data:
+            return ""
+        if response_data.get("message_id"):
+            return str(response_data["message_id"])
+        message_list = response_data.get("message_list") or []
+        if len(message_list) == 1:
+            return str(message_list[0].get("message_id") or "")
+        return ""
+
+    def _is_debug_skip(self) -> bool:
+        return bool(django_settings.DEBUG and SOLAPI_DEBUG_SKIP and not self._is_configured())
+
+    @staticmethod
+    def _failure(exc: Exception) -> tuple[str, str]:
+        """Log a send exception and return its (log status, error message)."""
+        if _is_timeout(exc):
+            logger.warning("SOLAPI send timed out: %r", exc)
+            return SMSLogStatus.TIMEOUT, str(exc) or "SOLAPI 응답 시간이 초과되었습니다."
+        logger.error("SOLAPI send failed", exc_info=exc)
+        return SMSLogStatus.FAILED, str(exc)
+
+    @staticmethod
+    def _error_data(exc: Exception, error_message: str) -> dict[str, Any]:
+        """Response data logged for a send exception, with SOLAPI's error code when known."""
+        data: dict[str, Any] = {"error": error_message}
+        code = ""
+        if isinstance(exc, MessageNotReceivedError) and exc.failed_messages:
+            code = exc.failed_messages[0].status_code or ""
+        elif len(exc.args) == 2 and isinstance(exc.args[0], str):
+            # The SDK and client raise Exception(errorCode, errorMessage) for 4xx/5xx.
+            code = exc.args[0]
+        if code:
+            data["error_code"] = code
+        return data
+
+    @staticmethod
+    def _dedup_key(phone: str, message: str, message_type: str) -> str | None:
+        """Cache key of the duplicate suppression window, or None when not applicable."""
+        from .settings import SOLAPI_DEDUP_EXEMPT_MESSAGE_TYPES, SOLAPI_DEDUP_WINDOW_SECONDS
+
+        if not SOLAPI_DEDUP_WINDOW_SECONDS or message_type in SOLAPI_DEDUP_EXEMPT_MESSAGE_TYPES:
+            return None
+        digest = hashlib.sha256(f"{phone}\0{message}".encode()).hexdigest()
+        return f"solapi_sms_dedup_{digest}"
+
+    def _claim_dedup(self, key: str | None) -> bool:
+        """Open the suppression window; False when the same message is already in it."""
+        from .settings import SOLAPI_DEDUP_WINDOW_SECONDS
+
+        return key is None or cache.add(key, True, SOLAPI_DEDUP_WINDOW_SECONDS)
+
+    async def _aclaim_dedup(self, key: str | None) -> bool:
+        from .settings import SOLAPI_DEDUP_WINDOW_SECONDS
+
+        return key is None or await cache.aadd(key, True, SOLAPI_DEDUP_WINDOW_SECONDS)
+
+    def _skip_duplicate(
+        self,
+        phone: str,
+        message: str,
+        message_type: str,
+        template_ref: Mapping[str, Any] | None = None,
+    ) -> bool:
+        logger.info("Duplicate SMS suppressed for phone: %s", phone)
+        log_entry = self._log_result(
+            template_ref=template_ref,
+            phone=phone,
+            message=message,
+            message_type=message_type,
+            status=SMSLogStatus.SKIPPED,
+            response_data={"skipped_reason": "duplicate"},
+        )
+        from .signals import sms_sent
+
+        sms_sent.send(
+            sender=self.__class__,
+            phone=phone,
+            message=message,
+            message_type=message_type,
+            log=log_entry,
+            skipped=True,
+        )
+        # Nothing was sent by this call, and the original may still fail.
+        return False
+
+    async def _askip_duplicate(
+        self,
+        phone: str,
+        message: str,
+        message_type: str,
+        template_ref: Mapping[str, Any] | None = None,
+    ) -> bool:
+        logger.info("Duplicate SMS suppressed for phone: %s", phone)
+        log_entry = await self._alog_result(
+            template_ref=template_ref,
+            phone=phone,
+            message=message,
+            message_type=message_type,
+            status=SMSLogStatus.SKIPPED,
+            response_data={"skipped_reason": "duplicate"},
+        )
+        from .signals import sms_sent
+
+        await sms_sent.asend(
+            sender=self.__class__,
+            phone=phone,
+            message=message,
+            message_type=message_type,
+            log=log_entry,
+            skipped=True,
+        )
+        return False
+
     def _is_success(self, response_dict: dict[str, Any]) -> bool:
         if "errorCode" in response_dict or "errorMessage" in response_dict:
             return False
         status_code = response_dict.get("statusCode")
         return not (status_code and status_code not in SOLAPI_SUCCESS_STATUS_CODES)
 
+    @staticmethod
+    def _message_fields(message: str, template_ref: Mapping[str, Any] | None) -> dict[str, Any]:
+        """Log columns for the message: the text, or a template reference in its place."""
+        if template_ref is None:
+            return {"message": message}
+        return {"message": "", **template_ref}
+
+    @tracing.traced("solapi_sms.log_result")
     def _log_result(
         self,
         phone: str,
@@ -82,44 +394,175 @@ class SMSService:
         status: str,
         response_data: dict[str, Any] | None = None,
         error_message: str = "",
+        template_ref: Mapping[str, Any] | None = None,
     ) -> Model | None:
+        from .retries import retry_fields
         from .settings import SOLAPI_LOG_ENABLED
 
         if not SOLAPI_LOG_ENABLED:
             return None
 
         model = get_sms_log_model()
-        return model.objects.create(  # type: ignore[attr-defined, no-any-return]
+        row = model(
             phone=phone,
-            message=message,
+            **self._message_fields(message, template_ref),
+            message_type=message_type,
+            status=status,
+            response_data=response_data or {},
+            error_message=error_message,
+            message_id=self._extract_message_id(response_data),
+            **retry_fields(status, response_data),
+        )
+        if not (logbuffer.is_enabled() and logbuffer.buffer_row(row)):
+            row.save(force_insert=True)
+        return row
+
+    @tracing.traced("solapi_sms.log_result")
+    async def _alog_result(
+        self,
+        phone: str,
+        message: str,
+        message_type: str,
+        status: str,
+        response_data: dict[str, Any] | None = None,
+        error_message: str = "",
+        template_ref: Mapping[str, Any] | None = None,
+    ) -> Model | None:
+        from .retries import retry_fields
+        from .settings import SOLAPI_LOG_ENABLED
+
+        if not SOLAPI_LOG_ENABLED:
+            return None
+
+        model = get_sms_log_model()
+        row = model(
+            phone=phone,
+            **self._message_fields(message, template_ref),
             message_type=message_type,
             status=status,
             response_data=response_data or {},
             error_message=error_message,
+            message_id=self._extract_message_id(response_data),
+            **retry_fields(status, response_data),
         )
+        if not (logbuffer.is_enabled() and logbuffer.buffer_row(row)):
+            await row.asave(force_insert=True)
+        return row
+
+    @tracing.traced("solapi_sms.log_results_bulk")
+    def _log_results_bulk(
+        self,
+        entries: Sequence[tuple[str, str, str, str, dict[str, Any], str]],
+        campaign_ids: Sequence[int | None] | None = None,
+    ) -> list[Model | None]:
+        """
+        Insert log rows for (phone, message, message_type, status, response_data, error_message) tuples.
+
+        ``campaign_ids``, when given, links each row to its campaign.
+        """
+        from .retries import retry_fields
+        from .settings import SOLAPI_LOG_ENABLED
+
+        if not SOLAPI_LOG_ENABLED:
+            return [None] * len(entries)
+
+        model = get_sms_log_model()
+        rows = [
+            model(
+                phone=phone,
+                message=message,
+                message_type=message_type,
+                status=status,
+                response_data=response_data or {},
+                error_message=error_message,
+                message_id=self._extract_message_id(response_data),
+                campaign_id=campaign_id,
+                **retry_fields(status, response_data),
+            )
+            for (
+                (phone, message, message_type, status, response_data, error_message),
+                campaign_id,
+            ) in zip(entries, campaign_ids or [None] * len(entries), strict=True)
+        ]
+        return list(model.objects.bulk_create(rows))  # type: ignore[attr-defined]
 
+    def _log_skipped_bulk(
+        self, messages: Sequence[Mapping[str, str]], response_data: dict[str, Any]
+    ) -> None:
+        """Log messages that were never sent as SKIPPED in one insert, counting campaign ones."""
+        from .campaigns import campaign_of, record_outcomes
+
+        campaign_ids = [campaign_of(item) for item in messages]
+        self._log_results_bulk(
+            [
+                (
+                    item["phone"],
+                    item.get("message", ""),
+                    item.get("message_type") or SMSMessageType.GENERIC,
+                    SMSLogStatus.SKIPPED,
+                    response_data,
+                    "",
+                )
+                for item in messages
+            ],
+            campaign_ids,
+        )
+        record_outcomes((campaign_id, SMSLogStatus.SKIPPED) for campaign_id in campaign_ids)
+
+    @profiling.sampled("send_sms")
     def send_sms(
         self,
         phone: str,
         message: str,
         message_type: str = SMSMessageType.GENERIC,
         raise_on_error: bool = False,
+        deadline: float | None = None,
+        *,
+        spool: bool = False,
+        template_ref: Mapping[str, Any] | None = None,
     ) -> bool:
+        """
+        Send one SMS and log the result.
+
+        Args:
+            phone: Recipient phone number
+            message: Message content
+            message_type: Message type
+            raise_on_error: Raise SolapiSMSSendError instead of returning False
+            deadline: Seconds the send may take, failover included; defaults
+                to SOLAPI_CONNECT_TIMEOUT_SECONDS / SOLAPI_READ_TIMEOUT_SECONDS
+                per request. Timeouts are logged with status TIMEOUT and raise
+                SolapiSMSTimeoutError.
+            spool: When SOLAPI cannot be reached, keep the message in the
+                local spool (SOLAPI_SPOOL_PATH) for ``drain_spool`` to resend.
+                The attempt is still logged as FAILED, with
+                ``response_data["spooled"] == True``.
+            template_ref: Log columns (template_key, template_version,
+                template_params) stored instead of the text; set by
+                ``send_templated`` with SOLAPI_LOG_TEMPLATE_REFERENCES.
+
+        With SOLAPI_DEDUP_WINDOW_SECONDS set, the same (phone, message) sent
+        again within the window is not sent: it returns False (the first send
+        may still be in flight and fail) and is logged as SKIPPED with
+        ``response_data["skipped_reason"] == "duplicate"``. A failed send
+        closes the window so the caller can retry.
+
+        Returns:
+            True when SOLAPI accepted the message (or it was debug-skipped),
+            False when it failed or was suppressed as a duplicate
+        """
         phone = normalize_phone(phone)
         if not phone:
             if raise_on_error:
                 raise SolapiSMSSendError("전화번호가 비어있습니다.")
             return False
 
-        if (
-            django_settings.DEBUG
-            and SOLAPI_DEBUG_SKIP
-            and not all([self.api_key, self.api_secret, self.sender])
-        ):
+        if self._is_debug_skip():
             log_entry: Model | None = None
             if SOLAPI_LOG_SKIPPED:
                 log_entry = self._log_result(
                     phone=phone,
+                    template_ref=template_ref,
                     message=message,
                     message_type=message_type,
                     status=SMSLogStatus.SKIPPED,
@@ -137,15 +580,28 @@ class SMSService:
             )
             return True
 
+        dedup_key = self._dedup_key(phone, message, message_type)
+        if not self._claim_dedup(dedup_key):
+            return self._skip_duplicate(phone, message, message_type, template_ref)
+
         try:
-            self._validate_config()
-            client = SolapiClient(api_key=self.api_key, api_secret=self.api_secret)
-            response = client.send_message(phone, message, sender=self.sender)
+            response = self._with_failover(
+                self._candidates(phone),
+                1,
+                lambda client, sender, timeout: client.send_message(
+                    phone, message, sender=sender, timeout=timeout
+                ),
+                deadline,
+            )
             response_dict = self._serialize_response(response)
 
             if not self._is_success(response_dict):
+                if dedup_key:
+                    # Let the caller retry a failed send.
+                    cache.delete(dedup_key)
                 log_entry = self._log_result(
                     phone=phone,
+                    template_ref=template_ref,
                     message=message,
                     message_type=message_type,
                     status=SMSLogStatus.FAILED,
@@ -167,6 +623,7 @@ class SMSService:
 
             log_entry = self._log_result(
                 phone=phone,
+                template_ref=template_ref,
                 message=message,
                 message_type=message_type,
                 status=SMSLogStatus.SUCCESS,
@@ -184,14 +641,23 @@ class SMSService:
             )
             return True
         except Exception as exc:
-            logger.error("SOLAPI send failed", exc_info=exc)
+            if dedup_key:
+                cache.delete(dedup_key)
+            status, error_message = self._failure(exc)
+            response_data = self._error_data(exc, error_message)
+            if spool and is_unavailable(exc):
+                from .tasks.spool import spool as spool_message
+
+                if spool_message(phone, message, message_type, reason=error_message):
+                    response_data["spooled"] = True
             log_entry = self._log_result(
                 phone=phone,
+                template_ref=template_ref,
                 message=message,
                 message_type=message_type,
-                status=SMSLogStatus.FAILED,
-                response_data={"error": str(exc)},
-                error_message=str(exc),
+                status=status,
+                response_data=response_data,
+                error_message=error_message,
             )
             from .signals import sms_failed
 
@@ -203,19 +669,404 @@ class SMSService:
                 log=log_entry,
             )
             if raise_on_error:
-                raise SolapiSMSSendError(str(exc)) from exc
+                if status == SMSLogStatus.TIMEOUT:
+                    raise SolapiSMSTimeoutError(error_message) from exc
+                raise SolapiSMSSendError(error_message) from exc
             return False
 
+    async def asend_sms(
+        self,
+        phone: str,
+        message: str,
+        message_type: str = SMSMessageType.GENERIC,
+        raise_on_error: bool = False,
+        deadline: float | None = None,
+        *,
+        template_ref: Mapping[str, Any] | None = None,
+    ) -> bool:
+        """Async variant of ``send_sms`` using the async SOLAPI transport and async ORM."""
+        from .signals import sms_failed, sms_sent
+
+        phone = normalize_phone(phone)
+        if not phone:
+            if raise_on_error:
+                raise SolapiSMSSendError("전화번호가 비어있습니다.")
+            return False
+
+        if self._is_debug_skip():
+            log_entry: Model | None = None
+            if SOLAPI_LOG_SKIPPED:
+                log_entry = await self._alog_result(
+                    phone=phone,
+                    template_ref=template_ref,
+                    message=message,
+                    message_type=message_type,
+                    status=SMSLogStatus.SKIPPED,
+                    response_data={"debug_skip": True},
+                )
+            await sms_sent.asend(
+                sender=self.__class__,
+                phone=phone,
+                message=message,
+                message_type=message_type,
+                log=log_entry,
+                skipped=True,
+            )
+            return True
+
+        dedup_key = self._dedup_key(phone, message, message_type)
+        if not await self._aclaim_dedup(dedup_key):
+            return await self._askip_duplicate(phone, message, message_type, template_ref)
+
+        try:
+            response = await self._awith_failover(
+                self._candidates(phone),
+                1,
+                lambda client, sender, timeout: client.asend_message(
+                    phone, message, sender=sender, timeout=timeout
+                ),
+                deadline,
+            )
+            response_dict = self._serialize_response(response)
+        except Exception as exc:
+            if dedup_key:
+                await cache.adelete(dedup_key)
+            status, error_message = self._failure(exc)
+            log_entry = await self._alog_result(
+                phone=phone,
+                template_ref=template_ref,
+                message=message,
+                message_type=message_type,
+                status=status,
+                response_data=self._error_data(exc, error_message),
+                error_message=error_message,
+            )
+            await sms_failed.asend(
+                sender=self.__class__,
+                phone=phone,
+                message=message,
+                message_type=message_type,
+                log=log_entry,
+            )
+            if raise_on_error:
+                if status == SMSLogStatus.TIMEOUT:
+                    raise SolapiSMSTimeoutError(error_message) from exc
+                raise SolapiSMSSendError(error_message) from exc
+            return False
+
+        if not self._is_success(response_dict):
+            if dedup_key:
+                await cache.adelete(dedup_key)
+            log_entry = await self._alog_result(
+                phone=phone,
+                template_ref=template_ref,
+                message=message,
+                message_type=message_type,
+                status=SMSLogStatus.FAILED,
+                response_data=response_dict,
+                error_message=response_dict.get("errorMessage", ""),
+            )
+            await sms_failed.asend(
+                sender=self.__class__,
+                phone=phone,
+                message=message,
+                message_type=message_type,
+                log=log_entry,
+            )
+            if raise_on_error:
+                raise SolapiSMSSendError("SOLAPI 발송 실패")
+            return False
+
+        log_entry = await self._alog_result(
+            phone=phone,
+            template_ref=template_ref,
+            message=message,
+            message_type=message_type,
+            status=SMSLogStatus.SUCCESS,
+            response_data=response_dict,
+        )
+        await sms_sent.asend(
+            sender=self.__class__,
+            phone=phone,
+            message=message,
+            message_type=message_type,
+            log=log_entry,
+            skipped=False,
+        )
+        return True
+
+    @profiling.sampled("send_bulk")
+    def send_bulk(self, messages: Sequence[Mapping[str, str]]) -> list[bool]:
+        """
+        Send several messages through SOLAPI's send-many API.
+
+        Messages are sent in chunks of ``SOLAPI_BULK_BATCH_SIZE``; each chunk
+        costs one SOLAPI request and one bulk INSERT into the log table.
+
+        Args:
+            messages: Mappings with 'phone', 'message' and optional 'message_type'
+                (and 'campaign', see solapi_sms.campaigns; 'scheduled', see
+                solapi_sms.scheduler)
+
+        Returns:
+            Per-message success flags, in input order
+        """
+        from .campaigns import campaign_of, record_outcomes
+        from .scheduler import SCHEDULED_KEY
+        from .signals import sms_failed, sms_sent
+
+        entries = [
+            (
+                normalize_phone(item["phone"]),
+                item["message"],
+                item.get("message_type") or SMSMessageType.GENERIC,
+            )
+            for item in messages
+        ]
+        campaign_ids = [campaign_of(item) for item in messages]
+        scheduled_ids = [item.get(SCHEDULED_KEY) for item in messages]
+        statuses: list[str] = [SMSLogStatus.FAILED] * len(entries)
+        results = [False] * len(entries)
+        indexes = [index for index, (phone, _, _) in enumerate(entries) if phone]
+
+        if indexes and self._is_debug_skip():
+            logs: list[Model | None] = [None] * len(indexes)
+            if SOLAPI_LOG_SKIPPED:
+                logs = self._log_results_bulk(
+                    [
+                        (
+                            *entries[index],
+                            SMSLogStatus.SKIPPED,
+                            _link_scheduled({"debug_skip": True}, scheduled_ids[index]),
+                            "",
+                        )
+                        for index in indexes
+                    ],
+                    [campaign_ids[index] for index in indexes],
+                )
+            for index, log_entry in zip(indexes, logs, strict=True):
+                phone, message, message_type = entries[index]
+                sms_sent.send(
+                    sender=self.__class__,
+                    phone=phone,
+                    message=message,
+                    message_type=message_type,
+                    log=log_entry,
+                    skipped=True,
+                )
+                statuses[index] = SMSLogStatus.SKIPPED
+                results[index] = True
+            indexes = []
+
+        for start in range(0, len(indexes), SOLAPI_BULK_BATCH_SIZE):
+            chunk = indexes[start : start + SOLAPI_BULK_BATCH_SIZE]
+            outcomes = self._send_bulk_chunk([entries[index] for index in chunk])
+            logs = self._log_results_bulk(
+                [
+                    (
+                        *entries[index],
+                        status,
+                        _link_scheduled(response_data, scheduled_ids[index]),
+                        error_message,
+                    )
+                    for index, (status, response_data, error_message) in zip(
+                        chunk, outcomes, strict=True
+                    )
+                ],
+                [campaign_ids[index] for index in chunk],
+            )
+            for index, (status, _, _), log_entry in zip(chunk, outcomes, logs, strict=True):
+                phone, message, message_type = entries[index]
+                statuses[index] = status
+                if status == SMSLogStatus.SUCCESS:
+                    sms_sent.send(
+                        sender=self.__class__,
+                        phone=phone,
+                        message=message,
+                        message_type=message_type,
+                        log=log_entry,
+                        skipped=False,
+                    )
+                    results[index] = True
+                else:
+                    sms_failed.send(
+                        sender=self.__class__,
+                        phone=phone,
+                        message=message,
+                        message_type=message_type,
+                        log=log_entry,
+                    )
+
+        if any(campaign_ids):
+            record_outcomes(zip(campaign_ids, statuses, strict=True))
+        return results
+
+    def _plan_bulk(
+        self, chunk: Sequence[tuple[str, str, str]]
+    ) -> list[tuple[list[int], list[Credential] | None]]:
+        """Split a chunk into (positions, candidate credentials) groups, one request each."""
+        pool = self.credential_pool
+        if pool is None:
+            return [(list(range(len(chunk))), None)]
+        if pool.strategy != "hash":
+            return [(list(range(len(chunk))), pool.candidates(count=len(chunk)))]
+        groups: dict[str, tuple[list[int], list[Credential]]] = {}
+        for position, (phone, _, _) in enumerate(chunk):
+            candidates = pool.candidates(phone)
+            groups.setdefault(candidates[0].name, ([], candidates))[0].append(position)
+        return list(groups.values())
+
+    def _send_bulk_chunk(
+        self, chunk: Sequence[tuple[str, str, str]]
+    ) -> list[tuple[str, dict[str, Any], str]]:
+        """Send one chunk via send-many and return (status, response_data, error) per message."""
+        outcomes: list[tuple[str, dict[str, Any], str]] = [(SMSLogStatus.FAILED, {}, "")] * len(
+            chunk
+        )
+        for positions, candidates in self._plan_bulk(chunk):
+            messages = [(chunk[position][0], chunk[position][1]) for position in positions]
+            try:
+                response = self._with_failover(
+                    candidates,
+                    len(messages),
+                    lambda client, sender, timeout, messages=messages: client.send_messages(  # type: ignore[misc]
+                        messages, sender=sender, timeout=timeout
+                    ),
+                )
+                group_outcomes = self._map_bulk_response(
+                    self._serialize_response(response), len(messages)
+                )
+            except Exception as exc:
+                status, error_message = self._failure(exc)
+                group_outcomes = [
+                    (status, self._error_data(exc, error_message), error_message)
+                ] * len(messages)
+            for position, outcome in zip(positions, group_outcomes, strict=True):
+                outcomes[position] = outcome
+        return outcomes
+
+    def _map_bulk_response(
+        self, response_dict: dict[str, Any], size: int
+    ) -> list[tuple[str, dict[str, Any], str]]:
+        """Map send-many results back to input positions via ``custom_fields["index"]``."""
+        group_id = (response_dict.get("group_info") or {}).get("group_id")
+        outcomes: list[tuple[str, dict[str, Any], str]] = [
+            (SMSLogStatus.SUCCESS, {"group_id": group_id}, "")
+        ] * size
+        for item in response_dict.get("message_list") or []:
+            index = int((item.get("custom_fields") or {}).get("index", -1))
+            if not 0 <= index < size:
+                continue
+            status_code = item.get("status_code")
+            if status_code and status_code not in SOLAPI_SUCCESS_STATUS_CODES:
+                outcomes[index] = (
+                    SMSLogStatus.FAILED,
+                    {"group_id": group_id, **item},
+                    item.get("status_message", ""),
+                )
+            else:
+                outcomes[index] = (SMSLogStatus.SUCCESS, {"group_id": group_id, **item}, "")
+        for item in response_dict.get("failed_message_list") or []:
+            index = int((item.get("custom_fields") or {}).get("index", -1))
+            if 0 <= index < size:
+                outcomes[index] = (
+                    SMSLogStatus.FAILED,
+                    {"group_id": group_id, **item},
+                    item.get("status_message", ""),
+                )
+        return outcomes
+
+    @staticmethod
+    def _template_params(params: Mapping[str, object]) -> dict[str, Any]:
+        return {
+            key: value
+            if value is None or isinstance(value, (str, int, float, bool))
+            else str(value)
+            for key, value in params.items()
+        }
+
+    def _template_ref(
+        self, template_key: str, template: str, params: Mapping[str, object]
+    ) -> dict[str, Any] | None:
+        """Template reference to log instead of the text, or None when logging text."""
+        from .settings import SOLAPI_LOG_ENABLED, SOLAPI_LOG_TEMPLATE_REFERENCES
+
+        if not (SOLAPI_LOG_TEMPLATE_REFERENCES and SOLAPI_LOG_ENABLED and template):
+            return None
+        version = SMSTemplateVersion.version_of(template)
+        if version not in _template_versions:
+            SMSTemplateVersion.objects.get_or_create(
+                version=version, defaults={"template_key": template_key, "template": template}
+            )
+            _template_versions.add(version)
+        return {
+            "template_key": template_key,
+            "template_version": version,
+            "template_params": self._template_params(params),
+        }
+
+    async def _atemplate_ref(
+        self, template_key: str, template: str, params: Mapping[str, object]
+    ) -> dict[str, Any] | None:
+        from .settings import SOLAPI_LOG_ENABLED, SOLAPI_LOG_TEMPLATE_REFERENCES
+
+        if not (SOLAPI_LOG_TEMPLATE_REFERENCES and SOLAPI_LOG_ENABLED and template):
+            return None
+        version = SMSTemplateVersion.version_of(template)
+        if version not in _template_versions:
+            await SMSTemplateVersion.objects.aget_or_create(
+                version=version, defaults={"template_key": template_key, "template": template}
+            )
+            _template_versions.add(version)
+        return {
+            "template_key": template_key,
+            "template_version": version,
+            "template_params": self._template_params(params),
+        }
+
     def send_templated(
         self,
         phone: str,
         template_key: str,
         message_type: str,
+        *,
+        deadline: float | None = None,
+        spool: bool = False,
+        raise_on_error: bool = False,
+        **kwargs: object,
+    ) -> bool:
+        template = SOLAPI_TEMPLATES.get(template_key, "")
+        params = {"app_name": self.app_name, **kwargs}
+        message = build_message(template, **params)
+        return self.send_sms(
+            phone,
+            message,
+            message_type=message_type,
+            raise_on_error=raise_on_error,
+            deadline=deadline,
+            spool=spool,
+            template_ref=self._template_ref(template_key, template, params),
+        )
+
+    async def asend_templated(
+        self,
+        phone: str,
+        template_key: str,
+        message_type: str,
+        *,
+        deadline: float | None = None,
         **kwargs: object,
     ) -> bool:
         template = SOLAPI_TEMPLATES.get(template_key, "")
-        message = build_message(template, app_name=self.app_name, **kwargs)
-        return self.send_sms(phone, message, message_type=message_type)
+        params = {"app_name": self.app_name, **kwargs}
+        message = build_message(template, **params)
+        return await self.asend_sms(
+            phone,
+            message,
+            message_type=message_type,
+            deadline=deadline,
+            template_ref=await self._atemplate_ref(template_key, template, params),
+        )
 
     def create_verification(self, phone: str, code: str | None = None) -> Model:
         phone = normalize_phone(phone)
@@ -232,16 +1083,56 @@ class SMSService:
         )
         return verification  # type: ignore[no-any-return]
 
-    def send_verification_code(self, phone: str, code: str) -> bool:
+    async def acreate_verification(self, phone: str, code: str | None = None) -> Model:
+        phone = normalize_phone(phone)
+        code = code or generate_verification_code()
+        model = get_sms_verification_model()
+        verification = await model.acreate_verification(  # type: ignore[attr-defined]
+            phone, code, SOLAPI_VERIFICATION_TTL_SECONDS
+        )
+        from .signals import verification_created
+
+        await verification_created.asend(
+            sender=self.__class__,
+            verification=verification,
+        )
+        return verification  # type: ignore[no-any-return]
+
+    def send_verification_code(
+        self,
+        phone: str,
+        code: str,
+        *,
+        deadline: float | None = None,
+        spool: bool = False,
+        raise_on_error: bool = False,
+    ) -> bool:
         expires_minutes = max(1, SOLAPI_VERIFICATION_TTL_SECONDS // 60)
         return self.send_templated(
             phone,
             template_key="verification",
             message_type=SMSMessageType.VERIFICATION,
+            deadline=deadline,
+            spool=spool,
+            raise_on_error=raise_on_error,
+            code=code,
+            expires_minutes=expires_minutes,
+        )
+
+    async def asend_verification_code(
+        self, phone: str, code: str, *, deadline: float | None = None
+    ) -> bool:
+        expires_minutes = max(1, SOLAPI_VERIFICATION_TTL_SECONDS // 60)
+        return await self.asend_templated(
+            phone,
+            template_key="verification",
+            message_type=SMSMessageType.VERIFICATION,
+            deadline=deadline,
             code=code,
             expires_minutes=expires_minutes,
         )
 
+    @profiling.sampled("verify_code")
     def verify_code(self, phone: str, code: str) -> bool:
         phone = normalize_phone(phone)
 
@@ -256,7 +1147,7 @@ class SMSService:
 
         model = get_sms_verification_model()
         verification = (
-            model.objects.filter(phone=phone, verified_at__isnull=True)  # type: ignore[attr-defined]
+            model.active(phone)  # type: ignore[attr-defined]
             .order_by("-created_at")
             .first()
         )
@@ -282,3 +1173,44 @@ class SMSService:
             verification=verification,
         )
         return True
+
+    async def averify_code(self, phone: str, code: str) -> bool:
+        """Async variant of ``verify_code`` using the async ORM."""
+        phone = normalize_phone(phone)
+
+        if (
+            SOLAPI_TEST_CREDENTIALS
+            and phone in SOLAPI_TEST_CREDENTIALS
+            and SOLAPI_TEST_CREDENTIALS[phone] == code
+        ):
+            logger.info("Test credentials used for phone: %s", phone)
+            return True
+
+        model = get_sms_verification_model()
+        verification = await (
+            model.active(phone)  # type: ignore[attr-defined]
+            .order_by("-created_at")
+            .afirst()
+        )
+        if not verification:
+            return False
+        is_expired = getattr(verification, "is_expired", False)
+        if callable(is_expired):
+            is_expired = is_expired()
+        if is_expired:
+            return False
+        if verification.attempts >= SOLAPI_VERIFICATION_MAX_ATTEMPTS:
+            return False
+
+        await verification.amark_attempt()
+        if verification.code != code:
+            return False
+
+        await verification.amark_verified()
+        from .signals import verification_verified
+
+        await verification_verified.asend(
+            sender=self.__class__,
+            verification=verification,
+        )
+        return True
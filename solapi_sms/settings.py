@@ -5,12 +5,65 @@ SOLAPI_API_SECRET = getattr(django_settings, "SOLAPI_API_SECRET", "")
 SOLAPI_SENDER_PHONE = getattr(django_settings, "SOLAPI_SENDER_PHONE", "")
 SOLAPI_APP_NAME = getattr(django_settings, "SOLAPI_APP_NAME", "")
 
+# Credentials pool: list of (api_key, api_secret, sender) tuples or dicts with
+# api_key/api_secret/sender and optional weight/quota/name. Overrides the single
+# SOLAPI_API_KEY/SOLAPI_API_SECRET/SOLAPI_SENDER_PHONE when set.
+SOLAPI_CREDENTIALS = getattr(django_settings, "SOLAPI_CREDENTIALS", [])
+# "round_robin" (weighted) or "hash" (consistent hash on phone: same sender per user)
+SOLAPI_CREDENTIAL_STRATEGY = getattr(django_settings, "SOLAPI_CREDENTIAL_STRATEGY", "round_robin")
+SOLAPI_CREDENTIAL_FAILURE_THRESHOLD = getattr(
+    django_settings, "SOLAPI_CREDENTIAL_FAILURE_THRESHOLD", 3
+)
+SOLAPI_CREDENTIAL_COOLDOWN_SECONDS = getattr(
+    django_settings, "SOLAPI_CREDENTIAL_COOLDOWN_SECONDS", 60
+)
+SOLAPI_CREDENTIAL_QUOTA_WINDOW_SECONDS = getattr(
+    django_settings, "SOLAPI_CREDENTIAL_QUOTA_WINDOW_SECONDS", 86400
+)
+# SOLAPI error codes that fail over to the next credential, besides connection
+# errors and HTTP 401/403/429; other errors (bad phone or text, ...) are raised
+SOLAPI_CREDENTIAL_FAILOVER_CODES = getattr(
+    django_settings,
+    "SOLAPI_CREDENTIAL_FAILOVER_CODES",
+    (
+        "InvalidApiKey",
+        "SignatureDoesNotMatch",
+        "Unauthorized",
+        "Forbidden",
+        "NotEnoughBalance",
+        "TooManyRequests",
+    ),
+)
+
+# HTTP timeouts for SOLAPI requests (seconds). A per-call ``deadline`` caps both.
+SOLAPI_CONNECT_TIMEOUT_SECONDS = getattr(django_settings, "SOLAPI_CONNECT_TIMEOUT_SECONDS", 5)
+SOLAPI_READ_TIMEOUT_SECONDS = getattr(django_settings, "SOLAPI_READ_TIMEOUT_SECONDS", 30)
+
+# Database routing (requires DATABASE_ROUTERS = ["solapi_sms.routers.SolapiSMSRouter"])
+# Alias holding the SMS tables; None keeps them on Django's default routing
+SOLAPI_DATABASE = getattr(django_settings, "SOLAPI_DATABASE", None)
+# Optional replica alias for log/scheduled reads (admin, statistics)
+SOLAPI_REPLICA_DATABASE = getattr(django_settings, "SOLAPI_REPLICA_DATABASE", None)
+# Keep verification code reads on the primary (False: replica, subject to read-after-write)
+SOLAPI_VERIFICATION_READ_PRIMARY = getattr(
+    django_settings, "SOLAPI_VERIFICATION_READ_PRIMARY", True
+)
+# After a thread/task writes an SMS table, its reads stay on the primary this many seconds
+SOLAPI_READ_AFTER_WRITE_SECONDS = getattr(django_settings, "SOLAPI_READ_AFTER_WRITE_SECONDS", 5)
+
 SOLAPI_DEBUG_SKIP = getattr(django_settings, "SOLAPI_DEBUG_SKIP", True)
 SOLAPI_LOG_SKIPPED = getattr(django_settings, "SOLAPI_LOG_SKIPPED", True)
 
 # Set to False to disable SMSLog creation (useful when using django-notify's NotificationLog)
 SOLAPI_LOG_ENABLED = getattr(django_settings, "SOLAPI_LOG_ENABLED", True)
 
+# Suppress the same (phone, message) sent again within this many seconds (0 disables)
+SOLAPI_DEDUP_WINDOW_SECONDS = getattr(django_settings, "SOLAPI_DEDUP_WINDOW_SECONDS", 0)
+# Message types never suppressed as duplicates
+SOLAPI_DEDUP_EXEMPT_MESSAGE_TYPES = getattr(
+    django_settings, "SOLAPI_DEDUP_EXEMPT_MESSAGE_TYPES", ()
+)
+
 SOLAPI_SUCCESS_STATUS_CODES = getattr(django_settings, "SOLAPI_SUCCESS_STATUS_CODES", ("2000",))
 
 SOLAPI_VERIFICATION_TTL_SECONDS = getattr(django_settings, "SOLAPI_VERIFICATION_TTL_SECONDS", 180)
@@ -22,12 +75,127 @@ SOLAPI_VERIFICATION_RATE_LIMIT_WINDOW_SECONDS = getattr(
     django_settings, "SOLAPI_VERIFICATION_RATE_LIMIT_WINDOW_SECONDS", 0
 )
 
+# Delivery reports (SOLAPI webhook)
+# Codes treated as final success; codes still in flight are ignored, anything else is UNDELIVERED
+SOLAPI_DELIVERED_STATUS_CODES = getattr(django_settings, "SOLAPI_DELIVERED_STATUS_CODES", ("4000",))
+SOLAPI_DELIVERY_PENDING_STATUS_CODES = getattr(
+    django_settings, "SOLAPI_DELIVERY_PENDING_STATUS_CODES", ("2000", "3000")
+)
+SOLAPI_DELIVERY_BATCH_SIZE = getattr(django_settings, "SOLAPI_DELIVERY_BATCH_SIZE", 500)
+# Reports only match log rows created this many days back (None: any age). Set it
+# with a partitioned log table so the UPDATE only touches recent partitions;
+# reports for older rows are then skipped (and counted in a warning)
+SOLAPI_DELIVERY_REPORT_MAX_AGE_DAYS = getattr(
+    django_settings, "SOLAPI_DELIVERY_REPORT_MAX_AGE_DAYS", None
+)
+# Shared secret expected in the webhook URL (?token=...). Without one the webhook
+# refuses every request unless SOLAPI_WEBHOOK_ALLOW_UNAUTHENTICATED is True
+SOLAPI_WEBHOOK_SECRET = getattr(django_settings, "SOLAPI_WEBHOOK_SECRET", "")
+SOLAPI_WEBHOOK_ALLOW_UNAUTHENTICATED = getattr(
+    django_settings, "SOLAPI_WEBHOOK_ALLOW_UNAUTHENTICATED", False
+)
+
 SOLAPI_CELERY_QUEUE = getattr(django_settings, "SOLAPI_CELERY_QUEUE", None)
 
 # Task backend configuration
-# Options: "sync" (default), "django6", "celery"
+# Options: "sync" (default), "thread", "asyncio", "django6", "celery"
 SOLAPI_TASK_BACKEND = getattr(django_settings, "SOLAPI_TASK_BACKEND", "sync")
 
+# Priority lanes (celery/django6 backends). Per lane: "queue", "priority" and
+# "rate_limit" (messages per second, enforced across workers via the cache), e.g.
+# {"interactive": {"queue": "sms_otp", "priority": 9}, "bulk": {"queue": "sms_bulk", "rate_limit": 50}}
+SOLAPI_TASK_LANES = getattr(django_settings, "SOLAPI_TASK_LANES", {})
+# message_type -> lane for single sends; other types use "default", batches use "bulk"
+SOLAPI_MESSAGE_TYPE_LANES = getattr(
+    django_settings,
+    "SOLAPI_MESSAGE_TYPE_LANES",
+    {"VERIFICATION": "interactive", "LOGIN_NOTIFICATION": "interactive"},
+)
+
+# Backpressure: once a lane's backlog reaches the high-water mark (0 disables),
+# enqueue_sms "reject"s (SolapiSMSQueueFullError) or "shed"s (drops, logged as SKIPPED)
+# messages outside the protected lanes. Backlog is measured at most every CHECK_INTERVAL.
+SOLAPI_BACKLOG_HIGH_WATER_MARK = getattr(django_settings, "SOLAPI_BACKLOG_HIGH_WATER_MARK", 0)
+SOLAPI_BACKLOG_OVERFLOW_ACTION = getattr(
+    django_settings, "SOLAPI_BACKLOG_OVERFLOW_ACTION", "reject"
+)
+SOLAPI_BACKLOG_PROTECTED_LANES = getattr(
+    django_settings, "SOLAPI_BACKLOG_PROTECTED_LANES", ("interactive",)
+)
+SOLAPI_BACKLOG_CHECK_INTERVAL_SECONDS = getattr(
+    django_settings, "SOLAPI_BACKLOG_CHECK_INTERVAL_SECONDS", 5
+)
+# Dotted path to a callable(lane) -> int | None overriding the backend's backlog inspection
+SOLAPI_BACKLOG_FUNCTION = getattr(django_settings, "SOLAPI_BACKLOG_FUNCTION", None)
+# Workers drop queued sends older than this many seconds, per message_type
+# (VERIFICATION defaults to SOLAPI_VERIFICATION_TTL_SECONDS)
+SOLAPI_MESSAGE_TTL_SECONDS = getattr(django_settings, "SOLAPI_MESSAGE_TTL_SECONDS", {})
+
+# Durable local spool (SQLite, WAL mode) for sends that could not reach the broker or
+# SOLAPI; None disables it. SYNCHRONOUS is the fsync policy ("FULL", "NORMAL", "OFF"),
+# MAX_MESSAGES caps the spool (0: unbounded), MAX_ATTEMPTS bounds drains of a row
+# that fails before it is sent (e.g. a database error), see tasks.spool
+SOLAPI_SPOOL_PATH = getattr(django_settings, "SOLAPI_SPOOL_PATH", None)
+SOLAPI_SPOOL_SYNCHRONOUS = getattr(django_settings, "SOLAPI_SPOOL_SYNCHRONOUS", "FULL")
+SOLAPI_SPOOL_MAX_MESSAGES = getattr(django_settings, "SOLAPI_SPOOL_MAX_MESSAGES", 100000)
+SOLAPI_SPOOL_MAX_ATTEMPTS = getattr(django_settings, "SOLAPI_SPOOL_MAX_ATTEMPTS", 5)
+SOLAPI_SPOOL_DRAIN_BATCH_SIZE = getattr(django_settings, "SOLAPI_SPOOL_DRAIN_BATCH_SIZE", 100)
+SOLAPI_SPOOL_DRAIN_INTERVAL_SECONDS = getattr(
+    django_settings, "SOLAPI_SPOOL_DRAIN_INTERVAL_SECONDS", 5
+)
+
+# Buffer enqueue_sms() calls made inside a transaction and publish them
+# as one batch task on commit (dropped on rollback)
+SOLAPI_COALESCE_ON_COMMIT = getattr(django_settings, "SOLAPI_COALESCE_ON_COMMIT", False)
+
+# enqueue_sms_many(): messages per published batch task
+SOLAPI_ENQUEUE_CHUNK_SIZE = getattr(django_settings, "SOLAPI_ENQUEUE_CHUNK_SIZE", 500)
+
+# Write-behind logging of single sends (see solapi_sms.logbuffer): rows are
+# queued in process and bulk-inserted every BATCH_SIZE rows or FLUSH_MS
+# milliseconds; beyond MAX_ROWS waiting rows, logs are inserted directly
+SOLAPI_LOG_WRITE_BEHIND = getattr(django_settings, "SOLAPI_LOG_WRITE_BEHIND", False)
+SOLAPI_LOG_BUFFER_BATCH_SIZE = getattr(django_settings, "SOLAPI_LOG_BUFFER_BATCH_SIZE", 500)
+SOLAPI_LOG_BUFFER_FLUSH_MS = getattr(django_settings, "SOLAPI_LOG_BUFFER_FLUSH_MS", 200)
+SOLAPI_LOG_BUFFER_MAX_ROWS = getattr(django_settings, "SOLAPI_LOG_BUFFER_MAX_ROWS", 10000)
+# Flushes a row that the database rejects (not a connection error) may fail before it is dropped
+SOLAPI_LOG_BUFFER_MAX_ATTEMPTS = getattr(django_settings, "SOLAPI_LOG_BUFFER_MAX_ATTEMPTS", 3)
+
+# Monthly log table partitions (PostgreSQL, see solapi_sms.partitions): months
+# created ahead, full months kept (None: keep all) and "drop" or "detach" for
+# expired months; without partitioning, expired rows are deleted in batches
+SOLAPI_LOG_PARTITION_MONTHS_AHEAD = getattr(django_settings, "SOLAPI_LOG_PARTITION_MONTHS_AHEAD", 3)
+SOLAPI_LOG_RETENTION_MONTHS = getattr(django_settings, "SOLAPI_LOG_RETENTION_MONTHS", None)
+SOLAPI_LOG_PARTITION_EXPIRE_ACTION = getattr(
+    django_settings, "SOLAPI_LOG_PARTITION_EXPIRE_ACTION", "drop"
+)
+SOLAPI_LOG_RETENTION_DELETE_BATCH_SIZE = getattr(
+    django_settings, "SOLAPI_LOG_RETENTION_DELETE_BATCH_SIZE", 5000
+)
+
+# Campaigns (see solapi_sms.campaigns): counter rows per campaign that workers
+# spread their updates over, seconds workers cache a campaign's status
+# (how long a pause or cancel takes to reach them), and seconds a worker waits
+# for an unknown campaign to become visible before sending its chunk unlinked
+SOLAPI_CAMPAIGN_COUNTER_SHARDS = getattr(django_settings, "SOLAPI_CAMPAIGN_COUNTER_SHARDS", 8)
+SOLAPI_CAMPAIGN_STATUS_CACHE_SECONDS = getattr(
+    django_settings, "SOLAPI_CAMPAIGN_STATUS_CACHE_SECONDS", 5
+)
+SOLAPI_CAMPAIGN_VISIBILITY_WAIT_SECONDS = getattr(
+    django_settings, "SOLAPI_CAMPAIGN_VISIBILITY_WAIT_SECONDS", 10
+)
+
+# Thread backend: worker threads, tasks allowed to wait behind them,
+# and seconds enqueue_* blocks for a free slot before raising SolapiSMSQueueFullError
+SOLAPI_THREAD_MAX_WORKERS = getattr(django_settings, "SOLAPI_THREAD_MAX_WORKERS", 4)
+SOLAPI_THREAD_QUEUE_SIZE = getattr(django_settings, "SOLAPI_THREAD_QUEUE_SIZE", 100)
+SOLAPI_THREAD_SUBMIT_TIMEOUT = getattr(django_settings, "SOLAPI_THREAD_SUBMIT_TIMEOUT", 0)
+
+# Asyncio backend: sends in flight per event loop, and scheduled-but-unfinished
+# sends per loop before enqueue_* raises SolapiSMSQueueFullError
+SOLAPI_ASYNCIO_MAX_CONCURRENCY = getattr(django_settings, "SOLAPI_ASYNCIO_MAX_CONCURRENCY", 100)
+SOLAPI_ASYNCIO_MAX_PENDING = getattr(django_settings, "SOLAPI_ASYNCIO_MAX_PENDING", 1000)
+
 SOLAPI_TEMPLATES = getattr(
     django_settings,
     "SOLAPI_TEMPLATES",
@@ -39,10 +207,70 @@ SOLAPI_TEMPLATES = getattr(
     },
 )
 
+# send_templated logs template_key, a template version hash and the params instead of the
+# full text (rebuilt on read via SMSLog.rendered_message); send_sms always logs the text
+SOLAPI_LOG_TEMPLATE_REFERENCES = getattr(django_settings, "SOLAPI_LOG_TEMPLATE_REFERENCES", False)
+
+# DB-driven retries of FAILED sends (0 disables; Celery then keeps its own task retries):
+# attempts per message, exponential backoff base/cap in seconds (with jitter),
+# SOLAPI error/status codes never retried ("1*" matches by prefix: SOLAPI's 1xxx
+# status codes reject the message itself, e.g. invalid or blocked recipients,
+# and 3059 is a spoofed sender number), and rows claimed per sweep
+SOLAPI_RETRY_MAX_ATTEMPTS = getattr(django_settings, "SOLAPI_RETRY_MAX_ATTEMPTS", 0)
+SOLAPI_RETRY_BACKOFF_SECONDS = getattr(django_settings, "SOLAPI_RETRY_BACKOFF_SECONDS", 30)
+SOLAPI_RETRY_BACKOFF_MAX_SECONDS = getattr(
+    django_settings, "SOLAPI_RETRY_BACKOFF_MAX_SECONDS", 3600
+)
+SOLAPI_RETRY_NON_RETRYABLE_CODES = getattr(
+    django_settings,
+    "SOLAPI_RETRY_NON_RETRYABLE_CODES",
+    (
+        "ValidationError",
+        "InvalidApiKey",
+        "SignatureDoesNotMatch",
+        "Unauthorized",
+        "Forbidden",
+        "NotEnoughBalance",
+        "1*",
+        "3059",
+    ),
+)
+SOLAPI_RETRY_BATCH_SIZE = getattr(django_settings, "SOLAPI_RETRY_BATCH_SIZE", 500)
+
+# Log export (admin actions, solapi_export_logs): rows per keyset page,
+# and whether admin exports mask phone numbers
+SOLAPI_EXPORT_BATCH_SIZE = getattr(django_settings, "SOLAPI_EXPORT_BATCH_SIZE", 2000)
+SOLAPI_EXPORT_MASK_PHONE = getattr(django_settings, "SOLAPI_EXPORT_MASK_PHONE", True)
+
+# Tracing spans around enqueue, task, SOLAPI call, log insert and signals (None disables):
+# "memory" (last MAX_SPANS spans in process), "file" (JSON Lines at SOLAPI_TRACING_FILE)
+# or "opentelemetry" (requires opentelemetry-api), see tracing
+SOLAPI_TRACING = getattr(django_settings, "SOLAPI_TRACING", None)
+SOLAPI_TRACING_FILE = getattr(django_settings, "SOLAPI_TRACING_FILE", None)
+SOLAPI_TRACING_MAX_SPANS = getattr(django_settings, "SOLAPI_TRACING_MAX_SPANS", 10000)
+
+# Sampling profiler for send_sms/send_bulk/verify_code: profile 1 in SAMPLE_RATE calls with
+# cProfile (0 disables; read at startup), optionally tracemalloc, and write the merged
+# stats to SOLAPI_PROFILE_DIR every FLUSH_EVERY samples and at exit, see profiling
+SOLAPI_PROFILE_SAMPLE_RATE = getattr(django_settings, "SOLAPI_PROFILE_SAMPLE_RATE", 0)
+SOLAPI_PROFILE_TRACEMALLOC = getattr(django_settings, "SOLAPI_PROFILE_TRACEMALLOC", False)
+SOLAPI_PROFILE_DIR = getattr(django_settings, "SOLAPI_PROFILE_DIR", None)
+SOLAPI_PROFILE_FLUSH_EVERY = getattr(django_settings, "SOLAPI_PROFILE_FLUSH_EVERY", 100)
+
 SOLAPI_SMS_LOG_MODEL = getattr(django_settings, "SOLAPI_SMS_LOG_MODEL", None)
 SOLAPI_SMS_VERIFICATION_MODEL = getattr(django_settings, "SOLAPI_SMS_VERIFICATION_MODEL", None)
+SOLAPI_SMS_SCHEDULED_MODEL = getattr(django_settings, "SOLAPI_SMS_SCHEDULED_MODEL", None)
 
 # Test mode: bypass SMS verification for specific phone/code pairs
 # Format: {"phone_number": "verification_code"}
 # Example: {"01022205736": "573648"}
 SOLAPI_TEST_CREDENTIALS = getattr(django_settings, "SOLAPI_TEST_CREDENTIALS", {})
+
+# Bulk sending (send-many) configuration
+SOLAPI_BULK_BATCH_SIZE = getattr(django_settings, "SOLAPI_BULK_BATCH_SIZE", 500)
+
+# Scheduled sends: rows claimed per scheduler tick, tick interval,
+# and how long a claimed row may stay PROCESSING before it is released again
+SOLAPI_SCHEDULER_BATCH_SIZE = getattr(django_settings, "SOLAPI_SCHEDULER_BATCH_SIZE", 500)
+SOLAPI_SCHEDULER_INTERVAL_SECONDS = getattr(django_settings, "SOLAPI_SCHEDULER_INTERVAL_SECONDS", 5)
+SOLAPI_SCHEDULER_STALE_SECONDS = getattr(django_settings, "SOLAPI_SCHEDULER_STALE_SECONDS", 600)
@@ -1,6 +1,34 @@
+from typing import Any
+
 from django.dispatch import Signal
 
-sms_sent = Signal()
-sms_failed = Signal()
-verification_created = Signal()
-verification_verified = Signal()
+from . import tracing
+
+
+class TracedSignal(Signal):
+    """Signal whose receivers run inside a ``solapi_sms.signal.<name>`` span."""
+
+    def __init__(self, name: str) -> None:
+        super().__init__()
+        self.name = name
+
+    def send(self, sender: Any, **named: Any) -> list[tuple[Any, Any]]:
+        if not self.receivers or not tracing.is_enabled():
+            return super().send(sender, **named)
+        with tracing.span(f"solapi_sms.signal.{self.name}", receivers=len(self.receivers)):
+            return super().send(sender, **named)
+
+    async def asend(self, sender: Any, **named: Any) -> list[tuple[Any, Any]]:
+        if not self.receivers or not tracing.is_enabled():
+            return await super().asend(sender, **named)
+        with tracing.span(f"solapi_sms.signal.{self.name}", receivers=len(self.receivers)):
+            return await super().asend(sender, **named)
+
+
+sms_sent = TracedSignal("sms_sent")
+sms_failed = TracedSignal("sms_failed")
+verification_created = TracedSignal("verification_created")
+verification_verified = TracedSignal("verification_verified")
+sms_delivery_reported = TracedSignal("sms_delivery_reported")
+# Sent with SOLAPI_LOG_WRITE_BEHIND after buffered log rows are saved (see logbuffer)
+sms_logs_flushed = TracedSignal("sms_logs_flushed")
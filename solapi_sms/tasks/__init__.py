@@ -8,26 +8,59 @@ Usage:
     enqueue_sms("01012345678", "Message")
     enqueue_verification_code("01012345678")
 
+    # Many messages, published as batch tasks of SOLAPI_ENQUEUE_CHUNK_SIZE
+    enqueue_sms_many([{"phone": "01012345678", "message": "Notice"}, ...])
+
+    # Scheduled send (dispatched by `manage.py solapi_run_scheduler`)
+    enqueue_sms("01012345678", "Reminder", send_at=tomorrow_9am)
+
 Configuration:
     # settings.py
     SOLAPI_TASK_BACKEND = "sync"     # Synchronous execution (default)
+    SOLAPI_TASK_BACKEND = "thread"   # In-process thread pool
+    SOLAPI_TASK_BACKEND = "asyncio"  # Coroutines on the running event loop (ASGI)
     SOLAPI_TASK_BACKEND = "django6"  # Django 6 Tasks
     SOLAPI_TASK_BACKEND = "celery"   # Celery
+
+    # Publish enqueue_sms() calls made in a transaction as one batch on commit
+    SOLAPI_COALESCE_ON_COMMIT = True
+
+    # Separate queues/priorities per lane (celery, django6), see tasks.lanes
+    SOLAPI_TASK_LANES = {"interactive": {"queue": "sms_otp"}, "bulk": {"queue": "sms_bulk"}}
+
+    # Keep sends the broker or SOLAPI could not take in a local spool, see tasks.spool
+    SOLAPI_SPOOL_PATH = BASE_DIR / "var" / "solapi_spool.sqlite3"
 """
 
 from __future__ import annotations
 
+import functools
+import logging
 from typing import TYPE_CHECKING, Any
 
+from .. import tracing
+from ..exceptions import SolapiSMSPublishError, SolapiSMSQueueFullError
+
 if TYPE_CHECKING:
+    from datetime import datetime
     from types import ModuleType
 
+logger = logging.getLogger(__name__)
+
 
 def _get_backend_module() -> ModuleType:
     """Return the configured backend module."""
     from ..settings import SOLAPI_TASK_BACKEND
 
-    if SOLAPI_TASK_BACKEND == "django6":
+    if SOLAPI_TASK_BACKEND == "thread":
+        from .backends import thread
+
+        return thread
+    elif SOLAPI_TASK_BACKEND == "asyncio":
+        from .backends import asyncio
+
+        return asyncio
+    elif SOLAPI_TASK_BACKEND == "django6":
         from .backends import django6
 
         return django6
@@ -41,45 +74,257 @@ def _get_backend_module() -> ModuleType:
         return sync
 
 
+def _spool_publish_failure(
+    backend: ModuleType,
+    exc: Exception,
+    messages: list[dict[str, str]],
+    kind: str = "sms",
+) -> bool:
+    """Spool messages a broker-backed backend failed to publish; False if they were not kept."""
+    from ..campaigns import CAMPAIGN_KEY
+    from .spool import spool
+
+    if backend.__name__.rsplit(".", 1)[-1] not in ("celery", "django6"):
+        return False
+    logger.warning("SMS task publish failed, spooling %d messages", len(messages), exc_info=exc)
+    kept = [
+        spool(
+            item["phone"],
+            item.get("message", ""),
+            item.get("message_type", "GENERIC"),
+            kind=kind,
+            reason=f"publish failed: {exc!r}",
+            campaign=item.get(CAMPAIGN_KEY),
+        )
+        for item in messages
+    ]
+    return all(kept)
+
+
+def _enqueue_batch_or_spool(backend: ModuleType, messages: list[dict[str, str]]) -> list[Any]:
+    from .lanes import split_by_lane
+
+    handles = []
+    for _, group in split_by_lane(messages):
+        try:
+            handles.append(backend.enqueue_sms_batch(group))
+        except SolapiSMSQueueFullError:
+            raise
+        except Exception as exc:
+            if not _spool_publish_failure(backend, exc, group):
+                raise
+    return handles
+
+
+@tracing.traced("solapi_sms.enqueue_sms")
 def enqueue_sms(
     phone: str,
     message: str,
     message_type: str = "GENERIC",
+    *,
+    send_at: datetime | None = None,
 ) -> Any:
     """
     Enqueue SMS sending task.
 
-    Uses the configured backend (sync, django6, or celery).
+    Uses the configured backend (sync, thread, asyncio, django6, or celery).
+    With ``send_at``, the message is stored for the scheduler instead.
+    With SOLAPI_COALESCE_ON_COMMIT inside a transaction, the message is
+    buffered and published with the others as one batch on commit.
 
     Args:
         phone: Recipient phone number
         message: Message content
         message_type: Message type (default: "GENERIC")
+        send_at: Send at this time instead of now (optional)
 
     Returns:
         Backend-dependent:
         - sync: dict (immediate result)
+        - thread: concurrent.futures.Future
+        - asyncio: asyncio.Task (or concurrent.futures.Future from sync code)
         - django6: TaskResult
         - celery: AsyncResult
+        - send_at given: SMSScheduledMessage
+        - buffered until commit, shed under backpressure or spooled: None
+
+    When a celery/django6 backend fails to publish (broker down) and
+    SOLAPI_SPOOL_PATH is set, the message is kept in the local spool and
+    published later by ``drain_spool``.
+
+    Raises:
+        SolapiSMSQueueFullError: Lane backlog over SOLAPI_BACKLOG_HIGH_WATER_MARK
+            with SOLAPI_BACKLOG_OVERFLOW_ACTION = "reject"
     """
+    from ..settings import SOLAPI_COALESCE_ON_COMMIT
+    from .backpressure import admit
+    from .lanes import lane_for_message_type
+
+    if send_at is not None:
+        from ..scheduler import schedule_sms
+
+        return schedule_sms(phone, message, message_type, send_at=send_at)
+
     backend = _get_backend_module()
-    return backend.enqueue_sms(phone, message, message_type)
+    tracing.set_attributes(message_type=message_type, backend=backend.__name__.rsplit(".", 1)[-1])
+    if not admit(backend, lane_for_message_type(message_type), phone, message, message_type):
+        return None
+    if SOLAPI_COALESCE_ON_COMMIT:
+        from .coalesce import buffer_sms
+
+        if buffer_sms(
+            phone, message, message_type, functools.partial(_enqueue_batch_or_spool, backend)
+        ):
+            return None
+    try:
+        return backend.enqueue_sms(phone, message, message_type)
+    except SolapiSMSQueueFullError:
+        raise
+    except Exception as exc:
+        message_dict = {"phone": phone, "message": message, "message_type": message_type}
+        if not _spool_publish_failure(backend, exc, [message_dict]):
+            raise
+        return None
+
+
+@tracing.traced("solapi_sms.enqueue_sms_many")
+def enqueue_sms_many(messages: list[dict[str, str]], *, chunk_size: int | None = None) -> list[Any]:
+    """
+    Enqueue many SMS as batch tasks of ``chunk_size`` messages.
 
+    Messages are grouped by lane first, so interactive ones never wait
+    behind a bulk chunk. Each backend publishes the chunks its own way:
+    sync sends them in turn, thread/asyncio submit one task per chunk,
+    celery publishes them as one group and django6 enqueues them in a loop.
 
+    Args:
+        messages: dicts with 'phone', 'message' and 'message_type' keys
+        chunk_size: Messages per task (default SOLAPI_ENQUEUE_CHUNK_SIZE)
+
+    Returns:
+        One backend-dependent handle per published chunk (see ``enqueue_sms``).
+        Lanes shed under backpressure are logged as SKIPPED and contribute
+        no handles; chunks spooled after a publish failure neither. When
+        publishing fails part-way only the unpublished chunks are spooled.
+
+    Raises:
+        SolapiSMSQueueFullError: Lane backlog over SOLAPI_BACKLOG_HIGH_WATER_MARK
+            with SOLAPI_BACKLOG_OVERFLOW_ACTION = "reject", or a full thread/asyncio
+            queue; lanes published before that stay published
+        SolapiSMSPublishError: Publishing failed part-way and the spool is
+            disabled or full
+    """
+    from ..settings import SOLAPI_ENQUEUE_CHUNK_SIZE
+    from .backpressure import admit
+    from .lanes import split_by_lane
+
+    size = chunk_size or SOLAPI_ENQUEUE_CHUNK_SIZE
+    if size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    backend = _get_backend_module()
+    tracing.set_attributes(
+        messages=len(messages), chunk_size=size, backend=backend.__name__.rsplit(".", 1)[-1]
+    )
+    handles: list[Any] = []
+    for lane, group in split_by_lane(messages):
+        if not admit(backend, lane):
+            _log_shed(group, lane)
+            continue
+        try:
+            handles.extend(backend.enqueue_sms_many(group, size))
+        except SolapiSMSQueueFullError:
+            raise
+        except SolapiSMSPublishError as exc:
+            handles.extend(exc.handles)
+            cause = exc.__cause__ if isinstance(exc.__cause__, Exception) else exc
+            if not _spool_publish_failure(backend, cause, exc.unpublished):
+                raise
+        except Exception as exc:
+            if not _spool_publish_failure(backend, exc, group):
+                raise
+    return handles
+
+
+def _log_shed(messages: list[dict[str, str]], lane: str) -> None:
+    """Log messages of a lane shed under backpressure as SKIPPED, in one insert."""
+    from ..services import SMSService
+
+    logger.warning("SMS shed: %d messages on lane %s", len(messages), lane)
+    SMSService()._log_skipped_bulk(messages, {"skipped_reason": "shed", "lane": lane})
+
+
+@tracing.traced("solapi_sms.enqueue_verification_code")
 def enqueue_verification_code(phone: str) -> Any:
     """
     Enqueue verification code sending task.
 
-    Uses the configured backend (sync, django6, or celery).
+    Uses the configured backend (sync, thread, asyncio, django6, or celery).
 
     Args:
         phone: Recipient phone number
 
+    Returns:
+        Backend-dependent result, or None when shed under backpressure or spooled
+    """
+    from .backpressure import admit
+    from .lanes import INTERACTIVE
+
+    backend = _get_backend_module()
+    tracing.set_attributes(backend=backend.__name__.rsplit(".", 1)[-1])
+    if not admit(backend, INTERACTIVE):
+        return None
+    try:
+        return backend.enqueue_verification_code(phone)
+    except SolapiSMSQueueFullError:
+        raise
+    except Exception as exc:
+        if not _spool_publish_failure(backend, exc, [{"phone": phone}], kind="verification"):
+            raise
+        return None
+
+
+def enqueue_delivery_reports(reports: list[dict[str, str]]) -> Any:
+    """
+    Enqueue processing of parsed SOLAPI delivery reports.
+
+    Uses the configured backend (sync, thread, asyncio, django6, or celery).
+
+    Args:
+        reports: Parsed reports from ``delivery.parse_delivery_reports``
+
     Returns:
         Backend-dependent result
     """
     backend = _get_backend_module()
-    return backend.enqueue_verification_code(phone)
+    return backend.enqueue_delivery_reports(reports)
+
+
+def spool_size() -> int:
+    """Messages waiting in the local spool (see tasks.spool)."""
+    from .spool import spool_size as _spool_size
+
+    return _spool_size()
+
+
+def drain_spool(*, batch_size: int | None = None) -> int:
+    """Replay spooled messages through the configured backend, see ``tasks.spool.drain_spool``."""
+    from .spool import drain_spool as _drain_spool
+
+    return _drain_spool(batch_size=batch_size)
+
+
+def queue_backlog(lane: str = "default") -> int | None:
+    """
+    Tasks waiting on ``lane`` in the configured backend.
+
+    Cached for SOLAPI_BACKLOG_CHECK_INTERVAL_SECONDS.
+
+    Returns:
+        Backlog size, or None when the backend cannot report it
+    """
+    from .backpressure import get_backlog
+
+    return get_backlog(_get_backend_module(), lane)
 
 
 def __getattr__(name: str) -> Any:
@@ -93,7 +338,12 @@ def __getattr__(name: str) -> Any:
     """
     from ..settings import SOLAPI_TASK_BACKEND
 
-    if name in ("send_sms_task", "send_verification_code_task"):
+    if name in (
+        "send_sms_task",
+        "send_sms_batch_task",
+        "send_verification_code_task",
+        "apply_delivery_reports_task",
+    ):
         if SOLAPI_TASK_BACKEND == "celery":
             from .backends import celery
 
@@ -111,6 +361,11 @@ def __getattr__(name: str) -> Any:
 
 
 __all__ = [
+    "enqueue_delivery_reports",
     "enqueue_sms",
+    "enqueue_sms_many",
+    "drain_spool",
     "enqueue_verification_code",
+    "queue_backlog",
+    "spool_size",
 ]
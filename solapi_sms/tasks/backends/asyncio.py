@@ -0,0 +1,245 @@
+"""
+Asyncio backend.
+
+Tasks are scheduled as coroutines on the running event loop (ASGI servers),
+using the async SOLAPI transport and async ORM writes. Called from sync code,
+they run on a dedicated event loop thread instead.
+
+Concurrency per loop is capped by SOLAPI_ASYNCIO_MAX_CONCURRENCY, and
+enqueue_* raises SolapiSMSQueueFullError once SOLAPI_ASYNCIO_MAX_PENDING
+sends are waiting. Pending sends live in process memory.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import concurrent.futures
+import threading
+import weakref
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+from ... import settings
+from ...client import aclose_http_client
+from ...exceptions import SolapiSMSQueueFullError
+from ..base import (
+    aapply_delivery_reports_func,
+    asend_sms_batch_func,
+    asend_sms_func,
+    asend_verification_code_func,
+    chunked,
+)
+
+TaskFunc = Callable[..., Coroutine[Any, Any, dict[str, Any]]]
+
+
+class _LoopState:
+    """Concurrency limit and pending count for one event loop."""
+
+    def __init__(self) -> None:
+        self.semaphore = asyncio.Semaphore(settings.SOLAPI_ASYNCIO_MAX_CONCURRENCY)
+        self.tasks: set[asyncio.Future[dict[str, Any]]] = set()
+        self.pending = 0
+        self.lock = threading.Lock()
+
+    def reserve(self) -> None:
+        with self.lock:
+            if self.pending >= settings.SOLAPI_ASYNCIO_MAX_PENDING:
+                raise SolapiSMSQueueFullError("SMS 작업 큐가 가득 찼습니다.")
+            self.pending += 1
+
+    def release(self) -> None:
+        with self.lock:
+            self.pending -= 1
+
+    async def run(self, func: TaskFunc, *args: Any) -> dict[str, Any]:
+        try:
+            async with self.semaphore:
+                return await func(*args)
+        finally:
+            self.release()
+
+
+_states: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopState] = (
+    weakref.WeakKeyDictionary()
+)
+_states_lock = threading.Lock()
+_background_loop: asyncio.AbstractEventLoop | None = None
+_background_thread: threading.Thread | None = None
+
+
+def _get_state(loop: asyncio.AbstractEventLoop) -> _LoopState:
+    with _states_lock:
+        state = _states.get(loop)
+        if state is None:
+            state = _states[loop] = _LoopState()
+        return state
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    global _background_loop, _background_thread
+    with _states_lock:
+        if _background_loop is None:
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever, name="solapi_sms_asyncio", daemon=True
+            )
+            thread.start()
+            _background_loop, _background_thread = loop, thread
+        return _background_loop
+
+
+def _schedule(
+    func: TaskFunc, *args: Any
+) -> asyncio.Task[dict[str, Any]] | concurrent.futures.Future[dict[str, Any]]:
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        background_loop = _get_background_loop()
+        state = _get_state(background_loop)
+        state.reserve()
+        return asyncio.run_coroutine_threadsafe(state.run(func, *args), background_loop)
+
+    state = _get_state(loop)
+    state.reserve()
+    task = loop.create_task(state.run(func, *args))
+    # Keep a strong reference until done; the loop only holds weak ones.
+    state.tasks.add(task)
+    task.add_done_callback(state.tasks.discard)
+    return task
+
+
+def backlog(lane: str) -> int:
+    """Sends scheduled and not yet finished, across event loops (lanes share them)."""
+    with _states_lock:
+        states = list(_states.values())
+    return sum(state.pending for state in states)
+
+
+def shutdown(timeout: float | None = None) -> None:
+    """
+    Finish sends queued on the background loop, then stop its thread.
+
+    Registered with ``atexit``. Tasks on a server-owned loop follow that
+    server's shutdown.
+    """
+    global _background_loop, _background_thread
+    with _states_lock:
+        loop, thread = _background_loop, _background_thread
+        _background_loop = _background_thread = None
+    if loop is None or thread is None:
+        return
+
+    async def _drain() -> None:
+        while (state := _states.get(loop)) is not None and state.pending:
+            await asyncio.sleep(0.05)
+        await aclose_http_client()
+
+    try:
+        asyncio.run_coroutine_threadsafe(_drain(), loop).result(timeout)
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout)
+
+
+atexit.register(shutdown)
+
+
+def enqueue_sms(
+    phone: str,
+    message: str,
+    message_type: str = "GENERIC",
+) -> asyncio.Task[dict[str, Any]] | concurrent.futures.Future[dict[str, Any]]:
+    """
+    Schedule SMS sending on the event loop.
+
+    Args:
+        phone: Recipient phone number
+        message: Message content
+        message_type: Message type (default: "GENERIC")
+
+    Returns:
+        asyncio.Task when called inside a running loop,
+        concurrent.futures.Future when called from sync code
+
+    Raises:
+        SolapiSMSQueueFullError: If too many sends are pending
+    """
+    return _schedule(asend_sms_func, phone, message, message_type)
+
+
+def enqueue_sms_batch(
+    messages: list[dict[str, str]],
+) -> asyncio.Task[dict[str, Any]] | concurrent.futures.Future[dict[str, Any]]:
+    """
+    Schedule a batch of SMS on the event loop as one pending task.
+
+    Args:
+        messages: dicts with 'phone', 'message' and 'message_type' keys
+
+    Returns:
+        asyncio.Task when called inside a running loop,
+        concurrent.futures.Future when called from sync code
+
+    Raises:
+        SolapiSMSQueueFullError: If too many sends are pending
+    """
+    return _schedule(asend_sms_batch_func, messages)
+
+
+def enqueue_sms_many(
+    messages: list[dict[str, str]], chunk_size: int
+) -> list[asyncio.Task[dict[str, Any]] | concurrent.futures.Future[dict[str, Any]]]:
+    """
+    Schedule messages on the event loop as one batch task per ``chunk_size`` messages.
+
+    Args:
+        messages: dicts with 'phone', 'message' and 'message_type' keys
+        chunk_size: Messages per task
+
+    Returns:
+        One asyncio.Task (or concurrent.futures.Future from sync code) per chunk
+
+    Raises:
+        SolapiSMSQueueFullError: If too many sends are pending
+    """
+    return [_schedule(asend_sms_batch_func, chunk) for chunk in chunked(messages, chunk_size)]
+
+
+def enqueue_delivery_reports(
+    reports: list[dict[str, str]],
+) -> asyncio.Task[dict[str, Any]] | concurrent.futures.Future[dict[str, Any]]:
+    """
+    Schedule delivery report processing on the event loop.
+
+    Args:
+        reports: Parsed SOLAPI delivery reports
+
+    Returns:
+        asyncio.Task when called inside a running loop,
+        concurrent.futures.Future when called from sync code
+
+    Raises:
+        SolapiSMSQueueFullError: If too many tasks are pending
+    """
+    return _schedule(aapply_delivery_reports_func, reports)
+
+
+def enqueue_verification_code(
+    phone: str,
+) -> asyncio.Task[dict[str, Any]] | concurrent.futures.Future[dict[str, Any]]:
+    """
+    Schedule verification code sending on the event loop.
+
+    Args:
+        phone: Recipient phone number
+
+    Returns:
+        asyncio.Task when called inside a running loop,
+        concurrent.futures.Future when called from sync code
+
+    Raises:
+        SolapiSMSQueueFullError: If too many sends are pending
+    """
+    return _schedule(asend_verification_code_func, phone)
@@ -3,25 +3,77 @@ Celery backend.
 
 Uses Celery for distributed task processing.
 Maintains backward compatibility with existing Celery-based deployments.
+
+Tasks are routed by lane (see ``tasks.lanes``): each lane can have its own
+queue and priority, falling back to SOLAPI_CELERY_QUEUE.
 """
 
 from __future__ import annotations
 
+import time
 from typing import Any, NoReturn
 
 # Check if Celery is available
 try:
-    from celery import shared_task
+    from celery import current_app, current_task, shared_task
 
     CELERY_AVAILABLE = True
 except ImportError:
     CELERY_AVAILABLE = False
+    current_app = None
+    current_task = None
     shared_task = None
 
 
 if CELERY_AVAILABLE:
+    from ... import settings, tracing
     from ...settings import SOLAPI_CELERY_QUEUE
-    from ..base import send_sms_func, send_verification_code_func
+    from ..backpressure import message_ttl
+    from ..base import (
+        apply_delivery_reports_func,
+        publish_chunks,
+        send_sms_batch_func,
+        send_sms_func,
+        send_verification_code_func,
+    )
+    from ..lanes import (
+        DEFAULT,
+        INTERACTIVE,
+        batch_lane,
+        lane_config,
+        lane_for_message_type,
+        wait_for_lane,
+    )
+
+    def _apply_options(lane: str) -> dict[str, Any]:
+        """apply_async() routing options for ``lane``, plus the trace context headers."""
+        config = lane_config(lane)
+        kwargs: dict[str, Any] = {}
+        queue = config.get("queue") or SOLAPI_CELERY_QUEUE
+        if queue:
+            kwargs["queue"] = queue
+        if config.get("priority") is not None:
+            kwargs["priority"] = config["priority"]
+        headers = tracing.inject()
+        if headers:
+            kwargs["headers"] = headers
+        return kwargs
+
+    def _trace_headers() -> dict[str, str]:
+        """Trace context headers of the message the running task came from."""
+        request = current_task.request if current_task else None
+        return {key: value for key in tracing.HEADERS if (value := getattr(request, key, None))}
+
+    def backlog(lane: str) -> int:
+        """
+        Messages waiting in the lane's broker queue.
+
+        Uses a passive queue declare, supported by the AMQP and Redis transports.
+        """
+        queue = _apply_options(lane).get("queue") or current_app.conf.task_default_queue
+        with current_app.connection_for_read() as connection:
+            declared = connection.default_channel.queue_declare(queue=queue, passive=True)
+        return int(declared.message_count)
 
     @shared_task(bind=True, max_retries=3, default_retry_delay=60)
     def send_sms_task(
@@ -29,6 +81,7 @@ if CELERY_AVAILABLE:
         phone: str,
         message: str,
         message_type: str = "GENERIC",
+        enqueued_at: float | None = None,
     ) -> dict[str, Any]:
         """
         SMS sending Celery task.
@@ -38,35 +91,86 @@ if CELERY_AVAILABLE:
             phone: Recipient phone number
             message: Message content
             message_type: Message type (default: "GENERIC")
+            enqueued_at: Enqueue time; sends older than the type's TTL are dropped
 
         Returns:
             dict with execution result
 
         Raises:
-            Retry: If sending fails (up to 3 retries)
+            Retry: If sending fails (up to 3 retries, unless SOLAPI_RETRY_MAX_ATTEMPTS
+                hands retries to the DB sweeper)
         """
-        result = send_sms_func(phone, message, message_type)
-        if not result["success"]:
+        with tracing.attach(_trace_headers()):
+            wait_for_lane(lane_for_message_type(message_type))
+            result = send_sms_func(phone, message, message_type, enqueued_at)
+        # With SOLAPI_RETRY_MAX_ATTEMPTS the failed log row is retried by the sweeper instead.
+        if (
+            not result["success"]
+            and not result.get("stale")
+            and not settings.SOLAPI_RETRY_MAX_ATTEMPTS
+        ):
             raise self.retry(exc=Exception("SMS sending failed"))
         return result
 
+    @shared_task
+    def send_sms_batch_task(messages: list[dict[str, str]]) -> dict[str, Any]:
+        """
+        Batch SMS sending Celery task.
+
+        Not retried as a whole: messages already accepted by SOLAPI
+        would be sent twice. Failures are recorded per message in SMSLog.
+
+        Args:
+            messages: dicts with 'phone', 'message' and 'message_type' keys
+
+        Returns:
+            dict with execution result
+        """
+        with tracing.attach(_trace_headers()):
+            wait_for_lane(batch_lane(messages), len(messages))
+            return send_sms_batch_func(messages)
+
+    @shared_task
+    def apply_delivery_reports_task(reports: list[dict[str, str]]) -> dict[str, Any]:
+        """
+        Delivery report processing Celery task.
+
+        Args:
+            reports: Parsed SOLAPI delivery reports
+
+        Returns:
+            dict with execution result
+        """
+        with tracing.attach(_trace_headers()):
+            return apply_delivery_reports_func(reports)
+
     @shared_task(bind=True, max_retries=3, default_retry_delay=60)
-    def send_verification_code_task(self: Any, phone: str) -> dict[str, Any]:
+    def send_verification_code_task(
+        self: Any, phone: str, enqueued_at: float | None = None
+    ) -> dict[str, Any]:
         """
         Verification code sending Celery task.
 
         Args:
             self: Celery task instance (bound)
             phone: Recipient phone number
+            enqueued_at: Enqueue time; requests older than the code TTL are dropped
 
         Returns:
             dict with execution result
 
         Raises:
-            Retry: If sending fails (up to 3 retries)
+            Retry: If sending fails (up to 3 retries, unless SOLAPI_RETRY_MAX_ATTEMPTS
+                hands retries to the DB sweeper)
         """
-        result = send_verification_code_func(phone)
-        if not result["success"]:
+        with tracing.attach(_trace_headers()):
+            wait_for_lane(INTERACTIVE)
+            result = send_verification_code_func(phone, enqueued_at)
+        if (
+            not result["success"]
+            and not result.get("stale")
+            and not settings.SOLAPI_RETRY_MAX_ATTEMPTS
+        ):
             raise self.retry(exc=Exception("Verification code sending failed"))
         return result
 
@@ -86,12 +190,71 @@ if CELERY_AVAILABLE:
         Returns:
             Celery AsyncResult
         """
-        kwargs: dict[str, Any] = {}
-        if SOLAPI_CELERY_QUEUE:
-            kwargs["queue"] = SOLAPI_CELERY_QUEUE
+        options = _apply_options(lane_for_message_type(message_type))
+        ttl = message_ttl(message_type)
+        if ttl:
+            options["expires"] = ttl
         return send_sms_task.apply_async(
             args=[phone, message, message_type],
-            **kwargs,
+            kwargs={"enqueued_at": time.time()},
+            **options,
+        )
+
+    def enqueue_sms_batch(messages: list[dict[str, str]]) -> Any:
+        """
+        Enqueue a batch of SMS to Celery as one task.
+
+        Args:
+            messages: dicts with 'phone', 'message' and 'message_type' keys
+
+        Returns:
+            Celery AsyncResult
+        """
+        return send_sms_batch_task.apply_async(
+            args=[messages],
+            **_apply_options(batch_lane(messages)),
+        )
+
+    def enqueue_sms_many(messages: list[dict[str, str]], chunk_size: int) -> list[Any]:
+        """
+        Enqueue messages to Celery as one batch task per ``chunk_size`` messages.
+
+        The tasks are published over one producer connection, as ``group``
+        does, but one by one so a failure part-way tells which chunks went out.
+
+        Args:
+            messages: dicts with 'phone', 'message' and 'message_type' keys
+            chunk_size: Messages per task
+
+        Returns:
+            One Celery AsyncResult per chunk
+
+        Raises:
+            SolapiSMSPublishError: Publishing stopped part-way
+        """
+        options = _apply_options(batch_lane(messages))
+        with current_app.producer_or_acquire() as producer:
+            return publish_chunks(
+                messages,
+                chunk_size,
+                lambda chunk: send_sms_batch_task.apply_async(
+                    args=[chunk], producer=producer, **options
+                ),
+            )
+
+    def enqueue_delivery_reports(reports: list[dict[str, str]]) -> Any:
+        """
+        Enqueue delivery report processing to Celery.
+
+        Args:
+            reports: Parsed SOLAPI delivery reports
+
+        Returns:
+            Celery AsyncResult
+        """
+        return apply_delivery_reports_task.apply_async(
+            args=[reports],
+            **_apply_options(DEFAULT),
         )
 
     def enqueue_verification_code(phone: str) -> Any:
@@ -104,12 +267,14 @@ if CELERY_AVAILABLE:
         Returns:
             Celery AsyncResult
         """
-        kwargs: dict[str, Any] = {}
-        if SOLAPI_CELERY_QUEUE:
-            kwargs["queue"] = SOLAPI_CELERY_QUEUE
+        options = _apply_options(INTERACTIVE)
+        ttl = message_ttl("VERIFICATION")
+        if ttl:
+            options["expires"] = ttl
         return send_verification_code_task.apply_async(
             args=[phone],
-            **kwargs,
+            kwargs={"enqueued_at": time.time()},
+            **options,
         )
 
 else:
@@ -120,12 +285,30 @@ else:
         phone: str,
         message: str,
         message_type: str = "GENERIC",
+        enqueued_at: float | None = None,
     ) -> NoReturn:
         raise ImportError(
             "Celery is required. Install celery package or set SOLAPI_TASK_BACKEND='sync'."
         )
 
-    def send_verification_code_task(self: Any, phone: str) -> NoReturn:
+    def send_sms_batch_task(messages: list[dict[str, str]]) -> NoReturn:
+        raise ImportError(
+            "Celery is required. Install celery package or set SOLAPI_TASK_BACKEND='sync'."
+        )
+
+    def apply_delivery_reports_task(reports: list[dict[str, str]]) -> NoReturn:
+        raise ImportError(
+            "Celery is required. Install celery package or set SOLAPI_TASK_BACKEND='sync'."
+        )
+
+    def send_verification_code_task(
+        self: Any, phone: str, enqueued_at: float | None = None
+    ) -> NoReturn:
+        raise ImportError(
+            "Celery is required. Install celery package or set SOLAPI_TASK_BACKEND='sync'."
+        )
+
+    def backlog(lane: str) -> NoReturn:  # type: ignore[misc]
         raise ImportError(
             "Celery is required. Install celery package or set SOLAPI_TASK_BACKEND='sync'."
         )
@@ -139,6 +322,23 @@ else:
             "Celery is required. Install celery package or set SOLAPI_TASK_BACKEND='sync'."
         )
 
+    def enqueue_sms_batch(messages: list[dict[str, str]]) -> NoReturn:  # type: ignore[misc]
+        raise ImportError(
+            "Celery is required. Install celery package or set SOLAPI_TASK_BACKEND='sync'."
+        )
+
+    def enqueue_sms_many(  # type: ignore[misc]
+        messages: list[dict[str, str]], chunk_size: int
+    ) -> NoReturn:
+        raise ImportError(
+            "Celery is required. Install celery package or set SOLAPI_TASK_BACKEND='sync'."
+        )
+
+    def enqueue_delivery_reports(reports: list[dict[str, str]]) -> NoReturn:  # type: ignore[misc]
+        raise ImportError(
+            "Celery is required. Install celery package or set SOLAPI_TASK_BACKEND='sync'."
+        )
+
     def enqueue_verification_code(phone: str) -> NoReturn:  # type: ignore[misc]
         raise ImportError(
             "Celery is required. Install celery package or set SOLAPI_TASK_BACKEND='sync'."
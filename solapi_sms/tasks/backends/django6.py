@@ -3,10 +3,14 @@ Django 6 Tasks backend.
 
 Uses Django's built-in Tasks framework (Django 6.0+).
 Requires a configured TASKS backend in settings.
+
+Tasks are routed by lane (see ``tasks.lanes``) through ``Task.using()``;
+lane queues must be listed in the TASKS backend's QUEUES.
 """
 
 from __future__ import annotations
 
+import time
 from typing import Any, NoReturn
 
 # Check if Django 6 Tasks is available
@@ -20,13 +24,48 @@ except ImportError:
 
 
 if DJANGO_TASKS_AVAILABLE:
-    from ..base import send_sms_func, send_verification_code_func
+    from ... import tracing
+    from ..base import (
+        apply_delivery_reports_func,
+        publish_chunks,
+        send_sms_batch_func,
+        send_sms_func,
+        send_verification_code_func,
+    )
+    from ..lanes import (
+        DEFAULT,
+        INTERACTIVE,
+        batch_lane,
+        lane_config,
+        lane_for_message_type,
+        wait_for_lane,
+    )
+
+    def _using_options(lane: str) -> dict[str, Any]:
+        """Task.using() routing options for ``lane``."""
+        config = lane_config(lane)
+        kwargs: dict[str, Any] = {}
+        if config.get("queue"):
+            kwargs["queue_name"] = config["queue"]
+        if config.get("priority") is not None:
+            kwargs["priority"] = config["priority"]
+        return kwargs
+
+    def backlog(lane: str) -> None:
+        """
+        Django Tasks has no portable way to count queued tasks.
+
+        Set SOLAPI_BACKLOG_FUNCTION to inspect your task store instead.
+        """
+        return None
 
     @task
     def send_sms_task(
         phone: str,
         message: str,
         message_type: str = "GENERIC",
+        enqueued_at: float | None = None,
+        trace_context: dict[str, str] | None = None,
     ) -> dict[str, Any]:
         """
         SMS sending task for Django 6 Tasks.
@@ -35,24 +74,71 @@ if DJANGO_TASKS_AVAILABLE:
             phone: Recipient phone number
             message: Message content
             message_type: Message type (default: "GENERIC")
+            enqueued_at: Enqueue time; sends older than the type's TTL are dropped
+            trace_context: Trace context of the enqueuing process (see tracing)
+
+        Returns:
+            dict with execution result
+        """
+        with tracing.attach(trace_context):
+            wait_for_lane(lane_for_message_type(message_type))
+            return send_sms_func(phone, message, message_type, enqueued_at)
+
+    @task
+    def send_sms_batch_task(
+        messages: list[dict[str, str]], trace_context: dict[str, str] | None = None
+    ) -> dict[str, Any]:
+        """
+        Batch SMS sending task for Django 6 Tasks.
+
+        Args:
+            messages: dicts with 'phone', 'message' and 'message_type' keys
+            trace_context: Trace context of the enqueuing process (see tracing)
 
         Returns:
             dict with execution result
         """
-        return send_sms_func(phone, message, message_type)
+        with tracing.attach(trace_context):
+            wait_for_lane(batch_lane(messages), len(messages))
+            return send_sms_batch_func(messages)
 
     @task
-    def send_verification_code_task(phone: str) -> dict[str, Any]:
+    def apply_delivery_reports_task(
+        reports: list[dict[str, str]], trace_context: dict[str, str] | None = None
+    ) -> dict[str, Any]:
+        """
+        Delivery report processing task for Django 6 Tasks.
+
+        Args:
+            reports: Parsed SOLAPI delivery reports
+            trace_context: Trace context of the enqueuing process (see tracing)
+
+        Returns:
+            dict with execution result
+        """
+        with tracing.attach(trace_context):
+            return apply_delivery_reports_func(reports)
+
+    @task
+    def send_verification_code_task(
+        phone: str,
+        enqueued_at: float | None = None,
+        trace_context: dict[str, str] | None = None,
+    ) -> dict[str, Any]:
         """
         Verification code sending task for Django 6 Tasks.
 
         Args:
             phone: Recipient phone number
+            enqueued_at: Enqueue time; requests older than the code TTL are dropped
+            trace_context: Trace context of the enqueuing process (see tracing)
 
         Returns:
             dict with execution result
         """
-        return send_verification_code_func(phone)
+        with tracing.attach(trace_context):
+            wait_for_lane(INTERACTIVE)
+            return send_verification_code_func(phone, enqueued_at)
 
     def enqueue_sms(
         phone: str,
@@ -70,10 +156,68 @@ if DJANGO_TASKS_AVAILABLE:
         Returns:
             TaskResult from Django Tasks
         """
-        return send_sms_task.enqueue(
+        options = _using_options(lane_for_message_type(message_type))
+        return send_sms_task.using(**options).enqueue(
             phone=phone,
             message=message,
             message_type=message_type,
+            enqueued_at=time.time(),
+            trace_context=tracing.inject() or None,
+        )
+
+    def enqueue_sms_batch(messages: list[dict[str, str]]) -> Any:
+        """
+        Enqueue a batch of SMS as one task.
+
+        Args:
+            messages: dicts with 'phone', 'message' and 'message_type' keys
+
+        Returns:
+            TaskResult from Django Tasks
+        """
+        options = _using_options(batch_lane(messages))
+        return send_sms_batch_task.using(**options).enqueue(
+            messages=messages, trace_context=tracing.inject() or None
+        )
+
+    def enqueue_sms_many(messages: list[dict[str, str]], chunk_size: int) -> list[Any]:
+        """
+        Enqueue messages as one batch task per ``chunk_size`` messages.
+
+        Django Tasks has no bulk enqueue, so the chunks are enqueued one by
+        one through a single routed Task.
+
+        Args:
+            messages: dicts with 'phone', 'message' and 'message_type' keys
+            chunk_size: Messages per task
+
+        Returns:
+            One TaskResult per chunk
+
+        Raises:
+            SolapiSMSPublishError: Enqueueing stopped part-way
+        """
+        routed = send_sms_batch_task.using(**_using_options(batch_lane(messages)))
+        trace_context = tracing.inject() or None
+        return publish_chunks(
+            messages,
+            chunk_size,
+            lambda chunk: routed.enqueue(messages=chunk, trace_context=trace_context),
+        )
+
+    def enqueue_delivery_reports(reports: list[dict[str, str]]) -> Any:
+        """
+        Enqueue delivery report processing task.
+
+        Args:
+            reports: Parsed SOLAPI delivery reports
+
+        Returns:
+            TaskResult from Django Tasks
+        """
+        options = _using_options(DEFAULT)
+        return apply_delivery_reports_task.using(**options).enqueue(
+            reports=reports, trace_context=tracing.inject() or None
         )
 
     def enqueue_verification_code(phone: str) -> Any:
@@ -86,7 +230,10 @@ if DJANGO_TASKS_AVAILABLE:
         Returns:
             TaskResult from Django Tasks
         """
-        return send_verification_code_task.enqueue(phone=phone)
+        options = _using_options(INTERACTIVE)
+        return send_verification_code_task.using(**options).enqueue(
+            phone=phone, enqueued_at=time.time(), trace_context=tracing.inject() or None
+        )
 
 else:
     # Fallback when Django 6 Tasks is not available
@@ -95,12 +242,37 @@ else:
         phone: str,
         message: str,
         message_type: str = "GENERIC",
+        enqueued_at: float | None = None,
+        trace_context: dict[str, str] | None = None,
     ) -> NoReturn:
         raise ImportError(
             "Django 6 Tasks is required. Use Django 6+ or set SOLAPI_TASK_BACKEND='sync'."
         )
 
-    def send_verification_code_task(phone: str) -> NoReturn:
+    def send_sms_batch_task(  # type: ignore[misc]
+        messages: list[dict[str, str]], trace_context: dict[str, str] | None = None
+    ) -> NoReturn:
+        raise ImportError(
+            "Django 6 Tasks is required. Use Django 6+ or set SOLAPI_TASK_BACKEND='sync'."
+        )
+
+    def apply_delivery_reports_task(  # type: ignore[misc]
+        reports: list[dict[str, str]], trace_context: dict[str, str] | None = None
+    ) -> NoReturn:
+        raise ImportError(
+            "Django 6 Tasks is required. Use Django 6+ or set SOLAPI_TASK_BACKEND='sync'."
+        )
+
+    def send_verification_code_task(
+        phone: str,
+        enqueued_at: float | None = None,
+        trace_context: dict[str, str] | None = None,
+    ) -> NoReturn:
+        raise ImportError(
+            "Django 6 Tasks is required. Use Django 6+ or set SOLAPI_TASK_BACKEND='sync'."
+        )
+
+    def backlog(lane: str) -> NoReturn:  # type: ignore[misc]
         raise ImportError(
             "Django 6 Tasks is required. Use Django 6+ or set SOLAPI_TASK_BACKEND='sync'."
         )
@@ -114,6 +286,23 @@ else:
             "Django 6 Tasks is required. Use Django 6+ or set SOLAPI_TASK_BACKEND='sync'."
         )
 
+    def enqueue_sms_batch(messages: list[dict[str, str]]) -> NoReturn:  # type: ignore[misc]
+        raise ImportError(
+            "Django 6 Tasks is required. Use Django 6+ or set SOLAPI_TASK_BACKEND='sync'."
+        )
+
+    def enqueue_sms_many(  # type: ignore[misc]
+        messages: list[dict[str, str]], chunk_size: int
+    ) -> NoReturn:
+        raise ImportError(
+            "Django 6 Tasks is required. Use Django 6+ or set SOLAPI_TASK_BACKEND='sync'."
+        )
+
+    def enqueue_delivery_reports(reports: list[dict[str, str]]) -> NoReturn:  # type: ignore[misc]
+        raise ImportError(
+            "Django 6 Tasks is required. Use Django 6+ or set SOLAPI_TASK_BACKEND='sync'."
+        )
+
     def enqueue_verification_code(phone: str) -> NoReturn:  # type: ignore[misc]
         raise ImportError(
             "Django 6 Tasks is required. Use Django 6+ or set SOLAPI_TASK_BACKEND='sync'."
@@ -2,14 +2,21 @@
 Synchronous execution backend (default).
 
 Tasks are executed immediately in the same process.
-No worker required.
+No worker required. With SOLAPI_SPOOL_PATH set, sends that cannot reach
+SOLAPI are kept in the local spool (see tasks.spool).
 """
 
 from __future__ import annotations
 
 from typing import Any
 
-from ..base import send_sms_func, send_verification_code_func
+from ..base import (
+    apply_delivery_reports_func,
+    chunked,
+    send_sms_batch_func,
+    send_sms_func,
+    send_verification_code_func,
+)
 
 
 def enqueue_sms(
@@ -28,7 +35,47 @@ def enqueue_sms(
     Returns:
         dict with execution result
     """
-    return send_sms_func(phone, message, message_type)
+    return send_sms_func(phone, message, message_type, spool=True)
+
+
+def enqueue_sms_batch(messages: list[dict[str, str]]) -> dict[str, Any]:
+    """
+    Execute a batch of SMS through the bulk path synchronously.
+
+    Args:
+        messages: dicts with 'phone', 'message' and 'message_type' keys
+
+    Returns:
+        dict with execution result
+    """
+    return send_sms_batch_func(messages)
+
+
+def enqueue_sms_many(messages: list[dict[str, str]], chunk_size: int) -> list[dict[str, Any]]:
+    """
+    Send messages through the bulk path synchronously, ``chunk_size`` at a time.
+
+    Args:
+        messages: dicts with 'phone', 'message' and 'message_type' keys
+        chunk_size: Messages per chunk
+
+    Returns:
+        One execution result per chunk
+    """
+    return [send_sms_batch_func(chunk) for chunk in chunked(messages, chunk_size)]
+
+
+def enqueue_delivery_reports(reports: list[dict[str, str]]) -> dict[str, Any]:
+    """
+    Apply delivery reports synchronously.
+
+    Args:
+        reports: Parsed SOLAPI delivery reports
+
+    Returns:
+        dict with execution result
+    """
+    return apply_delivery_reports_func(reports)
 
 
 def enqueue_verification_code(phone: str) -> dict[str, Any]:
@@ -41,4 +88,9 @@ def enqueue_verification_code(phone: str) -> dict[str, Any]:
     Returns:
         dict with execution result
     """
-    return send_verification_code_func(phone)
+    return send_verification_code_func(phone, spool=True)
+
+
+def backlog(lane: str) -> int:
+    """Tasks run inline, so nothing is ever queued."""
+    return 0
@@ -0,0 +1,200 @@
+"""
+Thread pool backend.
+
+Tasks run on a bounded, process-wide ThreadPoolExecutor so the caller
+returns before the SOLAPI round trip. No broker or worker process required.
+
+Queued work lives in process memory: it is flushed on interpreter exit,
+but lost if the process is killed. Sends that cannot reach SOLAPI are kept
+in the local spool when SOLAPI_SPOOL_PATH is set (see tasks.spool).
+"""
+
+from __future__ import annotations
+
+import atexit
+import contextvars
+import functools
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+from django.db import close_old_connections
+
+from ... import settings
+from ...exceptions import SolapiSMSQueueFullError
+from ..base import (
+    apply_delivery_reports_func,
+    chunked,
+    send_sms_batch_func,
+    send_sms_func,
+    send_verification_code_func,
+)
+
+_lock = threading.Lock()
+_executor: ThreadPoolExecutor | None = None
+_slots: threading.BoundedSemaphore | None = None
+_queued = 0  # submitted and not yet finished
+
+
+def _get_executor() -> tuple[ThreadPoolExecutor, threading.BoundedSemaphore]:
+    global _executor, _slots
+    with _lock:
+        if _executor is None or _slots is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.SOLAPI_THREAD_MAX_WORKERS,
+                thread_name_prefix="solapi_sms",
+            )
+            _slots = threading.BoundedSemaphore(
+                settings.SOLAPI_THREAD_MAX_WORKERS + settings.SOLAPI_THREAD_QUEUE_SIZE
+            )
+        return _executor, _slots
+
+
+def _run(
+    slots: threading.BoundedSemaphore,
+    func: Callable[..., dict[str, Any]],
+    *args: Any,
+) -> dict[str, Any]:
+    global _queued
+    # Worker threads outlive requests, so apply the same connection
+    # lifecycle Django applies around a request.
+    close_old_connections()
+    try:
+        return func(*args)
+    finally:
+        close_old_connections()
+        with _lock:
+            _queued -= 1
+        slots.release()
+
+
+def _submit(func: Callable[..., dict[str, Any]], *args: Any) -> Future[dict[str, Any]]:
+    executor, slots = _get_executor()
+    timeout = settings.SOLAPI_THREAD_SUBMIT_TIMEOUT
+    acquired = slots.acquire(timeout=timeout) if timeout else slots.acquire(blocking=False)
+    global _queued
+    if not acquired:
+        raise SolapiSMSQueueFullError("SMS 작업 큐가 가득 찼습니다.")
+    with _lock:
+        _queued += 1
+    try:
+        # Run in a copy of the caller's context so tracing spans keep their parent.
+        return executor.submit(contextvars.copy_context().run, _run, slots, func, *args)
+    except RuntimeError:
+        with _lock:
+            _queued -= 1
+        slots.release()
+        raise
+
+
+def backlog(lane: str) -> int:
+    """Tasks submitted to the pool and not yet finished (lanes share one pool)."""
+    with _lock:
+        return _queued
+
+
+def shutdown(wait: bool = True) -> None:
+    """
+    Stop accepting work and, with ``wait=True``, run everything already queued.
+
+    Registered with ``atexit``.
+    """
+    global _executor, _slots
+    with _lock:
+        executor, _executor, _slots = _executor, None, None
+    if executor is not None:
+        executor.shutdown(wait=wait)
+
+
+atexit.register(shutdown)
+
+
+def enqueue_sms(
+    phone: str,
+    message: str,
+    message_type: str = "GENERIC",
+) -> Future[dict[str, Any]]:
+    """
+    Submit SMS sending to the thread pool.
+
+    Args:
+        phone: Recipient phone number
+        message: Message content
+        message_type: Message type (default: "GENERIC")
+
+    Returns:
+        concurrent.futures.Future resolving to the execution result
+
+    Raises:
+        SolapiSMSQueueFullError: If the pool and its queue are full
+    """
+    return _submit(functools.partial(send_sms_func, spool=True), phone, message, message_type)
+
+
+def enqueue_sms_batch(messages: list[dict[str, str]]) -> Future[dict[str, Any]]:
+    """
+    Submit a batch of SMS to the thread pool as one task.
+
+    Args:
+        messages: dicts with 'phone', 'message' and 'message_type' keys
+
+    Returns:
+        concurrent.futures.Future resolving to the execution result
+
+    Raises:
+        SolapiSMSQueueFullError: If the pool and its queue are full
+    """
+    return _submit(send_sms_batch_func, messages)
+
+
+def enqueue_sms_many(
+    messages: list[dict[str, str]], chunk_size: int
+) -> list[Future[dict[str, Any]]]:
+    """
+    Submit messages to the thread pool as one batch task per ``chunk_size`` messages.
+
+    Args:
+        messages: dicts with 'phone', 'message' and 'message_type' keys
+        chunk_size: Messages per task
+
+    Returns:
+        One concurrent.futures.Future per chunk
+
+    Raises:
+        SolapiSMSQueueFullError: If the pool and its queue are full; chunks
+            submitted before that keep running
+    """
+    return [_submit(send_sms_batch_func, chunk) for chunk in chunked(messages, chunk_size)]
+
+
+def enqueue_delivery_reports(reports: list[dict[str, str]]) -> Future[dict[str, Any]]:
+    """
+    Submit delivery report processing to the thread pool.
+
+    Args:
+        reports: Parsed SOLAPI delivery reports
+
+    Returns:
+        concurrent.futures.Future resolving to the execution result
+
+    Raises:
+        SolapiSMSQueueFullError: If the pool and its queue are full
+    """
+    return _submit(apply_delivery_reports_func, reports)
+
+
+def enqueue_verification_code(phone: str) -> Future[dict[str, Any]]:
+    """
+    Submit verification code sending to the thread pool.
+
+    Args:
+        phone: Recipient phone number
+
+    Returns:
+        concurrent.futures.Future resolving to the execution result
+
+    Raises:
+        SolapiSMSQueueFullError: If the pool and its queue are full
+    """
+    return _submit(functools.partial(send_verification_code_func, spool=True), phone)
@@ -6,13 +6,54 @@ These functions contain the actual business logic and are called by all backends
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import Any
 
+from .. import tracing
 
+
+def chunked(messages: list[dict[str, str]], size: int) -> list[list[dict[str, str]]]:
+    """Split ``messages`` into lists of at most ``size`` messages."""
+    return [messages[start : start + size] for start in range(0, len(messages), size)]
+
+
+def publish_chunks(
+    messages: list[dict[str, str]],
+    size: int,
+    publish: Callable[[list[dict[str, str]]], Any],
+) -> list[Any]:
+    """
+    Publish ``messages`` in chunks of ``size``, in order.
+
+    Returns:
+        One ``publish`` result per chunk
+
+    Raises:
+        SolapiSMSPublishError: A chunk failed to publish; carries the handles
+            of the chunks before it and the messages of the rest
+    """
+    from ..exceptions import SolapiSMSPublishError
+
+    chunks = chunked(messages, size)
+    handles: list[Any] = []
+    for index, chunk in enumerate(chunks):
+        try:
+            handles.append(publish(chunk))
+        except Exception as exc:
+            unpublished = [item for rest in chunks[index:] for item in rest]
+            raise SolapiSMSPublishError(
+                f"{len(chunks)}개 중 {index}개 청크만 발행되었습니다", handles, unpublished
+            ) from exc
+    return handles
+
+
+@tracing.traced("solapi_sms.task.send_sms")
 def send_sms_func(
     phone: str,
     message: str,
     message_type: str = "GENERIC",
+    enqueued_at: float | None = None,
+    spool: bool = False,
 ) -> dict[str, Any]:
     """
     Send SMS - pure function.
@@ -21,34 +62,182 @@ def send_sms_func(
         phone: Recipient phone number
         message: Message content
         message_type: Message type (default: "GENERIC")
+        enqueued_at: Enqueue time (epoch seconds); stale sends are dropped
+        spool: Keep the message in the local spool when SOLAPI is unreachable
+            (backends without retries of their own)
 
     Returns:
-        dict with 'success' and 'phone' keys
+        dict with 'success' and 'phone' keys ('stale' when dropped)
     """
+    from ..models import SMSLogStatus
     from ..services import SMSService
+    from .backpressure import is_stale
 
     service = SMSService()
-    success = service.send_sms(phone, message, message_type=message_type)
+    if is_stale(message_type, enqueued_at):
+        service._log_result(
+            phone=phone,
+            message=message,
+            message_type=message_type,
+            status=SMSLogStatus.SKIPPED,
+            response_data={"skipped_reason": "stale"},
+        )
+        return {"success": False, "phone": phone, "stale": True}
+    success = service.send_sms(phone, message, message_type=message_type, spool=spool)
     return {"success": success, "phone": phone}
 
 
-def send_verification_code_func(phone: str) -> dict[str, Any]:
+@tracing.traced("solapi_sms.task.send_sms_batch")
+def send_sms_batch_func(messages: list[dict[str, str]]) -> dict[str, Any]:
+    """
+    Send several SMS through the bulk path - pure function.
+
+    Messages of paused or canceled campaigns are held or skipped first
+    (see solapi_sms.campaigns).
+
+    Args:
+        messages: dicts with 'phone', 'message' and 'message_type' keys
+
+    Returns:
+        dict with 'success', 'sent' and 'failed' keys
+    """
+    from ..campaigns import admit_messages
+    from ..services import SMSService
+
+    results = SMSService().send_bulk(admit_messages(messages))
+    sent = sum(results)
+    return {"success": sent == len(results), "sent": sent, "failed": len(results) - sent}
+
+
+@tracing.traced("solapi_sms.task.send_verification_code")
+def send_verification_code_func(
+    phone: str, enqueued_at: float | None = None, spool: bool = False
+) -> dict[str, Any]:
     """
     Send verification code - pure function.
 
     Args:
         phone: Recipient phone number
+        enqueued_at: Enqueue time (epoch seconds); a request older than the
+            code's lifetime is dropped without creating a code
+        spool: Keep the message in the local spool when SOLAPI is unreachable
 
     Returns:
         dict with 'success', 'phone', and 'verification_id' keys
+        ('stale' when dropped)
     """
     from ..services import SMSService
+    from .backpressure import is_stale
+
+    if is_stale("VERIFICATION", enqueued_at):
+        return {"success": False, "phone": phone, "verification_id": None, "stale": True}
 
     service = SMSService()
     verification = service.create_verification(phone)
-    success = service.send_verification_code(phone, verification.code)  # type: ignore[attr-defined]
+    success = service.send_verification_code(
+        phone,
+        verification.code,  # type: ignore[attr-defined]
+        spool=spool,
+    )
+    return {
+        "success": success,
+        "phone": phone,
+        "verification_id": verification.id,  # type: ignore[attr-defined]
+    }
+
+
+@tracing.traced("solapi_sms.task.apply_delivery_reports")
+def apply_delivery_reports_func(reports: list[dict[str, str]]) -> dict[str, Any]:
+    """
+    Apply SOLAPI delivery reports - pure function.
+
+    Args:
+        reports: Parsed reports from ``delivery.parse_delivery_reports``
+
+    Returns:
+        dict with 'reports' and 'updated' keys
+    """
+    from ..delivery import apply_delivery_reports
+
+    updated = apply_delivery_reports(reports)
+    return {"reports": len(reports), "updated": updated}
+
+
+@tracing.traced("solapi_sms.task.send_sms")
+async def asend_sms_func(
+    phone: str,
+    message: str,
+    message_type: str = "GENERIC",
+) -> dict[str, Any]:
+    """
+    Send SMS - async pure function.
+
+    Args:
+        phone: Recipient phone number
+        message: Message content
+        message_type: Message type (default: "GENERIC")
+
+    Returns:
+        dict with 'success' and 'phone' keys
+    """
+    from ..services import SMSService
+
+    service = SMSService()
+    success = await service.asend_sms(phone, message, message_type=message_type)
+    return {"success": success, "phone": phone}
+
+
+@tracing.traced("solapi_sms.task.send_sms_batch")
+async def asend_sms_batch_func(messages: list[dict[str, str]]) -> dict[str, Any]:
+    """
+    Send several SMS through the bulk path in a worker thread - async pure function.
+
+    Like the other backends, a batch costs one send-many request per
+    SOLAPI_BULK_BATCH_SIZE messages and one slot of the loop's concurrency
+    limit, and campaign batches are counted and can be paused (see
+    solapi_sms.campaigns).
+
+    Args:
+        messages: dicts with 'phone', 'message' and 'message_type' keys
+
+    Returns:
+        dict with 'success', 'sent' and 'failed' keys
+    """
+    from asgiref.sync import sync_to_async
+
+    return await sync_to_async(send_sms_batch_func)(messages)
+
+
+@tracing.traced("solapi_sms.task.send_verification_code")
+async def asend_verification_code_func(phone: str) -> dict[str, Any]:
+    """
+    Send verification code - async pure function.
+
+    Args:
+        phone: Recipient phone number
+
+    Returns:
+        dict with 'success', 'phone', and 'verification_id' keys
+    """
+    from ..services import SMSService
+
+    service = SMSService()
+    verification = await service.acreate_verification(phone)
+    success = await service.asend_verification_code(phone, verification.code)  # type: ignore[attr-defined]
     return {
         "success": success,
         "phone": phone,
         "verification_id": verification.id,  # type: ignore[attr-defined]
     }
+
+
+@tracing.traced("solapi_sms.task.apply_delivery_reports")
+async def aapply_delivery_reports_func(reports: list[dict[str, str]]) -> dict[str, Any]:
+    """
+    Apply SOLAPI delivery reports - async pure function.
+
+    The bulk UPDATEs run in a worker thread via ``sync_to_async``.
+    """
+    from asgiref.sync import sync_to_async
+
+    return await sync_to_async(apply_delivery_reports_func)(reports)
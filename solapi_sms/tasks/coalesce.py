@@ -0,0 +1,78 @@
+"""
+Transaction-scoped coalescing of enqueued SMS.
+
+With SOLAPI_COALESCE_ON_COMMIT = True, enqueue_sms() called inside an atomic
+block buffers the message instead of publishing it. When the transaction
+commits, each buffer is published as one batch through the backend's
+enqueue_sms_batch(); on rollback the buffer is discarded along with the
+on_commit callback.
+
+One buffer is kept per savepoint level, so a rolled-back savepoint drops
+exactly the messages enqueued inside it. Buffers only hold a weak reference
+to their on_commit callback: when Django discards the callback on rollback,
+the reference dies and the buffer is replaced on the next enqueue.
+"""
+
+from __future__ import annotations
+
+import weakref
+from collections.abc import Callable
+from typing import Any
+
+from django.db import transaction
+
+_BUFFERS_ATTR = "_solapi_sms_buffers"
+
+_Buffers = dict[
+    tuple[str | None, ...], tuple["weakref.ref[Callable[[], None]]", list[dict[str, str]]]
+]
+
+
+def buffer_sms(
+    phone: str,
+    message: str,
+    message_type: str,
+    publish: Callable[[list[dict[str, str]]], Any],
+    *,
+    using: str | None = None,
+) -> bool:
+    """
+    Buffer a message until the current transaction commits.
+
+    Args:
+        phone: Recipient phone number
+        message: Message content
+        message_type: Message type
+        publish: Called once on commit with the buffered messages
+        using: Database alias (defaults to the default database)
+
+    Returns:
+        False when no transaction is active and the caller should send now
+    """
+    connection = transaction.get_connection(using)
+    if not connection.in_atomic_block:
+        return False
+
+    buffers: _Buffers = connection.__dict__.setdefault(_BUFFERS_ATTR, {})
+    key = tuple(connection.savepoint_ids)
+    entry = buffers.get(key)
+    if entry is None or entry[0]() is None:
+        # Forget buffers whose transaction or savepoint was rolled back.
+        for stale_key in [k for k, (ref, _) in buffers.items() if ref() is None]:
+            del buffers[stale_key]
+
+        messages: list[dict[str, str]] = []
+
+        def flush() -> None:
+            if key in buffers and buffers[key][1] is messages:
+                del buffers[key]
+            if messages:
+                publish(messages)
+
+        # Only Django's on_commit list keeps ``flush`` alive, so it must not
+        # reference itself.
+        transaction.on_commit(flush, using=using)
+        entry = buffers[key] = (weakref.ref(flush), messages)
+
+    entry[1].append({"phone": phone, "message": message, "message_type": message_type})
+    return True
@@ -0,0 +1,99 @@
+"""
+Priority lanes for the celery and django6 backends.
+
+Every task is published on a lane: "interactive" (verification codes and
+other types mapped in SOLAPI_MESSAGE_TYPE_LANES), "default" (other single
+sends, delivery reports) or "bulk" (batches). SOLAPI_TASK_LANES gives each
+lane its own queue and priority, so OTPs never wait behind a fan-out, and an
+optional rate limit that caps a lane's share of SOLAPI throughput.
+
+In-process backends (sync, thread, asyncio) ignore lanes.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from django.core.cache import cache
+
+from .. import settings
+
+INTERACTIVE = "interactive"
+DEFAULT = "default"
+BULK = "bulk"
+
+# Rate limit window in seconds; rate_limit is counted per window.
+_WINDOW_SECONDS = 1
+
+
+def lane_config(lane: str) -> dict[str, Any]:
+    """Return the SOLAPI_TASK_LANES entry for ``lane`` (empty when unset)."""
+    return dict(settings.SOLAPI_TASK_LANES.get(lane) or {})
+
+
+def lane_for_message_type(message_type: str) -> str:
+    """Lane for a single send of ``message_type``."""
+    return str(settings.SOLAPI_MESSAGE_TYPE_LANES.get(message_type, DEFAULT))
+
+
+def _batch_lane_for(message_type: str) -> str:
+    lane = lane_for_message_type(message_type)
+    return BULK if lane == DEFAULT else lane
+
+
+def batch_lane(messages: Sequence[Mapping[str, str]]) -> str:
+    """
+    Lane for a batch: the messages' own lane when they all share one,
+    otherwise "bulk".
+    """
+    lanes = {_batch_lane_for(item.get("message_type") or "GENERIC") for item in messages}
+    return lanes.pop() if len(lanes) == 1 else BULK
+
+
+def split_by_lane(
+    messages: Sequence[Mapping[str, str]],
+) -> list[tuple[str, list[dict[str, str]]]]:
+    """Group batch messages by lane so interactive ones are not published as bulk."""
+    groups: dict[str, list[dict[str, str]]] = {}
+    for item in messages:
+        lane = _batch_lane_for(item.get("message_type") or "GENERIC")
+        groups.setdefault(lane, []).append(dict(item))
+    return list(groups.items())
+
+
+def throttle(lane: str, count: int = 1) -> float:
+    """
+    Reserve ``count`` sends on ``lane``'s rate limit.
+
+    Counts are kept per one-second window in Django's cache, so the limit
+    holds across workers sharing that cache. The first reservation in a
+    window is always admitted, so batches larger than the limit still run.
+
+    Returns:
+        0 when admitted, otherwise seconds to wait before trying again
+    """
+    limit = lane_config(lane).get("rate_limit")
+    if not limit:
+        return 0.0
+    now = time.time()
+    window = int(now // _WINDOW_SECONDS)
+    key = f"solapi_sms_lane_{lane}_{window}"
+    cache.add(key, 0, _WINDOW_SECONDS * 2)
+    try:
+        used = cache.incr(key, count)
+    except ValueError:
+        # Evicted between add and incr: this reservation opens the window.
+        cache.set(key, count, _WINDOW_SECONDS * 2)
+        return 0.0
+    if used > limit and used > count:
+        cache.decr(key, count)
+        return (window + 1) * _WINDOW_SECONDS - now
+    return 0.0
+
+
+def wait_for_lane(lane: str, count: int = 1) -> None:
+    """Block until ``count`` sends fit in ``lane``'s rate limit."""
+    while (wait := throttle(lane, count)) > 0:
+        time.sleep(wait)
@@ -0,0 +1,407 @@
+"""
+Durable local spool for sends that could not be handed off.
+
+Configuration:
+    # settings.py
+    SOLAPI_SPOOL_PATH = BASE_DIR / "var" / "solapi_spool.sqlite3"
+
+When set, messages are appended to a SQLite database in WAL mode instead of
+being lost when
+
+- ``enqueue_sms`` / ``enqueue_verification_code`` cannot publish to the
+  broker (celery, django6), or
+- an in-process send (sync, thread backends) cannot connect to SOLAPI.
+
+``drain_spool`` (``manage.py solapi_drain_spool``) replays spooled messages
+oldest first in batches and stops at the first batch that still cannot be
+handed off, so an outage costs one attempt per drain tick rather than one
+per message. Rows are claimed with a lease, so several drainers may share a
+spool file. Sends older than their message type's TTL are dropped on replay
+(see ``backpressure.is_stale``).
+
+A replayed send that fails for another reason is never sent again: an
+error while sending or logging it (SOLAPI may have accepted it) drops the
+row, an error before it (creating the verification code) releases it for
+the next drain, up to SOLAPI_SPOOL_MAX_ATTEMPTS claims.
+
+SOLAPI_SPOOL_SYNCHRONOUS is SQLite's ``synchronous`` pragma: "FULL" fsyncs
+every append, "NORMAL" only at WAL checkpoints (an OS crash may lose the
+last appends, a process crash does not), "OFF" leaves it to the OS.
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+import time
+from types import ModuleType
+from typing import Any
+
+from .. import settings
+
+logger = logging.getLogger(__name__)
+
+SMS = "sms"
+VERIFICATION = "verification"
+
+# Seconds a drainer may hold claimed rows before another drainer takes them over.
+_CLAIM_SECONDS = 300
+
+# Backends whose sends run in this process: the drainer sends their rows itself.
+_INLINE_BACKENDS = ("sync", "thread", "asyncio")
+
+# The row count is kept by triggers so appends need not COUNT(*) the table.
+_SCHEMA = """
+BEGIN IMMEDIATE;
+CREATE TABLE IF NOT EXISTS spooled_message (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind TEXT NOT NULL,
+    phone TEXT NOT NULL,
+    message TEXT NOT NULL,
+    message_type TEXT NOT NULL,
+    campaign TEXT,
+    reason TEXT NOT NULL,
+    spooled_at REAL NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    claimed_until REAL NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS spool_counter (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    size INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO spool_counter (id, size) SELECT 1, COUNT(*) FROM spooled_message;
+CREATE TRIGGER IF NOT EXISTS spooled_message_inserted AFTER INSERT ON spooled_message
+BEGIN UPDATE spool_counter SET size = size + 1; END;
+CREATE TRIGGER IF NOT EXISTS spooled_message_deleted AFTER DELETE ON spooled_message
+BEGIN UPDATE spool_counter SET size = size - 1; END;
+COMMIT;
+"""
+
+_local = threading.local()
+
+
+def is_enabled() -> bool:
+    return bool(settings.SOLAPI_SPOOL_PATH)
+
+
+def _connection() -> sqlite3.Connection:
+    """Per-thread connection to the spool file (sqlite3 connections are not shareable)."""
+    path = str(settings.SOLAPI_SPOOL_PATH)
+    connection: sqlite3.Connection | None = getattr(_local, "connection", None)
+    if connection is None or getattr(_local, "path", None) != path:
+        if connection is not None:
+            connection.close()
+        connection = sqlite3.connect(path, timeout=30, isolation_level=None)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(f"PRAGMA synchronous={_synchronous()}")
+        connection.executescript(_SCHEMA)
+        _add_campaign_column(connection)
+        _local.connection, _local.path = connection, path
+    return connection
+
+
+def _add_campaign_column(connection: sqlite3.Connection) -> None:
+    """Add the campaign column to a spool file created before it existed."""
+    connection.execute("BEGIN IMMEDIATE")
+    try:
+        columns = {row[1] for row in connection.execute("PRAGMA table_info(spooled_message)")}
+        if "campaign" not in columns:
+            connection.execute("ALTER TABLE spooled_message ADD COLUMN campaign TEXT")
+        connection.execute("COMMIT")
+    except BaseException:
+        connection.execute("ROLLBACK")
+        raise
+
+
+def _synchronous() -> str:
+    value = str(settings.SOLAPI_SPOOL_SYNCHRONOUS).upper()
+    if value not in ("OFF", "NORMAL", "FULL", "EXTRA"):
+        from ..exceptions import SolapiSMSConfigError
+
+        raise SolapiSMSConfigError(f"알 수 없는 SOLAPI_SPOOL_SYNCHRONOUS: {value}")
+    return value
+
+
+def close() -> None:
+    """Close this thread's spool connection."""
+    connection = getattr(_local, "connection", None)
+    if connection is not None:
+        connection.close()
+        _local.connection = _local.path = None
+
+
+def spool(
+    phone: str,
+    message: str = "",
+    message_type: str = "GENERIC",
+    *,
+    kind: str = SMS,
+    reason: str = "",
+    campaign: str | None = None,
+) -> bool:
+    """
+    Append one send to the spool.
+
+    Args:
+        phone: Recipient phone number
+        message: Message content (empty for ``kind=VERIFICATION``, whose code
+            is generated on replay)
+        message_type: Message type
+        kind: SMS or VERIFICATION
+        reason: Why the send was spooled, for logs
+        campaign: Campaign id the message was tagged with (see solapi_sms.campaigns)
+
+    Returns:
+        False when the spool is disabled or holds SOLAPI_SPOOL_MAX_MESSAGES
+    """
+    if not is_enabled():
+        return False
+    connection = _connection()
+    connection.execute("BEGIN IMMEDIATE")
+    try:
+        (size,) = connection.execute("SELECT size FROM spool_counter").fetchone()
+        if settings.SOLAPI_SPOOL_MAX_MESSAGES and size >= settings.SOLAPI_SPOOL_MAX_MESSAGES:
+            connection.execute("ROLLBACK")
+            logger.error("SMS spool is full (%d messages); dropping send to %s", size, phone)
+            return False
+        connection.execute(
+            "INSERT INTO spooled_message"
+            " (kind, phone, message, message_type, campaign, reason, spooled_at)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (kind, phone, message, message_type, campaign, reason, time.time()),
+        )
+        connection.execute("COMMIT")
+    except BaseException:
+        connection.execute("ROLLBACK")
+        raise
+    logger.warning("Spooled SMS to %s (%s)", phone, reason)
+    return True
+
+
+def spool_size() -> int:
+    """Messages currently spooled (0 when the spool is disabled)."""
+    if not is_enabled():
+        return 0
+    (size,) = _connection().execute("SELECT size FROM spool_counter").fetchone()
+    return int(size)
+
+
+def _claim(limit: int) -> list[dict[str, Any]]:
+    connection = _connection()
+    now = time.time()
+    connection.execute("BEGIN IMMEDIATE")
+    try:
+        cursor = connection.execute(
+            "SELECT id, kind, phone, message, message_type, campaign, spooled_at, attempts"
+            " FROM spooled_message"
+            " WHERE claimed_until < ? ORDER BY id LIMIT ?",
+            (now, limit),
+        )
+        columns = [column[0] for column in cursor.description]
+        rows = [dict(zip(columns, values, strict=True)) for values in cursor.fetchall()]
+        connection.executemany(
+            "UPDATE spooled_message SET claimed_until = ?, attempts = attempts + 1 WHERE id = ?",
+            [(now + _CLAIM_SECONDS, row["id"]) for row in rows],
+        )
+        connection.execute("COMMIT")
+    except BaseException:
+        connection.execute("ROLLBACK")
+        raise
+    return rows
+
+
+def _finish(rows: list[dict[str, Any]], handled: list[dict[str, Any]]) -> None:
+    """Delete the handled rows and release the rest of the claim."""
+    handled_ids = {row["id"] for row in handled}
+    connection = _connection()
+    connection.execute("BEGIN IMMEDIATE")
+    try:
+        connection.executemany(
+            "DELETE FROM spooled_message WHERE id = ?", [(row_id,) for row_id in handled_ids]
+        )
+        connection.executemany(
+            "UPDATE spooled_message SET claimed_until = 0 WHERE id = ?",
+            [(row["id"],) for row in rows if row["id"] not in handled_ids],
+        )
+        connection.execute("COMMIT")
+    except BaseException:
+        connection.execute("ROLLBACK")
+        raise
+
+
+def _drop_stale(row: dict[str, Any]) -> bool:
+    from ..services import SMSService
+    from .backpressure import is_stale
+
+    message_type = "VERIFICATION" if row["kind"] == VERIFICATION else row["message_type"]
+    if not is_stale(message_type, row["spooled_at"]):
+        return False
+    if row["kind"] == SMS:
+        # Counted as skipped in its campaign, if any.
+        SMSService()._log_skipped_bulk([_message(row)], {"skipped_reason": "stale"})
+    return True
+
+
+def _gave_up(row: dict[str, Any]) -> bool:
+    """True when a row that failed before sending has used up its claims."""
+    # ``attempts`` was read before the claim that is running now.
+    if row["attempts"] + 1 < settings.SOLAPI_SPOOL_MAX_ATTEMPTS:
+        return False
+    logger.error("Dropping spooled SMS to %s after %d attempts", row["phone"], row["attempts"] + 1)
+    return True
+
+
+def _message(row: dict[str, Any]) -> dict[str, str]:
+    """The batch task message of a spooled SMS row, tagged with its campaign."""
+    from ..campaigns import CAMPAIGN_KEY
+
+    item = {"phone": row["phone"], "message": row["message"], "message_type": row["message_type"]}
+    if row["campaign"]:
+        item[CAMPAIGN_KEY] = row["campaign"]
+    return item
+
+
+def _send_inline(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Send rows in this process; return those handled before SOLAPI was unreachable."""
+    from ..exceptions import SolapiSMSSendError
+    from ..services import SMSService, is_unavailable
+    from .base import send_sms_batch_func
+
+    service = SMSService()
+    handled: list[dict[str, Any]] = []
+    # Campaign messages go through the bulk path, so they are counted and can be paused.
+    campaign_rows: list[dict[str, Any]] = []
+    for row in rows:
+        try:
+            if _drop_stale(row):
+                handled.append(row)
+                continue
+            if row["kind"] == SMS and row["campaign"]:
+                campaign_rows.append(row)
+                continue
+            verification = (
+                service.create_verification(row["phone"]) if row["kind"] == VERIFICATION else None
+            )
+        except Exception:
+            # Nothing was sent: the row is released for the next drain.
+            logger.exception("Could not replay spooled SMS to %s", row["phone"])
+            if _gave_up(row):
+                handled.append(row)
+            continue
+        try:
+            if verification is not None:
+                service.send_verification_code(
+                    row["phone"],
+                    verification.code,  # type: ignore[attr-defined]
+                    raise_on_error=True,
+                )
+            else:
+                service.send_sms(
+                    row["phone"],
+                    row["message"],
+                    message_type=row["message_type"],
+                    raise_on_error=True,
+                )
+        except SolapiSMSSendError as exc:
+            if exc.__cause__ is not None and is_unavailable(exc.__cause__):
+                return handled
+            # Rejected for another reason: already logged as FAILED, not an outage.
+        except Exception:
+            # SOLAPI may have accepted the message before this failed: never replay it.
+            logger.exception("Replaying spooled SMS to %s failed; not retrying it", row["phone"])
+        handled.append(row)
+    if campaign_rows:
+        try:
+            send_sms_batch_func([_message(row) for row in campaign_rows])
+        except Exception:
+            # Failed sends are logged and counted by the bulk path; this is past SOLAPI.
+            logger.exception("Replaying %d spooled campaign SMS failed", len(campaign_rows))
+        handled.extend(campaign_rows)
+    return handled
+
+
+def _publish(backend: ModuleType, rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Publish rows to the broker; return those handed off before it failed."""
+    from .lanes import _batch_lane_for
+
+    handled: list[dict[str, Any]] = []
+    live: list[dict[str, Any]] = []
+    for row in rows:
+        (handled if _drop_stale(row) else live).append(row)
+    lanes: dict[str, list[dict[str, Any]]] = {}
+    for row in live:
+        if row["kind"] == SMS:
+            lanes.setdefault(_batch_lane_for(row["message_type"] or "GENERIC"), []).append(row)
+    try:
+        for group in lanes.values():
+            backend.enqueue_sms_batch([_message(row) for row in group])
+            handled.extend(group)
+        for row in live:
+            if row["kind"] == VERIFICATION:
+                backend.enqueue_verification_code(row["phone"])
+                handled.append(row)
+    except Exception as exc:
+        # Only what was not handed off stays spooled, so nothing is published twice.
+        logger.warning("SMS spool replay failed, broker still unavailable", exc_info=exc)
+    return handled
+
+
+def drain_spool(*, batch_size: int | None = None) -> int:
+    """
+    Replay spooled messages until the spool is empty or a batch fails.
+
+    Rows go through the configured backend: published as batch tasks for
+    celery/django6, sent in this process otherwise.
+
+    Args:
+        batch_size: Rows claimed per batch (default SOLAPI_SPOOL_DRAIN_BATCH_SIZE)
+
+    Returns:
+        Number of spooled messages handled (sent, published or dropped as stale)
+    """
+    if not is_enabled():
+        return 0
+    from . import _get_backend_module
+
+    backend = _get_backend_module()
+    inline = backend.__name__.rsplit(".", 1)[-1] in _INLINE_BACKENDS
+    limit = batch_size or settings.SOLAPI_SPOOL_DRAIN_BATCH_SIZE
+    total = 0
+    while rows := _claim(limit):
+        handled: list[dict[str, Any]] = []
+        try:
+            handled = _send_inline(rows) if inline else _publish(backend, rows)
+        finally:
+            _finish(rows, handled)
+        total += len(handled)
+        if len(handled) < len(rows) or len(rows) < limit:
+            break
+    if total:
+        logger.info("Replayed %d spooled SMS", total)
+    return total
+
+
+def run_drainer(
+    *,
+    batch_size: int | None = None,
+    interval_seconds: float | None = None,
+    once: bool = False,
+) -> int:
+    """
+    Drain the spool every ``interval_seconds`` until interrupted.
+
+    Returns:
+        Total number of spooled messages handled
+    """
+    interval = (
+        interval_seconds
+        if interval_seconds is not None
+        else settings.SOLAPI_SPOOL_DRAIN_INTERVAL_SECONDS
+    )
+    total = 0
+    while True:
+        total += drain_spool(batch_size=batch_size)
+        if once:
+            return total
+        time.sleep(interval)
@@ -0,0 +1,313 @@
+"""
+Optional tracing spans along the send path.
+
+Configuration:
+    # settings.py
+    SOLAPI_TRACING = "memory"         # keep finished spans in process, see finished_spans()
+    SOLAPI_TRACING = "file"           # append finished spans as JSON Lines to SOLAPI_TRACING_FILE
+    SOLAPI_TRACING = "opentelemetry"  # hand spans to the app's OpenTelemetry tracer provider
+
+Spans:
+    solapi_sms.enqueue_sms / solapi_sms.enqueue_verification_code
+        admission and publishing in ``tasks.enqueue_*``
+    solapi_sms.task.*
+        the task functions in ``tasks.base`` (in the worker)
+    solapi_sms.solapi.send_message / send_messages
+        the SOLAPI HTTP call
+    solapi_sms.log_result / log_results_bulk
+        the SMSLog insert
+    solapi_sms.signal.<name>
+        signal receivers (only when the signal has any)
+
+The trace context travels with the task as a W3C ``traceparent``: in the
+Celery message headers, as a ``trace_context`` task argument with Django 6
+Tasks (which has no headers), and through ``contextvars`` with the thread
+and asyncio backends. The gap between the end of an enqueue span and the
+start of its ``solapi_sms.task.*`` child is broker wait plus worker pickup.
+
+Phone numbers and message text are never recorded as attributes.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+import inspect
+import json
+import secrets
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterator, Mapping
+from contextvars import ContextVar
+from typing import Any, ParamSpec, TypeVar, cast
+
+from . import settings
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+# Header keys carrying the trace context across a broker.
+HEADERS = ("traceparent", "tracestate")
+
+_NOOP: contextlib.nullcontext[None] = contextlib.nullcontext()
+
+
+class SpanContext:
+    """Identifies a span, local or received from another process."""
+
+    __slots__ = ("span_id", "trace_id")
+
+    def __init__(self, trace_id: str, span_id: str) -> None:
+        self.trace_id = trace_id
+        self.span_id = span_id
+
+    @property
+    def traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+
+class Span(SpanContext):
+    """A timed operation; exported when it ends."""
+
+    __slots__ = ("attributes", "end_ns", "error", "name", "parent_id", "start_ns", "status")
+
+    def __init__(
+        self, name: str, parent: SpanContext | None, attributes: Mapping[str, Any]
+    ) -> None:
+        super().__init__(parent.trace_id if parent else secrets.token_hex(16), secrets.token_hex(8))
+        self.name = name
+        self.parent_id = parent.span_id if parent else None
+        self.attributes = dict(attributes)
+        self.start_ns = time.time_ns()
+        self.end_ns: int | None = None
+        self.status = "OK"
+        self.error = ""
+
+    @property
+    def duration_ms(self) -> float | None:
+        if self.end_ns is None:
+            return None
+        return (self.end_ns - self.start_ns) / 1e6
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_ns": self.start_ns,
+            "end_ns": self.end_ns,
+            "duration_ms": self.duration_ms,
+            "status": self.status,
+            "error": self.error,
+            "attributes": self.attributes,
+        }
+
+
+class MemoryExporter:
+    """Keeps the last ``max_spans`` finished spans."""
+
+    def __init__(self, max_spans: int) -> None:
+        self.spans: deque[Span] = deque(maxlen=max_spans)
+
+    def export(self, span: Span) -> None:
+        self.spans.append(span)
+
+
+class FileExporter:
+    """Appends finished spans to ``path``, one JSON object per line."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        line = json.dumps(span.to_dict(), ensure_ascii=False, default=str) + "\n"
+        with self.lock, open(self.path, "a", encoding="utf-8") as file:
+            file.write(line)
+
+
+_current: ContextVar[SpanContext | None] = ContextVar("solapi_sms_span", default=None)
+_exporter: MemoryExporter | FileExporter | None = None
+_exporter_key: tuple[str, str] | None = None
+_exporter_lock = threading.Lock()
+
+
+def is_enabled() -> bool:
+    return bool(settings.SOLAPI_TRACING)
+
+
+def _uses_opentelemetry() -> bool:
+    return settings.SOLAPI_TRACING == "opentelemetry"
+
+
+def get_exporter() -> MemoryExporter | FileExporter:
+    """Exporter for SOLAPI_TRACING ("memory" or "file"), created on first use."""
+    global _exporter, _exporter_key
+    mode = str(settings.SOLAPI_TRACING)
+    key = (mode, str(settings.SOLAPI_TRACING_FILE or ""))
+    with _exporter_lock:
+        if _exporter is None or _exporter_key != key:
+            if mode == "memory":
+                _exporter = MemoryExporter(settings.SOLAPI_TRACING_MAX_SPANS)
+            elif mode == "file" and settings.SOLAPI_TRACING_FILE:
+                _exporter = FileExporter(key[1])
+            else:
+                from .exceptions import SolapiSMSConfigError
+
+                raise SolapiSMSConfigError(
+                    f"SOLAPI_TRACING={mode!r}: 'memory', 'file'(SOLAPI_TRACING_FILE 필요), "
+                    "'opentelemetry' 중 하나여야 합니다."
+                )
+            _exporter_key = key
+        return _exporter
+
+
+def finished_spans() -> list[Span]:
+    """Spans kept by the memory exporter, oldest first."""
+    exporter = get_exporter()
+    return list(exporter.spans) if isinstance(exporter, MemoryExporter) else []
+
+
+def clear() -> None:
+    """Forget the spans kept by the memory exporter."""
+    exporter = get_exporter()
+    if isinstance(exporter, MemoryExporter):
+        exporter.spans.clear()
+
+
+def _otel_tracer() -> Any:
+    try:
+        from opentelemetry import trace
+    except ImportError as exc:
+        from .exceptions import SolapiSMSConfigError
+
+        raise SolapiSMSConfigError(
+            "SOLAPI_TRACING='opentelemetry'에는 opentelemetry-api 패키지가 필요합니다."
+        ) from exc
+    return trace.get_tracer("solapi_sms")
+
+
+@contextlib.contextmanager
+def _span(name: str, attributes: Mapping[str, Any]) -> Iterator[Span]:
+    span_ = Span(name, _current.get(), attributes)
+    token = _current.set(span_)
+    try:
+        yield span_
+    except BaseException as exc:
+        span_.status = "ERROR"
+        span_.error = repr(exc)
+        raise
+    finally:
+        span_.end_ns = time.time_ns()
+        _current.reset(token)
+        get_exporter().export(span_)
+
+
+def span(name: str, **attributes: Any) -> contextlib.AbstractContextManager[Any]:
+    """
+    Context manager timing the block as a child of the current span.
+
+    Returns a shared no-op context manager when tracing is off.
+    """
+    if not settings.SOLAPI_TRACING:
+        return _NOOP
+    if _uses_opentelemetry():
+        return cast(
+            "contextlib.AbstractContextManager[Any]",
+            _otel_tracer().start_as_current_span(name, attributes=attributes),
+        )
+    return _span(name, attributes)
+
+
+def set_attributes(**attributes: Any) -> None:
+    """Add attributes to the current span (no-op when tracing is off or no span is open)."""
+    if not settings.SOLAPI_TRACING:
+        return
+    if _uses_opentelemetry():
+        from opentelemetry import trace
+
+        trace.get_current_span().set_attributes(attributes)
+        return
+    current = _current.get()
+    if isinstance(current, Span):
+        current.attributes.update(attributes)
+
+
+def traced(name: str) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Decorator running a function (sync or async) inside ``span(name)``."""
+
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> Any:
+                if not settings.SOLAPI_TRACING:
+                    return await func(*args, **kwargs)
+                with span(name):
+                    return await func(*args, **kwargs)
+
+            return cast("Callable[P, R]", async_wrapper)
+
+        @functools.wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            if not settings.SOLAPI_TRACING:
+                return func(*args, **kwargs)
+            with span(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def inject() -> dict[str, str]:
+    """Headers carrying the current trace context ({} when tracing is off or no span is open)."""
+    if not settings.SOLAPI_TRACING:
+        return {}
+    if _uses_opentelemetry():
+        from opentelemetry import propagate
+
+        carrier: dict[str, str] = {}
+        propagate.inject(carrier)
+        return carrier
+    current = _current.get()
+    return {"traceparent": current.traceparent} if current is not None else {}
+
+
+def _parse_traceparent(value: str) -> SpanContext | None:
+    parts = value.split("-")
+    if len(parts) != 4 or len(parts[1]) != 32 or len(parts[2]) != 16:
+        return None
+    return SpanContext(parts[1], parts[2])
+
+
+@contextlib.contextmanager
+def _use(parent: SpanContext) -> Iterator[None]:
+    token = _current.set(parent)
+    try:
+        yield
+    finally:
+        _current.reset(token)
+
+
+@contextlib.contextmanager
+def _otel_use(headers: Mapping[str, str]) -> Iterator[None]:
+    from opentelemetry import context, propagate
+
+    token = context.attach(propagate.extract(dict(headers)))
+    try:
+        yield
+    finally:
+        context.detach(token)
+
+
+def attach(headers: Mapping[str, str] | None) -> contextlib.AbstractContextManager[Any]:
+    """Continue the trace described by ``headers`` (from ``inject``) inside the block."""
+    if not headers or not settings.SOLAPI_TRACING:
+        return _NOOP
+    if _uses_opentelemetry():
+        return _otel_use(headers)
+    parent = _parse_traceparent(headers.get("traceparent", ""))
+    return _use(parent) if parent is not None else _NOOP
@@ -0,0 +1,10 @@
+from django.urls import path
+
+from . import views
+
+app_name = "solapi_sms"
+
+urlpatterns = [
+    path("webhooks/delivery/", views.delivery_report_webhook, name="delivery_report_webhook"),
+    path("profiles/", views.profile_report, name="profile_report"),
+]
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import hmac
+import json
+import logging
+
+from django.contrib.admin.views.decorators import staff_member_required
+from django.http import HttpRequest, HttpResponse, HttpResponseForbidden, JsonResponse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_POST
+
+from . import profiling, settings
+from .delivery import parse_delivery_reports
+
+logger = logging.getLogger(__name__)
+
+
+@csrf_exempt
+@require_POST
+def delivery_report_webhook(request: HttpRequest) -> HttpResponse:
+    """
+    Receive SOLAPI delivery reports.
+
+    The payload is only parsed here; status updates run on the configured
+    task backend so bursts of reports do not hold web workers. Requests are
+    refused while SOLAPI_WEBHOOK_SECRET is unset, unless
+    SOLAPI_WEBHOOK_ALLOW_UNAUTHENTICATED is True.
+    """
+    secret = settings.SOLAPI_WEBHOOK_SECRET
+    if secret:
+        if not hmac.compare_digest(request.GET.get("token", ""), secret):
+            return JsonResponse({"error": "forbidden"}, status=403)
+    elif not settings.SOLAPI_WEBHOOK_ALLOW_UNAUTHENTICATED:
+        logger.warning("Delivery report refused: SOLAPI_WEBHOOK_SECRET is not set")
+        return JsonResponse({"error": "forbidden"}, status=403)
+
+    try:
+        payload = json.loads(request.body)
+    except ValueError:
+        return JsonResponse({"error": "invalid_json"}, status=400)
+
+    reports = parse_delivery_reports(payload)
+    if reports:
+        from .tasks import enqueue_delivery_reports
+
+        enqueue_delivery_reports(reports)
+    return JsonResponse({"received": len(reports)})
+
+
+@staff_member_required
+def profile_report(request: HttpRequest) -> HttpResponse:
+    """
+    Sampled send profiles of this process as text (superusers only).
+
+    ``?method=send_sms`` limits the report to one method, ``?sort=tottime``
+    changes the ordering (any ``pstats`` sort key).
+    """
+    if not request.user.is_superuser:
+        return HttpResponseForbidden()
+    if not profiling.is_enabled():
+        return HttpResponse("SOLAPI_PROFILE_SAMPLE_RATE is not set.\n", content_type="text/plain")
+    text = profiling.report(
+        request.GET.get("method") or None, sort=request.GET.get("sort", "cumulative")
+    )
+    return HttpResponse(text or "No samples yet.\n", content_type="text/plain; charset=utf-8")
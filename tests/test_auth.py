@@ -0,0 +1,103 @@
+import asyncio
+
+import pytest
+from django.core.cache import cache
+
+from solapi_sms.auth import (
+    RateLimitRule,
+    _increment,
+    asend_verification_code,
+    averify_code,
+    check_rate_limit,
+    check_rate_limits,
+    send_verification_code,
+)
+
+
+@pytest.fixture(autouse=True)
+def frozen_window(monkeypatch):
+    monkeypatch.setattr("solapi_sms.auth.time.time", lambda: 1_000_000.0)
+    cache.clear()
+
+
+def test_check_rate_limits_reports_tripped_rule():
+    rules = [
+        RateLimitRule("test_phone_01012345678", limit=5, window_seconds=60, name="phone"),
+        RateLimitRule("test_ip_127.0.0.1", limit=2, window_seconds=3600, name="ip"),
+    ]
+    assert check_rate_limits(rules)["allowed"] is True
+    assert check_rate_limits(rules)["allowed"] is True
+
+    result = check_rate_limits(rules)
+    assert result["allowed"] is False
+    assert result["rule"] == "ip"
+    assert result["attempts"] == 2
+    assert result["reset_in"] == 800
+    # Nothing is counted against the other rules when one trips.
+    assert result["rules"][0]["attempts"] == 2
+
+
+def test_phone_limit_is_shared_with_rate_limit_rules():
+    assert check_rate_limit("01012345678", limit=2, window_seconds=60)["attempts"] == 1
+    rules = [
+        RateLimitRule("solapi_sms_attempt_01012345678", limit=2, window_seconds=60, name="phone")
+    ]
+    assert check_rate_limits(rules)["attempts"] == 2
+
+    result = check_rate_limit("01012345678", limit=2, window_seconds=60)
+    assert (result["allowed"], result["attempts"]) == (False, 2)
+
+
+class CountingCache:
+    def __init__(self, cache):
+        self.cache = cache
+        self.calls = []
+
+    def __getattr__(self, name):
+        self.calls.append(name)
+        return getattr(self.cache, name)
+
+
+def test_check_rate_limits_reads_all_counters_at_once():
+    counting = CountingCache(cache)
+    rules = [("test_ip_127.0.0.1", 1, 60), ("test_global", 100, 60)]
+    assert check_rate_limits(rules, cache=counting)["allowed"] is True
+    assert counting.calls == ["get_many", "add", "add"]
+
+    counting.calls.clear()
+    assert check_rate_limits(rules, cache=counting)["allowed"] is False
+    assert counting.calls == ["get_many"]
+
+
+def test_increment_recreates_a_counter_that_expired_meanwhile():
+    assert _increment(cache, "test_expired", 60, exists=True) == 1
+    assert _increment(cache, "test_expired", 60, exists=True) == 2
+
+
+@pytest.mark.django_db
+def test_send_verification_code_accepts_rate_limit_rules(settings):
+    settings.DEBUG = True
+    rules = [("test_device_abc", 1, 60)]
+    assert send_verification_code("01012345678", rate_limit_rules=rules)["success"] is True
+
+    result = send_verification_code("01012345678", rate_limit_rules=rules)
+    assert result["error"] == "rate_limited"
+    assert result["rate_limit"]["rule"] == "test_device_abc"
+
+
+@pytest.mark.django_db(transaction=True)
+def test_async_verification_flow(settings):
+    settings.DEBUG = True
+
+    async def main():
+        sent = await asend_verification_code("01012345678", code="123456")
+        wrong = await averify_code("01012345678", "000000")
+        right = await averify_code("01012345678", "123456")
+        return sent, wrong, right
+
+    sent, wrong, right = asyncio.run(main())
+    assert sent["success"] is True
+    assert wrong["error"] == "invalid_code"
+    assert wrong["remaining_attempts"] == 4
+    assert right["success"] is True
+    assert right["verification"].verified_at is not None
@@ -0,0 +1,109 @@
+import types
+
+import pytest
+from django.core.cache import cache
+
+from solapi_sms import campaigns, tasks
+from solapi_sms.models import (
+    SMSCampaign,
+    SMSCampaignChunk,
+    SMSCampaignStatus,
+    SMSLog,
+    SMSLogStatus,
+)
+from solapi_sms.tasks import spool
+from solapi_sms.tasks.base import send_sms_batch_func
+
+
+@pytest.fixture
+def fake_send_many(monkeypatch):
+    sent = []
+    monkeypatch.setattr("solapi_sms.services.SOLAPI_API_KEY", "key")
+    monkeypatch.setattr("solapi_sms.services.SOLAPI_API_SECRET", "secret")
+    monkeypatch.setattr("solapi_sms.services.SOLAPI_SENDER_PHONE", "0212345678")
+
+    def fake_send_bulk_chunk(self, chunk):
+        sent.extend(phone for phone, _, _ in chunk)
+        return [(SMSLogStatus.SUCCESS, {}, "")] * len(chunk)
+
+    monkeypatch.setattr("solapi_sms.services.SMSService._send_bulk_chunk", fake_send_bulk_chunk)
+    cache.clear()
+    return sent
+
+
+def _messages(count):
+    return [{"phone": f"0101234000{i}", "message": "공지"} for i in range(count)]
+
+
+@pytest.mark.django_db
+def test_campaign_counts_outcomes_across_shards(fake_send_many, django_capture_on_commit_callbacks):
+    with django_capture_on_commit_callbacks(execute=True):
+        campaign = campaigns.start_campaign("공지", _messages(5), chunk_size=2)
+
+    campaign.refresh_from_db()
+    assert campaign.status == SMSCampaignStatus.COMPLETED
+    assert len(fake_send_many) == 5
+    stats = campaigns.progress(campaign)
+    assert (stats["sent"], stats["failed"], stats["skipped"]) == (5, 0, 0)
+    assert stats["percent"] == 100
+    assert SMSLog.objects.filter(campaign=campaign).count() == 5
+    assert campaign.counters.count() <= 3
+
+
+@pytest.mark.django_db
+def test_paused_campaign_holds_chunks_until_resumed(fake_send_many):
+    campaign = SMSCampaign.objects.create(name="공지", total=4)
+    tagged = [{**item, "campaign": str(campaign.pk)} for item in _messages(4)]
+    assert campaigns.pause(campaign)
+
+    send_sms_batch_func(tagged[:2])
+    assert fake_send_many == []
+    assert SMSCampaignChunk.objects.filter(campaign=campaign).count() == 1
+
+    assert campaigns.resume(campaign)
+    assert len(fake_send_many) == 2
+    assert not SMSCampaignChunk.objects.exists()
+
+    assert campaigns.cancel(campaign)
+    send_sms_batch_func(tagged[2:])
+    assert len(fake_send_many) == 2
+    skipped = SMSLog.objects.filter(campaign=campaign, status=SMSLogStatus.SKIPPED)
+    assert [log.response_data for log in skipped] == [{"skipped_reason": "canceled"}] * 2
+    stats = campaigns.progress(campaign)
+    assert (stats["status"], stats["sent"], stats["skipped"]) == ("CANCELED", 2, 2)
+
+
+@pytest.mark.django_db
+def test_campaign_publishes_after_commit(fake_send_many, django_capture_on_commit_callbacks):
+    with django_capture_on_commit_callbacks(execute=True):
+        campaign = campaigns.start_campaign("공지", _messages(2))
+        assert campaign.status == SMSCampaignStatus.RUNNING
+        assert fake_send_many == []
+
+    assert len(fake_send_many) == 2
+    campaign.refresh_from_db()
+    assert campaign.status == SMSCampaignStatus.COMPLETED
+    assert SMSLog.objects.filter(campaign=campaign).count() == 2
+
+
+@pytest.mark.django_db
+def test_empty_campaign_is_completed():
+    assert campaigns.start_campaign("공지", []).status == SMSCampaignStatus.COMPLETED
+
+
+@pytest.mark.django_db
+def test_spooled_campaign_messages_complete_the_campaign(fake_send_many, tmp_path, monkeypatch):
+    monkeypatch.setattr("solapi_sms.settings.SOLAPI_SPOOL_PATH", tmp_path / "spool.sqlite3")
+    campaign = SMSCampaign.objects.create(name="공지", total=3, status=SMSCampaignStatus.RUNNING)
+    tagged = [{**item, "campaign": str(campaign.pk)} for item in _messages(3)]
+    broker = types.ModuleType("solapi_sms.tasks.backends.celery")
+    assert tasks._spool_publish_failure(broker, ConnectionError("broker down"), tagged)
+
+    # Replayed in this process (sync backend) through the bulk path.
+    assert spool.drain_spool() == 3
+    spool.close()
+
+    assert len(fake_send_many) == 3
+    campaign.refresh_from_db()
+    assert campaign.status == SMSCampaignStatus.COMPLETED
+    assert SMSLog.objects.filter(campaign=campaign, status=SMSLogStatus.SUCCESS).count() == 3
@@ -0,0 +1,92 @@
+from collections import Counter
+
+import pytest
+
+from solapi_sms import credentials
+from solapi_sms.credentials import build_credential_pool
+from solapi_sms.exceptions import SolapiSMSAPIError
+from solapi_sms.models import SMSLog, SMSLogStatus
+from solapi_sms.services import SMSService
+
+ENTRIES = [
+    ("key-a", "secret-a", "0211111111"),
+    {"api_key": "key-b", "api_secret": "secret-b", "sender": "0222222222", "weight": 3},
+]
+
+
+def test_weighted_round_robin_follows_weights():
+    pool = build_credential_pool(ENTRIES)
+    picks = Counter(pool.candidates()[0].sender for _ in range(8))
+    assert picks == {"0211111111": 2, "0222222222": 6}
+
+
+def test_hash_strategy_is_stable_per_phone():
+    pool = build_credential_pool(ENTRIES, strategy="hash")
+    first = pool.candidates("01012345678")[0]
+    assert all(pool.candidates("01012345678")[0] is first for _ in range(5))
+    assert len(pool.candidates("01012345678")) == 2
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    pool = build_credential_pool(ENTRIES, strategy="hash")
+    monkeypatch.setattr(credentials, "get_credential_pool", lambda: pool)
+    monkeypatch.setattr("solapi_sms.services.get_credential_pool", lambda: pool)
+    monkeypatch.setattr("solapi_sms.settings.SOLAPI_CREDENTIAL_FAILURE_THRESHOLD", 1)
+    return pool
+
+
+@pytest.mark.django_db
+def test_send_sms_fails_over_to_next_credential(pool, monkeypatch):
+    used = []
+
+    def fake_send_message(self, to, text, sender=None, timeout=None):
+        used.append(sender)
+        if len(used) == 1:
+            raise ConnectionError("boom")
+        return {"message_list": [{"message_id": "M1"}]}
+
+    monkeypatch.setattr("solapi_sms.client.SolapiClient.send_message", fake_send_message)
+    assert SMSService().send_sms("01012345678", "메시지") is True
+
+    assert len(set(used)) == 2
+    assert not next(c for c in pool.credentials if c.sender == used[0]).is_healthy()
+    log = SMSLog.objects.get()
+    assert log.status == SMSLogStatus.SUCCESS
+    assert log.message_id == "M1"
+
+
+@pytest.mark.django_db
+def test_send_sms_fails_over_on_account_errors_only(pool, monkeypatch):
+    used = []
+    errors = [SolapiSMSAPIError("InvalidApiKey", "잘못된 API 키", 401)]
+
+    def fake_send_message(self, to, text, sender=None, timeout=None):
+        used.append(sender)
+        if errors:
+            raise errors.pop()
+        return {"message_list": [{"message_id": "M1"}]}
+
+    monkeypatch.setattr("solapi_sms.client.SolapiClient.send_message", fake_send_message)
+    assert SMSService().send_sms("01012345678", "메시지") is True
+    assert len(set(used)) == 2
+
+
+@pytest.mark.django_db
+def test_send_sms_does_not_fail_over_on_request_errors(pool, monkeypatch):
+    used = []
+
+    def fake_send_message(self, to, text, sender=None, timeout=None):
+        used.append(sender)
+        raise SolapiSMSAPIError("ValidationError", "잘못된 수신번호", 400)
+
+    monkeypatch.setattr("solapi_sms.client.SolapiClient.send_message", fake_send_message)
+    for _ in range(3):
+        assert SMSService().send_sms("01012345678", "메시지") is False
+
+    # One attempt per send, and the credentials stay healthy.
+    assert len(used) == 3
+    assert all(credential.is_healthy() for credential in pool.credentials)
+    log = SMSLog.objects.first()
+    assert log.status == SMSLogStatus.FAILED
+    assert log.response_data["error_code"] == "ValidationError"
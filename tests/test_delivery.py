@@ -0,0 +1,107 @@
+import json
+import logging
+from datetime import timedelta
+
+import pytest
+from django.test import RequestFactory
+from django.utils import timezone
+
+from solapi_sms.delivery import apply_delivery_reports
+from solapi_sms.models import SMSDeliveryStatus, SMSLog, SMSLogStatus
+from solapi_sms.signals import sms_delivery_reported
+from solapi_sms.views import delivery_report_webhook
+
+
+def _log(message_id: str) -> SMSLog:
+    return SMSLog.objects.create(
+        phone="01012345678",
+        message="메시지",
+        status=SMSLogStatus.SUCCESS,
+        message_id=message_id,
+    )
+
+
+@pytest.mark.django_db
+def test_webhook_applies_reports_in_bulk(django_assert_max_num_queries, monkeypatch):
+    monkeypatch.setattr("solapi_sms.settings.SOLAPI_WEBHOOK_SECRET", "s3cret")
+    delivered = _log("M1")
+    failed = _log("M2")
+    pending = _log("M3")
+    received = []
+
+    def receiver(**kwargs):
+        received.extend(kwargs["reports"])
+
+    sms_delivery_reported.connect(receiver)
+
+    payload = [
+        {"messageId": "M1", "statusCode": "4000", "dateReceived": "2026-10-19T10:00:00Z"},
+        {"messageId": "M2", "statusCode": "3059", "statusMessage": "변작된 발신번호"},
+        {"messageId": "M3", "statusCode": "3000"},
+        {"statusCode": "4000"},
+    ]
+    request = RequestFactory().post(
+        "/webhooks/delivery/?token=s3cret",
+        data=json.dumps(payload),
+        content_type="application/json",
+    )
+    with django_assert_max_num_queries(2):
+        response = delivery_report_webhook(request)
+    sms_delivery_reported.disconnect(receiver)
+
+    assert response.status_code == 200
+    assert json.loads(response.content) == {"received": 3}
+    delivered.refresh_from_db()
+    failed.refresh_from_db()
+    pending.refresh_from_db()
+    assert delivered.delivery_status == SMSDeliveryStatus.DELIVERED
+    assert delivered.delivered_at.isoformat() == "2026-10-19T10:00:00+00:00"
+    assert failed.delivery_status == SMSDeliveryStatus.UNDELIVERED
+    assert failed.delivery_status_code == "3059"
+    assert pending.delivery_status == ""
+    assert {report["message_id"] for report in received} == {"M1", "M2"}
+
+
+@pytest.mark.django_db
+def test_webhook_rejects_wrong_token(monkeypatch):
+    monkeypatch.setattr("solapi_sms.settings.SOLAPI_WEBHOOK_SECRET", "s3cret")
+    request = RequestFactory().post(
+        "/webhooks/delivery/?token=wrong", data="[]", content_type="application/json"
+    )
+    assert delivery_report_webhook(request).status_code == 403
+
+
+@pytest.mark.django_db
+def test_webhook_requires_a_secret_by_default(monkeypatch):
+    _log("M1")
+    request = RequestFactory().post(
+        "/webhooks/delivery/",
+        data=json.dumps([{"messageId": "M1", "statusCode": "4000"}]),
+        content_type="application/json",
+    )
+    assert delivery_report_webhook(request).status_code == 403
+    assert SMSLog.objects.get(message_id="M1").delivery_status == ""
+
+    monkeypatch.setattr("solapi_sms.settings.SOLAPI_WEBHOOK_ALLOW_UNAUTHENTICATED", True)
+    assert delivery_report_webhook(request).status_code == 200
+
+
+@pytest.mark.django_db
+def test_reports_older_than_max_age_are_counted(monkeypatch, caplog):
+    monkeypatch.setattr("solapi_sms.settings.SOLAPI_DELIVERY_REPORT_MAX_AGE_DAYS", 7)
+    recent = _log("M1")
+    old = _log("M2")
+    SMSLog.objects.filter(pk=old.pk).update(created_at=timezone.now() - timedelta(days=30))
+    reports = [
+        {"message_id": message_id, "status_code": "4000", "date_received": ""}
+        for message_id in ("M1", "M2", "M9")
+    ]
+
+    with caplog.at_level(logging.WARNING, logger="solapi_sms.delivery"):
+        assert apply_delivery_reports(reports) == 1
+
+    recent.refresh_from_db()
+    old.refresh_from_db()
+    assert recent.delivery_status == SMSDeliveryStatus.DELIVERED
+    assert old.delivery_status == ""
+    assert "2 of 3 delivery reports matched no log row" in caplog.text
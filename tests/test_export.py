@@ -0,0 +1,44 @@
+import csv
+import gzip
+import io
+import json
+
+import pytest
+
+from solapi_sms.export import export_logs
+from solapi_sms.models import SMSLog, SMSLogStatus
+
+
+@pytest.fixture
+def logs():
+    return [
+        SMSLog.objects.create(
+            phone=f"0101234{index:04d}",
+            message=f"메시지 {index}",
+            status=SMSLogStatus.SUCCESS,
+            response_data={"index": index},
+        )
+        for index in range(5)
+    ]
+
+
+@pytest.mark.django_db
+def test_export_csv_pages_through_all_rows(logs):
+    # Equal created_at values across page boundaries must not skip or repeat rows.
+    SMSLog.objects.update(created_at=logs[0].created_at)
+
+    body = b"".join(export_logs("csv", mask=True, batch_size=2)).decode()
+    rows = list(csv.DictReader(io.StringIO(body)))
+
+    assert [int(row["id"]) for row in rows] == [log.id for log in logs]
+    assert rows[0]["phone"] == "010****0000"
+    assert json.loads(rows[4]["response_data"]) == {"index": 4}
+
+
+@pytest.mark.django_db
+def test_export_jsonl_gzip(logs):
+    body = gzip.decompress(b"".join(export_logs("jsonl", compress=True, batch_size=3)))
+    rows = [json.loads(line) for line in body.decode().splitlines()]
+
+    assert [row["message"] for row in rows] == [f"메시지 {index}" for index in range(5)]
+    assert rows[0]["phone"] == "01012340000"
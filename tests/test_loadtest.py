@@ -0,0 +1,66 @@
+import json
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from solapi_sms.loadtest import parse_mix, run_loadtest
+from solapi_sms.models import SMSLog, SMSVerificationCode
+
+
+@pytest.fixture
+def configured(monkeypatch):
+    monkeypatch.setattr("solapi_sms.services.SOLAPI_API_KEY", "key")
+    monkeypatch.setattr("solapi_sms.services.SOLAPI_API_SECRET", "secret")
+    monkeypatch.setattr("solapi_sms.services.SOLAPI_SENDER_PHONE", "0212345678")
+
+
+def test_parse_mix_normalizes_weights():
+    assert parse_mix("otp:3,generic:1") == {"otp": 0.75, "generic": 0.25}
+    with pytest.raises(ValueError):
+        parse_mix("otp:1,unknown:1")
+
+
+@pytest.mark.django_db
+def test_loadtest_drives_real_paths_against_fake_transport(configured):
+    report = run_loadtest(
+        rate=200,
+        duration=0.1,
+        mix=parse_mix("otp:0.5,generic:0.5"),
+        concurrency=1,
+        latency_ms=0,
+        seed=1,
+    )
+
+    operations = report["operations"]
+    assert set(operations) == {"generic", "otp.send", "otp.verify"}
+    assert operations["otp.send"]["count"] == operations["otp.verify"]["count"]
+    assert sum(operations[name]["count"] for name in ("generic", "otp.send")) == 20
+    for stats in operations.values():
+        assert stats["error_rate"] == 0
+        assert stats["failure_rate"] == 0
+        assert stats["queries_per_op"] > 0
+        assert 0 <= stats["p50_ms"] <= stats["p95_ms"] <= stats["p99_ms"]
+    # Rows written by the run are removed afterwards.
+    assert not SMSLog.objects.exists()
+    assert not SMSVerificationCode.objects.exists()
+
+
+@pytest.mark.django_db
+def test_loadtest_command_reports_injected_errors(configured):
+    out = StringIO()
+    call_command(
+        "solapi_loadtest",
+        "--rate=100",
+        "--duration=0.1",
+        "--mix=generic:1",
+        "--concurrency=1",
+        "--fake-latency-ms=0",
+        "--fake-error-rate=1",
+        "--json=-",
+        stdout=out,
+    )
+    text = out.getvalue()
+    assert text.splitlines()[0].startswith("operation")
+    report = json.loads(text[text.index("{") :])
+    assert report["operations"]["generic"]["failure_rate"] == 1
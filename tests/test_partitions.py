@@ -0,0 +1,72 @@
+from datetime import UTC, datetime
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from solapi_sms import partitions
+from solapi_sms.models import SMSLog, SMSLogStatus
+
+NOW = datetime(2026, 10, 19, 12, 0, tzinfo=UTC)
+
+
+def test_partition_months_and_expiry():
+    table = "solapi_sms_smslog"
+    cutoff = partitions.retention_cutoff(12, NOW)
+    assert cutoff == datetime(2025, 10, 1, tzinfo=UTC)
+    assert partitions.add_months(datetime(2026, 11, 1, tzinfo=UTC), 3) == datetime(
+        2027, 2, 1, tzinfo=UTC
+    )
+    names = [f"{table}_p202508", f"{table}_p202509", f"{table}_p202510", "other_p202001"]
+    assert partitions.expired_partitions(table, names, cutoff) == [
+        f"{table}_p202508",
+        f"{table}_p202509",
+    ]
+
+    statements = partitions.create_statements(SMSLog, 1, NOW)
+    assert statements[-1] == (
+        f'CREATE TABLE IF NOT EXISTS "{table}_p202611" PARTITION OF "{table}" '
+        "FOR VALUES FROM ('2026-11-01T00:00:00+00:00') TO ('2026-12-01T00:00:00+00:00')"
+    )
+    assert partitions.expire_statements(SMSLog, [f"{table}_p202509"], "detach") == [
+        f'ALTER TABLE "{table}" DETACH PARTITION "{table}_p202509"'
+    ]
+
+
+@pytest.mark.django_db
+def test_retention_deletes_rows_without_partitioning(monkeypatch):
+    monkeypatch.setattr("solapi_sms.settings.SOLAPI_LOG_RETENTION_DELETE_BATCH_SIZE", 2)
+    for _ in range(3):
+        SMSLog.objects.create(phone="01012345678", message="오래됨", status=SMSLogStatus.SUCCESS)
+    SMSLog.objects.update(created_at=datetime(2025, 9, 30, tzinfo=UTC))
+    kept = SMSLog.objects.create(phone="01012345678", message="유지", status=SMSLogStatus.SUCCESS)
+
+    result = partitions.manage_partitions(retention_months=12, now=NOW)
+
+    assert result == {"partitioned": False, "statements": [], "expired": [], "deleted": 3}
+    assert list(SMSLog.objects.all()) == [kept]
+
+
+@pytest.mark.django_db
+def test_convert_requires_postgresql():
+    with pytest.raises(CommandError):
+        call_command("solapi_log_partitions", "--convert", stdout=StringIO())
+
+
+@pytest.mark.django_db(transaction=True)
+def test_convert_statements_keep_history_in_current_month():
+    table = "solapi_sms_smslog"
+    statements = partitions.convert_statements(SMSLog, NOW)
+
+    assert f'ALTER TABLE "{table}" RENAME TO "{table}_p202610"' in statements
+    assert any(
+        statement.startswith(f'CREATE TABLE "{table}" (LIKE "{table}_p202610"')
+        and statement.endswith('PARTITION BY RANGE ("created_at")')
+        for statement in statements
+    )
+    assert f'ALTER TABLE "{table}" ADD PRIMARY KEY ("id", "created_at")' in statements
+    # The legacy table holds all history before next month.
+    assert statements[-1] == (
+        f'ALTER TABLE "{table}" ATTACH PARTITION "{table}_p202610" '
+        "FOR VALUES FROM (MINVALUE) TO ('2026-11-01T00:00:00+00:00')"
+    )
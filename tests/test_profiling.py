@@ -0,0 +1,51 @@
+import json
+import types
+
+from django.test import RequestFactory
+
+from solapi_sms import profiling, views
+
+
+def _serialize(n):
+    return json.dumps(list(range(n)))
+
+
+def test_sampling_off_leaves_function_unwrapped(monkeypatch):
+    monkeypatch.setattr("solapi_sms.settings.SOLAPI_PROFILE_SAMPLE_RATE", 0)
+    assert profiling.sampled("noop")(_serialize) is _serialize
+
+
+def test_sampled_calls_are_merged_and_written(monkeypatch, tmp_path):
+    monkeypatch.setattr("solapi_sms.settings.SOLAPI_PROFILE_SAMPLE_RATE", 2)
+    monkeypatch.setattr("solapi_sms.settings.SOLAPI_PROFILE_TRACEMALLOC", True)
+    profiling.reset()
+    serialize = profiling.sampled("serialize")(_serialize)
+
+    for _ in range(6):
+        assert serialize(1000).startswith("[0, 1")
+
+    text = profiling.report("serialize")
+    assert "serialize: 3 samples" in text
+    assert "dumps" in text
+    assert "Allocations" in text
+    written = profiling.write_profiles(tmp_path)
+    assert sorted(path.suffix for path in written) == [".prof", ".txt"]
+    profiling.reset()
+
+
+def test_profile_report_view_sorts_by_tottime(monkeypatch):
+    monkeypatch.setattr("solapi_sms.settings.SOLAPI_PROFILE_SAMPLE_RATE", 1)
+    profiling.reset()
+    profiling.sampled("serialize")(_serialize)(100)
+    request = RequestFactory().get("/profiles/", {"method": "serialize", "sort": "tottime"})
+
+    request.user = types.SimpleNamespace(is_active=True, is_staff=True, is_superuser=False)
+    assert views.profile_report(request).status_code == 403
+
+    request.user.is_superuser = True
+    response = views.profile_report(request)
+    assert response.status_code == 200
+    text = response.content.decode()
+    assert "serialize: 1 samples" in text
+    assert "Ordered by: internal time" in text
+    profiling.reset()
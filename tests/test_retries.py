@@ -0,0 +1,120 @@
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from solapi_sms import campaigns
+from solapi_sms.models import SMSCampaign, SMSLog, SMSLogStatus
+from solapi_sms.retries import backoff_seconds, retry_due_sends
+from solapi_sms.services import SMSService
+
+
+@pytest.fixture
+def retries(monkeypatch):
+    monkeypatch.setattr("solapi_sms.settings.SOLAPI_RETRY_MAX_ATTEMPTS", 2)
+    monkeypatch.setattr("solapi_sms.settings.SOLAPI_RETRY_BACKOFF_SECONDS", 30)
+
+
+def test_backoff_grows_with_jitter(retries):
+    delays = [backoff_seconds(2) for _ in range(50)]
+    assert all(60 <= delay <= 120 for delay in delays)
+    assert len(set(delays)) > 1
+
+
+@pytest.mark.django_db
+def test_failed_send_is_retried_through_bulk_path(retries, monkeypatch):
+    def rejected(self, to, text, sender=None, timeout=None):
+        raise Exception("InvalidPhoneNumber", "rejected")
+
+    def unavailable(self, to, text, sender=None, timeout=None):
+        raise Exception("UnknownError", "503")
+
+    batches = []
+
+    def send_messages(self, messages, sender=None, timeout=None):
+        batches.append(messages)
+        return {"message_list": []}
+
+    service = SMSService(api_key="key", api_secret="secret", sender="0212345678")
+    monkeypatch.setattr(
+        "solapi_sms.settings.SOLAPI_RETRY_NON_RETRYABLE_CODES", ("InvalidPhoneNumber",)
+    )
+    monkeypatch.setattr("solapi_sms.client.SolapiClient.send_message", rejected)
+    service.send_sms("01012345678", "영구 실패")
+    monkeypatch.setattr("solapi_sms.client.SolapiClient.send_message", unavailable)
+    service.send_sms("01087654321", "일시 장애")
+
+    permanent = SMSLog.objects.get(message="영구 실패")
+    transient = SMSLog.objects.get(message="일시 장애")
+    assert permanent.next_retry_at is None
+    assert transient.next_retry_at is not None
+    assert transient.response_data["error_code"] == "UnknownError"
+
+    # Not due yet.
+    assert retry_due_sends(service=service) == 0
+
+    monkeypatch.setattr("solapi_sms.client.SolapiClient.send_messages", send_messages)
+    assert retry_due_sends(now=timezone.now() + timedelta(hours=1), service=service) == 1
+    assert batches == [[("01087654321", "일시 장애")]]
+    transient.refresh_from_db()
+    assert transient.status == SMSLogStatus.SUCCESS
+    assert transient.retry_count == 1
+    assert transient.next_retry_at is None
+    assert SMSLog.objects.count() == 2
+
+
+@pytest.mark.django_db
+def test_permanent_status_code_is_not_retried(retries, monkeypatch):
+    def send_messages(self, messages, sender=None, timeout=None):
+        return {
+            "message_list": [
+                {"custom_fields": {"index": "0"}, "status_code": "1020", "status_message": "x"},
+                {"custom_fields": {"index": "1"}, "status_code": "3050", "status_message": "y"},
+            ]
+        }
+
+    monkeypatch.setattr("solapi_sms.client.SolapiClient.send_messages", send_messages)
+    service = SMSService(api_key="key", api_secret="secret", sender="0212345678")
+    service.send_bulk(
+        [{"phone": "01012345678", "message": "영구"}, {"phone": "01087654321", "message": "일시"}]
+    )
+
+    assert SMSLog.objects.get(message="영구").next_retry_at is None
+    assert SMSLog.objects.get(message="일시").next_retry_at is not None
+
+
+@pytest.mark.django_db
+def test_retry_skips_missing_templates_and_updates_campaign(retries, monkeypatch):
+    batches = []
+
+    def send_messages(self, messages, sender=None, timeout=None):
+        batches.append(messages)
+        return {"message_list": []}
+
+    monkeypatch.setattr("solapi_sms.client.SolapiClient.send_messages", send_messages)
+    campaign = SMSCampaign.objects.create(name="공지", total=1)
+    campaigns.record(campaign.pk, failed=1)
+    due = timezone.now() - timedelta(minutes=1)
+    SMSLog.objects.create(
+        phone="01012345678",
+        message="공지",
+        status=SMSLogStatus.FAILED,
+        campaign=campaign,
+        next_retry_at=due,
+    )
+    orphan = SMSLog.objects.create(
+        phone="01087654321",
+        message="",
+        template_version="missing",
+        status=SMSLogStatus.FAILED,
+        next_retry_at=due,
+    )
+
+    service = SMSService(api_key="key", api_secret="secret", sender="0212345678")
+    assert retry_due_sends(service=service) == 2
+
+    assert batches == [[("01012345678", "공지")]]
+    orphan.refresh_from_db()
+    assert (orphan.status, orphan.next_retry_at) == (SMSLogStatus.FAILED, None)
+    stats = campaigns.progress(campaign)
+    assert (stats["sent"], stats["failed"]) == (1, 0)
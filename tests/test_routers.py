@@ -0,0 +1,39 @@
+import pytest
+from django.contrib.auth.models import Group
+
+from solapi_sms import routers
+from solapi_sms.models import SMSLog, SMSVerificationCode
+
+
+@pytest.fixture
+def sms_router(monkeypatch):
+    monkeypatch.setattr("solapi_sms.settings.SOLAPI_DATABASE", "sms")
+    monkeypatch.setattr("solapi_sms.settings.SOLAPI_REPLICA_DATABASE", "sms_replica")
+    monkeypatch.setattr(routers, "_last_write", routers.ContextVar("test_last_write", default=None))
+    return routers.SolapiSMSRouter()
+
+
+def test_router_sends_writes_to_primary_and_log_reads_to_replica(sms_router):
+    assert sms_router.db_for_read(SMSLog) == "sms_replica"
+    assert sms_router.db_for_read(SMSVerificationCode) == "sms"
+    assert sms_router.allow_migrate("default", "solapi_sms") is False
+    assert sms_router.allow_migrate("sms", "solapi_sms") is True
+    assert sms_router.allow_migrate("default", "auth") is None
+
+
+def test_router_reads_own_writes_from_primary(sms_router, monkeypatch):
+    monkeypatch.setattr("solapi_sms.settings.SOLAPI_VERIFICATION_READ_PRIMARY", False)
+    assert sms_router.db_for_read(SMSVerificationCode) == "sms_replica"
+
+    assert sms_router.db_for_write(SMSLog) == "sms"
+    assert sms_router.db_for_read(SMSLog) == "sms"
+    assert sms_router.db_for_read(SMSVerificationCode) == "sms"
+
+
+def test_router_migrates_swapped_models_to_sms_database(sms_router, settings):
+    settings.SOLAPI_SMS_LOG_MODEL = "auth.Group"
+    assert sms_router.allow_migrate("default", "auth", model_name="group") is False
+    assert sms_router.allow_migrate("sms", "auth", model_name="group") is True
+    assert sms_router.allow_migrate("sms", "auth", model=Group) is True
+    assert sms_router.allow_migrate("default", "auth", model_name="user") is None
+    assert sms_router.allow_migrate("default", "auth") is None
@@ -0,0 +1,123 @@
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from solapi_sms.models import SMSLog, SMSLogStatus, SMSScheduledMessage, SMSScheduledStatus
+from solapi_sms.scheduler import (
+    cancel_scheduled_sms,
+    dispatch_due_messages,
+    release_stale_claims,
+)
+from solapi_sms.services import SMSService
+from solapi_sms.tasks import enqueue_sms
+
+
+@pytest.mark.django_db
+def test_enqueue_sms_with_send_at_creates_scheduled_row():
+    send_at = timezone.now() + timedelta(hours=1)
+    scheduled = enqueue_sms("010-1234-5678", "예약 메시지", send_at=send_at)
+    assert isinstance(scheduled, SMSScheduledMessage)
+    assert scheduled.phone == "01012345678"
+    assert scheduled.status == SMSScheduledStatus.PENDING
+    assert SMSLog.objects.count() == 0
+
+
+@pytest.mark.django_db
+def test_dispatch_sends_only_due_messages(settings):
+    settings.DEBUG = True
+    now = timezone.now()
+    due = enqueue_sms("01012345678", "지금", send_at=now - timedelta(minutes=1))
+    later = enqueue_sms("01087654321", "나중", send_at=now + timedelta(hours=1))
+    canceled = enqueue_sms("01011112222", "취소", send_at=now - timedelta(minutes=1))
+    assert cancel_scheduled_sms(canceled.pk) is True
+
+    assert dispatch_due_messages() == 1
+    assert dispatch_due_messages() == 0
+
+    due.refresh_from_db()
+    later.refresh_from_db()
+    assert due.status == SMSScheduledStatus.SENT
+    assert later.status == SMSScheduledStatus.PENDING
+    assert SMSLog.objects.get().status == SMSLogStatus.SKIPPED
+
+
+@pytest.mark.django_db
+def test_send_bulk_maps_failed_messages_by_index(monkeypatch):
+    def fake_send_messages(self, messages, sender=None, timeout=None):
+        return {
+            "group_info": {"group_id": "G1"},
+            "failed_message_list": [
+                {"custom_fields": {"index": "1"}, "status_message": "수신거부"},
+            ],
+        }
+
+    monkeypatch.setattr("solapi_sms.client.SolapiClient.send_messages", fake_send_messages)
+    service = SMSService(api_key="key", api_secret="secret", sender="0212345678")
+    results = service.send_bulk(
+        [
+            {"phone": "01012345678", "message": "a"},
+            {"phone": "01087654321", "message": "b"},
+            {"phone": "", "message": "c"},
+        ]
+    )
+    assert results == [True, False, False]
+    statuses = dict(SMSLog.objects.values_list("phone", "status"))
+    assert statuses == {"01012345678": SMSLogStatus.SUCCESS, "01087654321": SMSLogStatus.FAILED}
+
+
+@pytest.mark.django_db
+def test_release_stale_claims_does_not_resend_logged_messages():
+    claimed_at = timezone.now() - timedelta(hours=1)
+    # Same phone and text: only the scheduled id stored on the log tells them apart.
+    sent, lost = (
+        SMSScheduledMessage.objects.create(
+            phone="01012345678",
+            message="예약",
+            send_at=claimed_at,
+            status=SMSScheduledStatus.PROCESSING,
+            claimed_at=claimed_at,
+        )
+        for _ in range(2)
+    )
+    SMSLog.objects.create(
+        phone=sent.phone,
+        message="예약",
+        status=SMSLogStatus.SUCCESS,
+        response_data={"scheduled_id": sent.pk},
+    )
+
+    assert release_stale_claims() == 1
+
+    sent.refresh_from_db()
+    lost.refresh_from_db()
+    assert sent.status == SMSScheduledStatus.SENT
+    assert (lost.status, lost.claimed_at) == (SMSScheduledStatus.PENDING, None)
+
+
+@pytest.mark.django_db
+def test_dispatch_links_logs_to_scheduled_rows(settings):
+    settings.DEBUG = True
+    due = enqueue_sms("01012345678", "지금", send_at=timezone.now() - timedelta(minutes=1))
+
+    dispatch_due_messages()
+
+    assert SMSLog.objects.get().response_data["scheduled_id"] == due.pk
+
+
+@pytest.mark.django_db
+def test_release_stale_claims_never_resends_when_sends_are_not_logged(monkeypatch):
+    monkeypatch.setattr("solapi_sms.settings.SOLAPI_LOG_ENABLED", False)
+    claimed_at = timezone.now() - timedelta(hours=1)
+    stale = SMSScheduledMessage.objects.create(
+        phone="01012345678",
+        message="예약",
+        send_at=claimed_at,
+        status=SMSScheduledStatus.PROCESSING,
+        claimed_at=claimed_at,
+    )
+
+    assert release_stale_claims() == 0
+
+    stale.refresh_from_db()
+    assert stale.status == SMSScheduledStatus.FAILED
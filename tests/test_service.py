@@ -1,7 +1,12 @@
+import httpx
 import pytest
+from django.core.cache import cache
 
-from solapi_sms.models import SMSLog, SMSLogStatus, SMSVerificationCode
+from solapi_sms import logbuffer
+from solapi_sms.exceptions import SolapiSMSTimeoutError
+from solapi_sms.models import SMSLog, SMSLogStatus, SMSTemplateVersion, SMSVerificationCode
 from solapi_sms.services import SMSService
+from solapi_sms.signals import sms_logs_flushed, sms_sent
 
 
 @pytest.mark.django_db
@@ -26,3 +31,144 @@ def test_verification_flow():
     assert verification.is_valid()
     assert service.verify_code("01012345678", "000000") is False
     assert service.verify_code("01012345678", "123456") is True
+
+
+@pytest.mark.django_db
+def test_new_verification_supersedes_previous():
+    service = SMSService()
+    old = service.create_verification("01012345678", code="111111")
+    new = service.create_verification("01012345678", code="222222")
+    old.refresh_from_db()
+    assert old.is_superseded
+    assert old.verified_at is None
+    assert not old.is_valid()
+    assert list(SMSVerificationCode.active("01012345678")) == [new]
+    assert service.verify_code("01012345678", "111111") is False
+    assert service.verify_code("01012345678", "222222") is True
+
+
+@pytest.mark.django_db
+def test_send_sms_timeout_logged_as_timeout(monkeypatch):
+    """타임아웃은 FAILED와 구분되어 TIMEOUT으로 기록되는지 테스트"""
+    timeouts = []
+
+    def fake_send_message(self, to, text, sender=None, timeout=None):
+        timeouts.append(timeout)
+        raise httpx.ReadTimeout("read timed out")
+
+    monkeypatch.setattr("solapi_sms.client.SolapiClient.send_message", fake_send_message)
+    service = SMSService(api_key="key", api_secret="secret", sender="0212345678")
+
+    with pytest.raises(SolapiSMSTimeoutError):
+        service.send_sms("01012345678", "테스트", raise_on_error=True, deadline=2)
+
+    assert 0 < timeouts[0] <= 2
+    log = SMSLog.objects.get()
+    assert log.status == SMSLogStatus.TIMEOUT
+
+
+@pytest.mark.django_db
+def test_send_sms_suppresses_duplicates(monkeypatch):
+    """중복 억제 윈도우 내 같은 메시지는 발송하지 않고 SKIPPED로 기록되는지 테스트"""
+    sent = []
+
+    def fake_send_message(self, to, text, sender=None, timeout=None):
+        sent.append(to)
+        return {"message_id": f"M{len(sent)}"}
+
+    monkeypatch.setattr("solapi_sms.client.SolapiClient.send_message", fake_send_message)
+    monkeypatch.setattr("solapi_sms.settings.SOLAPI_DEDUP_WINDOW_SECONDS", 10)
+    monkeypatch.setattr("solapi_sms.settings.SOLAPI_DEDUP_EXEMPT_MESSAGE_TYPES", ("VERIFICATION",))
+    cache.clear()
+    service = SMSService(api_key="key", api_secret="secret", sender="0212345678")
+
+    assert service.send_sms("01012345678", "중복") is True
+    # The suppressed call sent nothing, so it does not report success.
+    assert service.send_sms("010-1234-5678", "중복") is False
+    assert service.send_sms("01012345678", "인증", message_type="VERIFICATION") is True
+    assert service.send_sms("01012345678", "인증", message_type="VERIFICATION") is True
+
+    assert len(sent) == 3
+    skipped = SMSLog.objects.get(status=SMSLogStatus.SKIPPED)
+    assert skipped.response_data == {"skipped_reason": "duplicate"}
+
+
+@pytest.mark.django_db
+def test_send_templated_logs_template_reference(settings, monkeypatch):
+    """템플릿 참조 모드에서 본문 대신 템플릿 키/버전/파라미터가 기록되는지 테스트"""
+    settings.DEBUG = True
+    monkeypatch.setattr("solapi_sms.settings.SOLAPI_LOG_TEMPLATE_REFERENCES", True)
+    service = SMSService()
+
+    service.send_templated(
+        "01012345678", "analysis_complete", "GENERIC", report_url="https://a.b/1"
+    )
+    service.send_templated(
+        "01087654321", "analysis_complete", "GENERIC", report_url="https://a.b/2"
+    )
+    service.send_sms("01012345678", "일반 메시지")
+
+    templated = SMSLog.objects.filter(template_key="analysis_complete").order_by("id")
+    assert [log.message for log in templated] == ["", ""]
+    assert templated[0].template_params == {"app_name": "테스트", "report_url": "https://a.b/1"}
+    assert templated[1].rendered_message == "[테스트] 분석이 완료되었습니다.\nhttps://a.b/2"
+    assert SMSTemplateVersion.objects.count() == 1
+    assert SMSLog.objects.get(template_key="").rendered_message == "일반 메시지"
+
+
+@pytest.mark.django_db
+def test_write_behind_log_buffer(settings, monkeypatch):
+    """쓰기 지연 모드에서 로그가 버퍼에 쌓였다가 flush 시 저장되는지 테스트"""
+    settings.DEBUG = True
+    monkeypatch.setattr("solapi_sms.settings.SOLAPI_LOG_WRITE_BEHIND", True)
+    monkeypatch.setattr("solapi_sms.settings.SOLAPI_LOG_BUFFER_FLUSH_MS", 60000)
+    monkeypatch.setattr("solapi_sms.settings.SOLAPI_LOG_BUFFER_MAX_ROWS", 2)
+    sent_logs, flushed = [], []
+
+    def on_sent(log, **kwargs):
+        sent_logs.append(log)
+
+    def on_flushed(logs, **kwargs):
+        flushed.extend(logs)
+
+    sms_sent.connect(on_sent)
+    sms_logs_flushed.connect(on_flushed)
+    try:
+        service = SMSService()
+        for phone in ("01012345678", "01087654321", "01011112222"):
+            service.send_sms(phone, "테스트")
+        # The buffer holds two rows; the third was inserted directly.
+        assert sent_logs[0].pk is None
+        assert logbuffer.pending() == 2
+        assert SMSLog.objects.count() == 1
+
+        assert logbuffer.flush() == 2
+        assert SMSLog.objects.count() == 3
+        assert flushed == sent_logs[:2]
+        assert all(log.pk is not None for log in flushed)
+    finally:
+        sms_sent.disconnect(on_sent)
+        sms_logs_flushed.disconnect(on_flushed)
+        logbuffer.shutdown()
+
+
+@pytest.mark.django_db
+def test_log_buffer_isolates_rejected_rows(monkeypatch):
+    """배치 저장 실패 시 행 단위로 저장하고, 계속 거부되는 행은 정해진 횟수 후 버리는지 테스트"""
+    monkeypatch.setattr("solapi_sms.settings.SOLAPI_LOG_BUFFER_MAX_ATTEMPTS", 2)
+    buffer = logbuffer.LogBuffer(SMSLog)
+    saved = SMSLog.objects.create(
+        phone="01000000000", message="저장됨", status=SMSLogStatus.SUCCESS
+    )
+    good = SMSLog(phone="01012345678", message="정상", status=SMSLogStatus.SUCCESS)
+    bad = SMSLog(phone="01087654321", message="거부", status=None)
+    buffer.rows.extend([saved, good, bad])
+
+    # The rejected row stays queued for one more flush; the saved row is skipped.
+    assert buffer.flush() == 1
+    assert list(buffer.rows) == [bad]
+    assert SMSLog.objects.count() == 2
+
+    assert buffer.flush() == 0
+    assert not buffer.rows
+    assert SMSLog.objects.count() == 2
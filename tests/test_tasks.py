@@ -0,0 +1,424 @@
+import asyncio
+import contextlib
+import importlib
+import sys
+import threading
+import time
+import types
+
+import httpx
+import pytest
+from django.core.cache import cache
+from django.db import transaction
+
+from solapi_sms.exceptions import SolapiSMSQueueFullError
+from solapi_sms.models import SMSLog, SMSLogStatus, SMSVerificationCode
+from solapi_sms.services import SMSService
+from solapi_sms.tasks import backends, backpressure, enqueue_sms, enqueue_sms_many, lanes, spool
+from solapi_sms.tasks.backends import thread
+from solapi_sms.tasks.base import send_verification_code_func
+
+
+@pytest.fixture
+def thread_backend(monkeypatch):
+    monkeypatch.setattr("solapi_sms.settings.SOLAPI_THREAD_MAX_WORKERS", 1)
+    monkeypatch.setattr("solapi_sms.settings.SOLAPI_THREAD_QUEUE_SIZE", 1)
+    thread.shutdown()
+    yield thread
+    thread.shutdown()
+
+
+def test_thread_backend_returns_future(thread_backend, monkeypatch):
+    monkeypatch.setattr(
+        thread,
+        "send_sms_func",
+        lambda phone, message, message_type, spool=False: {"success": True, "phone": phone},
+    )
+    future = thread_backend.enqueue_sms("01012345678", "메시지")
+    assert future.result(timeout=5) == {"success": True, "phone": "01012345678"}
+
+
+def test_thread_backend_rejects_when_queue_full(thread_backend, monkeypatch):
+    release = threading.Event()
+
+    def blocking_send(phone, message, message_type, spool=False):
+        release.wait(timeout=5)
+        return {"success": True, "phone": phone}
+
+    monkeypatch.setattr(thread, "send_sms_func", blocking_send)
+    running = thread_backend.enqueue_sms("01012345678", "1")
+    queued = thread_backend.enqueue_sms("01012345678", "2")
+    with pytest.raises(SolapiSMSQueueFullError):
+        thread_backend.enqueue_sms("01012345678", "3")
+
+    release.set()
+    assert running.result(timeout=5)["success"] is True
+    assert queued.result(timeout=5)["success"] is True
+
+
+@pytest.fixture
+def asyncio_backend(monkeypatch):
+    from solapi_sms.tasks.backends import asyncio as asyncio_backend
+
+    async def fake_send(phone, message, message_type):
+        await asyncio.sleep(0)
+        return {"success": True, "phone": phone}
+
+    monkeypatch.setattr(asyncio_backend, "asend_sms_func", fake_send)
+    monkeypatch.setattr("solapi_sms.settings.SOLAPI_ASYNCIO_MAX_PENDING", 2)
+    yield asyncio_backend
+    asyncio_backend.shutdown(timeout=5)
+
+
+def test_asyncio_backend_schedules_on_running_loop(asyncio_backend):
+    async def main():
+        first = asyncio_backend.enqueue_sms("01012345678", "1")
+        second = asyncio_backend.enqueue_sms("01012345678", "2")
+        assert isinstance(first, asyncio.Task)
+        with pytest.raises(SolapiSMSQueueFullError):
+            asyncio_backend.enqueue_sms("01012345678", "3")
+        return await asyncio.gather(first, second)
+
+    results = asyncio.run(main())
+    assert [result["success"] for result in results] == [True, True]
+
+
+def test_asyncio_backend_uses_loop_thread_from_sync_code(asyncio_backend):
+    future = asyncio_backend.enqueue_sms("01012345678", "메시지")
+    assert future.result(timeout=5) == {"success": True, "phone": "01012345678"}
+
+
+@pytest.mark.django_db(transaction=True)
+def test_asend_sms_debug_skip_logs(settings):
+    settings.DEBUG = True
+    assert asyncio.run(SMSService().asend_sms("01012345678", "비동기")) is True
+    assert SMSLog.objects.get().status == SMSLogStatus.SKIPPED
+
+
+@pytest.mark.django_db
+def test_coalesce_publishes_one_batch_on_commit(
+    settings, monkeypatch, django_capture_on_commit_callbacks
+):
+    settings.DEBUG = True
+    monkeypatch.setattr("solapi_sms.settings.SOLAPI_COALESCE_ON_COMMIT", True)
+
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        assert enqueue_sms("01012345678", "첫번째") is None
+        assert enqueue_sms("01087654321", "두번째") is None
+        assert SMSLog.objects.count() == 0
+
+    assert len(callbacks) == 1
+    assert SMSLog.objects.count() == 2
+
+
+@pytest.mark.django_db
+def test_coalesce_drops_messages_on_rollback(
+    settings, monkeypatch, django_capture_on_commit_callbacks
+):
+    settings.DEBUG = True
+    monkeypatch.setattr("solapi_sms.settings.SOLAPI_COALESCE_ON_COMMIT", True)
+
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        enqueue_sms("01012345678", "유지")
+        with pytest.raises(RuntimeError), transaction.atomic():
+            enqueue_sms("01087654321", "롤백")
+            raise RuntimeError
+
+    assert len(callbacks) == 1
+    assert list(SMSLog.objects.values_list("message", flat=True)) == ["유지"]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_coalesce_starts_new_buffer_after_rolled_back_transaction(settings, monkeypatch):
+    settings.DEBUG = True
+    monkeypatch.setattr("solapi_sms.settings.SOLAPI_COALESCE_ON_COMMIT", True)
+
+    with pytest.raises(RuntimeError), transaction.atomic():
+        enqueue_sms("01087654321", "롤백")
+        raise RuntimeError
+    with transaction.atomic():
+        enqueue_sms("01012345678", "커밋")
+
+    assert list(SMSLog.objects.values_list("message", flat=True)) == ["커밋"]
+
+
+def test_enqueue_sms_many_publishes_one_task_per_chunk_and_lane(monkeypatch):
+    batches = []
+    monkeypatch.setattr(
+        "solapi_sms.tasks.backends.sync.send_sms_batch_func",
+        lambda messages: batches.append(messages) or {"success": True, "count": len(messages)},
+    )
+    messages = [
+        {"phone": f"0101234000{i}", "message": "공지", "message_type": "GENERIC"} for i in range(5)
+    ]
+    messages.append({"phone": "01087654321", "message": "인증", "message_type": "VERIFICATION"})
+
+    handles = enqueue_sms_many(messages, chunk_size=2)
+
+    assert [len(batch) for batch in batches] == [2, 2, 1, 1]
+    assert batches[-1][0]["message_type"] == "VERIFICATION"
+    assert handles == [{"success": True, "count": n} for n in (2, 2, 1, 1)]
+
+
+def test_lanes_keep_verification_out_of_bulk():
+    messages = [
+        {"phone": "01012345678", "message": "공지", "message_type": "GENERIC"},
+        {"phone": "01087654321", "message": "인증", "message_type": "VERIFICATION"},
+    ]
+    assert lanes.lane_for_message_type("VERIFICATION") == lanes.INTERACTIVE
+    assert lanes.lane_for_message_type("GENERIC") == lanes.DEFAULT
+    assert lanes.batch_lane(messages) == lanes.BULK
+    assert [lane for lane, _ in lanes.split_by_lane(messages)] == [
+        lanes.BULK,
+        lanes.INTERACTIVE,
+    ]
+
+
+def test_lane_rate_limit(monkeypatch):
+    monkeypatch.setattr("solapi_sms.settings.SOLAPI_TASK_LANES", {"bulk": {"rate_limit": 2}})
+    monkeypatch.setattr(lanes.time, "time", lambda: 1000.5)
+    cache.clear()
+    # The first reservation in a window is admitted even above the limit.
+    assert lanes.throttle(lanes.BULK, 5) == 0
+    assert lanes.throttle(lanes.BULK, 1) == 0.5
+    assert lanes.throttle(lanes.INTERACTIVE, 100) == 0
+
+
+@pytest.mark.django_db
+def test_backpressure_sheds_unprotected_lanes(monkeypatch):
+    busy = types.SimpleNamespace(__name__="busy_backend", backlog=lambda lane: 50)
+    monkeypatch.setattr("solapi_sms.settings.SOLAPI_BACKLOG_HIGH_WATER_MARK", 10)
+    monkeypatch.setattr("solapi_sms.settings.SOLAPI_BACKLOG_CHECK_INTERVAL_SECONDS", 0)
+
+    with pytest.raises(SolapiSMSQueueFullError):
+        backpressure.admit(busy, lanes.DEFAULT)
+    assert backpressure.admit(busy, lanes.INTERACTIVE) is True
+
+    monkeypatch.setattr("solapi_sms.settings.SOLAPI_BACKLOG_OVERFLOW_ACTION", "shed")
+    assert backpressure.admit(busy, lanes.DEFAULT, "01012345678", "공지") is False
+    log = SMSLog.objects.get()
+    assert log.status == SMSLogStatus.SKIPPED
+    assert log.response_data["skipped_reason"] == "shed"
+
+
+@pytest.mark.django_db
+def test_stale_verification_send_is_dropped():
+    enqueued_at = time.time() - 3600
+    result = send_verification_code_func("01012345678", enqueued_at)
+    assert result["stale"] is True
+    assert not SMSVerificationCode.objects.exists()
+
+
+@pytest.mark.django_db
+def test_spool_keeps_sends_until_solapi_recovers(tmp_path, monkeypatch):
+    monkeypatch.setattr("solapi_sms.settings.SOLAPI_SPOOL_PATH", tmp_path / "spool.sqlite3")
+    monkeypatch.setattr("solapi_sms.services.SOLAPI_API_KEY", "key")
+    monkeypatch.setattr("solapi_sms.services.SOLAPI_API_SECRET", "secret")
+    monkeypatch.setattr("solapi_sms.services.SOLAPI_SENDER_PHONE", "0212345678")
+    sent = []
+
+    def unreachable(self, to, text, sender=None, timeout=None):
+        raise httpx.ConnectError("connection refused")
+
+    monkeypatch.setattr("solapi_sms.client.SolapiClient.send_message", unreachable)
+    assert enqueue_sms("01012345678", "첫번째")["success"] is False
+    assert enqueue_sms("01087654321", "두번째")["success"] is False
+    assert spool.spool_size() == 2
+    # Still down: the drain stops at the first failure and keeps everything.
+    assert spool.drain_spool() == 0
+    assert spool.spool_size() == 2
+
+    def recovered(self, to, text, sender=None, timeout=None):
+        sent.append(text)
+        return {"message_id": f"M{len(sent)}"}
+
+    monkeypatch.setattr("solapi_sms.client.SolapiClient.send_message", recovered)
+    assert spool.drain_spool() == 2
+    assert sent == ["첫번째", "두번째"]
+    assert spool.spool_size() == 0
+    assert SMSLog.objects.filter(status=SMSLogStatus.SUCCESS).count() == 2
+    assert SMSLog.objects.filter(response_data__spooled=True).count() == 2
+    spool.close()
+
+
+@pytest.mark.django_db
+def test_spool_keeps_verification_until_solapi_recovers(tmp_path, monkeypatch):
+    monkeypatch.setattr("solapi_sms.settings.SOLAPI_SPOOL_PATH", tmp_path / "spool.sqlite3")
+    monkeypatch.setattr("solapi_sms.services.SOLAPI_API_KEY", "key")
+    monkeypatch.setattr("solapi_sms.services.SOLAPI_API_SECRET", "secret")
+    monkeypatch.setattr("solapi_sms.services.SOLAPI_SENDER_PHONE", "0212345678")
+
+    def unreachable(self, to, text, sender=None, timeout=None):
+        raise httpx.ConnectError("connection refused")
+
+    monkeypatch.setattr("solapi_sms.client.SolapiClient.send_message", unreachable)
+    assert spool.spool("01012345678", kind=spool.VERIFICATION) is True
+    assert spool.drain_spool() == 0
+    assert spool.spool_size() == 1
+    spool.close()
+
+
+@pytest.mark.django_db
+def test_spool_never_replays_a_send_that_failed_after_reaching_solapi(tmp_path, monkeypatch):
+    monkeypatch.setattr("solapi_sms.settings.SOLAPI_SPOOL_PATH", tmp_path / "spool.sqlite3")
+    monkeypatch.setattr("solapi_sms.settings.SOLAPI_SPOOL_MAX_ATTEMPTS", 2)
+    monkeypatch.setattr("solapi_sms.services.SOLAPI_API_KEY", "key")
+    monkeypatch.setattr("solapi_sms.services.SOLAPI_API_SECRET", "secret")
+    monkeypatch.setattr("solapi_sms.services.SOLAPI_SENDER_PHONE", "0212345678")
+    sent = []
+
+    def accepted(self, to, text, sender=None, timeout=None):
+        sent.append(to)
+        return {"message_id": f"M{len(sent)}"}
+
+    def database_down(self, *args, **kwargs):
+        raise RuntimeError("database down")
+
+    monkeypatch.setattr("solapi_sms.client.SolapiClient.send_message", accepted)
+    monkeypatch.setattr(SMSService, "_log_result", database_down)
+    monkeypatch.setattr(SMSService, "create_verification", database_down)
+    spool.spool("01012345678", "공지")
+    spool.spool("01087654321", kind=spool.VERIFICATION)
+
+    # The SMS reached SOLAPI before logging failed; the verification was never sent.
+    assert spool.drain_spool() == 1
+    assert sent == ["01012345678"]
+    assert spool.spool_size() == 1
+    # The verification is dropped once it has used SOLAPI_SPOOL_MAX_ATTEMPTS claims.
+    assert spool.drain_spool() == 1
+    assert sent == ["01012345678"]
+    assert spool.spool_size() == 0
+    spool.close()
+
+
+def test_spool_publishes_each_row_once_after_partial_failure(tmp_path, monkeypatch):
+    monkeypatch.setattr("solapi_sms.settings.SOLAPI_SPOOL_PATH", tmp_path / "spool.sqlite3")
+    published = []
+    broker = types.ModuleType("solapi_sms.tasks.backends.celery")
+    broker.enqueue_sms_batch = published.append
+
+    def broker_down(phone):
+        raise ConnectionError("broker down")
+
+    broker.enqueue_verification_code = broker_down
+    monkeypatch.setattr("solapi_sms.tasks._get_backend_module", lambda: broker)
+    spool.spool("01012345678", "공지")
+    spool.spool("01087654321", kind=spool.VERIFICATION)
+
+    assert spool.drain_spool() == 1
+    assert spool.spool_size() == 1
+
+    broker.enqueue_verification_code = published.append
+    assert spool.drain_spool() == 1
+    assert published == [
+        [{"phone": "01012345678", "message": "공지", "message_type": "GENERIC"}],
+        "01087654321",
+    ]
+    assert spool.spool_size() == 0
+    spool.close()
+
+
+class _Broker:
+    """Records published batches; fails the ``fail_at``-th publish."""
+
+    def __init__(self, fail_at=None):
+        self.batches = []
+        self.fail_at = fail_at
+
+    def publish(self, messages):
+        if len(self.batches) + 1 == self.fail_at:
+            raise ConnectionError("broker down")
+        self.batches.append(messages)
+        return f"R{len(self.batches)}"
+
+
+def _stub_celery(broker):
+    class Task:
+        def __init__(self, func):
+            self.func = func
+
+        def apply_async(self, args=None, kwargs=None, producer=None, **options):
+            assert producer == "producer"
+            return broker.publish(args[0])
+
+    def shared_task(*args, **options):
+        if args and callable(args[0]):
+            return Task(args[0])
+        return Task
+
+    module = types.ModuleType("celery")
+    module.shared_task = shared_task
+    module.current_task = None
+    module.current_app = types.SimpleNamespace(
+        producer_or_acquire=lambda: contextlib.nullcontext("producer")
+    )
+    return module
+
+
+def _stub_django_tasks(broker):
+    class Task:
+        def __init__(self, func):
+            self.func = func
+
+        def using(self, **options):
+            return self
+
+        def enqueue(self, messages, trace_context=None):
+            return broker.publish(messages)
+
+    module = types.ModuleType("django.tasks")
+    module.task = Task
+    return module
+
+
+@pytest.fixture(params=[("celery", _stub_celery), ("django6", _stub_django_tasks)])
+def broker_backend(request, monkeypatch, tmp_path):
+    name, stub = request.param
+    broker = _Broker()
+    backend = importlib.import_module(f"solapi_sms.tasks.backends.{name}")
+    with monkeypatch.context() as patch:
+        patch.setitem(sys.modules, "django.tasks" if name == "django6" else "celery", stub(broker))
+        patch.setattr("solapi_sms.settings.SOLAPI_SPOOL_PATH", tmp_path / "spool.sqlite3")
+        patch.setattr(backends, name, importlib.reload(backend))
+        patch.setattr("solapi_sms.tasks._get_backend_module", lambda: getattr(backends, name))
+        yield broker
+        spool.close()
+    importlib.reload(backend)
+
+
+def test_enqueue_sms_many_publishes_chunks_through_broker(broker_backend):
+    messages = [{"phone": f"0101234000{i}", "message": "공지"} for i in range(5)]
+
+    assert enqueue_sms_many(messages, chunk_size=2) == ["R1", "R2", "R3"]
+    assert [len(batch) for batch in broker_backend.batches] == [2, 2, 1]
+
+
+def test_enqueue_sms_many_spools_only_unpublished_chunks(broker_backend):
+    broker_backend.fail_at = 2
+    messages = [{"phone": f"0101234000{i}", "message": "공지"} for i in range(5)]
+
+    assert enqueue_sms_many(messages, chunk_size=2) == ["R1"]
+    assert broker_backend.batches == [messages[:2]]
+    assert spool.spool_size() == 3
+
+
+def test_asend_sms_batch_func_uses_the_bulk_path(monkeypatch):
+    from solapi_sms.tasks.base import asend_sms_batch_func
+
+    batches = []
+
+    def fake_send_bulk(self, messages):
+        batches.append(list(messages))
+        return [True] * len(messages)
+
+    async def unexpected_send(*args, **kwargs):
+        raise AssertionError("asend_sms per message")
+
+    monkeypatch.setattr(SMSService, "send_bulk", fake_send_bulk)
+    monkeypatch.setattr(SMSService, "asend_sms", unexpected_send)
+    messages = [{"phone": f"0101234567{i}", "message": "배치"} for i in range(3)]
+
+    result = asyncio.run(asend_sms_batch_func(messages))
+
+    assert result == {"success": True, "sent": 3, "failed": 0}
+    assert batches == [messages]
@@ -0,0 +1,63 @@
+import pytest
+
+from solapi_sms import tracing
+from solapi_sms.signals import sms_sent
+from solapi_sms.tasks import enqueue_sms
+
+
+@pytest.fixture
+def memory_tracing(monkeypatch):
+    monkeypatch.setattr("solapi_sms.settings.SOLAPI_TRACING", "memory")
+    tracing.clear()
+    yield
+    tracing.clear()
+
+
+@pytest.mark.django_db
+def test_enqueue_spans_nest_down_to_solapi_call(memory_tracing, monkeypatch):
+    monkeypatch.setattr("solapi_sms.services.SOLAPI_API_KEY", "key")
+    monkeypatch.setattr("solapi_sms.services.SOLAPI_API_SECRET", "secret")
+    monkeypatch.setattr("solapi_sms.services.SOLAPI_SENDER_PHONE", "0212345678")
+    monkeypatch.setattr("solapi_sms.client.SolapiClient._post", lambda self, request, timeout: {})
+
+    def receiver(**kwargs):
+        pass
+
+    sms_sent.connect(receiver)
+    try:
+        enqueue_sms("01012345678", "안녕하세요")
+    finally:
+        sms_sent.disconnect(receiver)
+
+    spans = {span.name: span for span in tracing.finished_spans()}
+    enqueue = spans["solapi_sms.enqueue_sms"]
+    task = spans["solapi_sms.task.send_sms"]
+    assert enqueue.parent_id is None
+    assert enqueue.attributes == {"message_type": "GENERIC", "backend": "sync"}
+    assert task.parent_id == enqueue.span_id
+    for name in (
+        "solapi_sms.solapi.send_message",
+        "solapi_sms.log_result",
+        "solapi_sms.signal.sms_sent",
+    ):
+        assert spans[name].parent_id == task.span_id
+        assert spans[name].trace_id == enqueue.trace_id
+    assert all(span.status == "OK" for span in spans.values())
+
+
+def test_trace_context_crosses_process_boundary(memory_tracing):
+    with tracing.span("producer") as producer:
+        headers = tracing.inject()
+    assert headers == {"traceparent": f"00-{producer.trace_id}-{producer.span_id}-01"}
+
+    with tracing.attach(headers), tracing.span("consumer") as consumer:
+        pass
+    assert consumer.trace_id == producer.trace_id
+    assert consumer.parent_id == producer.span_id
+
+
+def test_tracing_off_is_noop(monkeypatch):
+    monkeypatch.setattr("solapi_sms.settings.SOLAPI_TRACING", None)
+    with tracing.span("ignored") as span:
+        assert span is None
+    assert tracing.inject() == {}